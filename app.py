@@ -1,8 +1,8 @@
 import streamlit as st
 import json
 import os
-from ocelgen.xes_generator import generate_xes_log
-from ocelgen.xes_to_ocel_converter import convert_xes_to_ocel
+from ocelgen.pipeline import run_pipeline
+from ocelgen.plan import compile_plan, format_plan, validate_config
 
 def round_floats(obj, precision=4):
     if isinstance(obj, dict):
@@ -13,6 +13,11 @@ def round_floats(obj, precision=4):
         return [round_floats(i, precision) for i in obj]
     return obj
 
+@st.cache_data(show_spinner="Estimating log size...")
+def estimate_plan(config_json):
+    # Keyed on the serialized config, so reruns with unchanged parameters skip the pilot
+    return format_plan(compile_plan(json.loads(config_json), pilot_traces=50))
+
 st.set_page_config(page_title="OCEL-Gen", layout="wide")
 st.title("Generating OCEL logs using OCEL-Gen")
 
@@ -104,17 +109,31 @@ config = {
 
 st.divider()
 
+# === Estimating log size and runtime ===
+st.subheader("Estimated log")
+config_errors = validate_config(config)
+for error in config_errors:
+    st.error(error)
+if not config_errors:
+    st.text("\n".join(estimate_plan(json.dumps(config, sort_keys=True))))
+
 # === Generateing ocel log ===
 if st.button(" Generate OCEL Log"):
     with st.spinner("Generating logs..."):
-        os.makedirs("generated_logs/xes", exist_ok=True)
         os.makedirs("generated_logs/ocel", exist_ok=True)
 
-        generate_xes_log(config)
-        convert_xes_to_ocel(config)
+        reports = run_pipeline(config)
 
     st.success(" Logs generated successfully!")
 
+    st.subheader("Where the time went")
+    st.table([
+        {"phase": phase, "span": name, "seconds": round(seconds, 4)}
+        for phase, report in reports.items()
+        for name, seconds in report["spans"].items()
+    ])
+    st.json({phase: report["counters"] for phase, report in reports.items()})
+
 
     with open(config["output_ocel_path"], "rb") as f:
         st.download_button("Download OCEL Log (.jsonocel)", f, file_name="log.jsonocel")
@@ -1,7 +1,9 @@
+import argparse
 import json
 import sys
-from ocelgen.xes_generator import generate_xes_log
-from ocelgen.xes_to_ocel_converter import convert_xes_to_ocel
+from ocelgen.ocel_writer import redirect_progress
+from ocelgen.pipeline import run_pipeline
+from ocelgen.plan import compile_plan, format_plan
 
 
 def load_config(config_path="config.json"):
@@ -13,8 +15,9 @@ def load_config(config_path="config.json"):
     try:
         with open(config_path, "r") as f:
             config = json.load(f)
+        with redirect_progress(config):
             print(f"[INFO] Loaded config from: {config_path}")
-            return config
+        return config
     except FileNotFoundError:
         print(f"[ERROR] Config file not found: {config_path}")
     except json.JSONDecodeError as e:
@@ -26,14 +29,38 @@ def load_config(config_path="config.json"):
 
 
 if __name__ == "__main__":
-    # You can override the path, if needed
-    config_file = "config.json" 
-    config = load_config(config_file)
+    parser = argparse.ArgumentParser(description="Generate a synthetic OCEL log.")
+    parser.add_argument("--config", default="config.json", help="Path to the JSON config file")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Convert traces in N processes (trace-sharded; identical output for any N, "
+                             "but different from the default single-process conversion)")
+    parser.add_argument("--target-size", type=int, default=None,
+                        help="Generate traces until the log reaches this size instead of num_traces (native engine)")
+    parser.add_argument("--target-unit", choices=["events", "objects", "bytes"], default=None,
+                        help="Unit of --target-size (default: events)")
+    parser.add_argument("--plan", action="store_true",
+                        help="Validate the config and print the estimated log size and runtime instead of generating")
+    args = parser.parse_args()
 
-    print("[PHASE 1] Generating synthetic XES log...")
-    generate_xes_log(config)
+    config = load_config(args.config)
+    if args.jobs is not None:
+        config["jobs"] = args.jobs
+    if args.target_size is not None:
+        config["target_size"] = args.target_size
+    if args.target_unit is not None:
+        config["target_unit"] = args.target_unit
 
-    print("[PHASE 2] Converting XES log to OCEL format...")
-    convert_xes_to_ocel(config)
+    if args.plan:
+        try:
+            plan = compile_plan(config)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+        for line in format_plan(plan):
+            print(f"[PLAN] {line}")
+        sys.exit(0)
 
-    print("[DONE] All tasks completed successfully.")
+    with redirect_progress(config):
+        run_pipeline(config)
+
+        print("[DONE] All tasks completed successfully.")
@@ -0,0 +1,238 @@
+import bisect
+import hashlib
+import math
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from statistics import NormalDist
+from ocelgen.sampling import legacy_triangular_int_quantile, triangular_quantile
+
+ATTRIBUTE_TYPES = ("int", "float", "categorical", "timestamp")
+DISTRIBUTIONS = ("uniform", "normal", "lognormal", "exponential")
+LEGACY_VALUES = 999  # untyped attributes take the values `<prefix>_val1` .. `<prefix>_val999`
+ATTRIBUTE_VALUES = ("sampled", "hashed", "lazy")
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+class AttributeEngine:
+    """
+    Generates the synthetic attributes of one entity kind ("event" or "object").
+
+    Every attribute key has a value vocabulary that is built once, so an
+    entity costs one index draw per attribute and its dict shares the key
+    and value objects with every other entity instead of holding freshly
+    formatted strings. Indices come from the trace's sampler; with
+    `"sampling_mode": "numpy"` they are drawn in vectorized blocks.
+
+    Without a schema, an entity gets `n` untyped attributes
+    `<prefix>_attr1 .. <prefix>_attrn` (n drawn from the
+    `<prefix>_attributes_min/mode/max` triangle) with values
+    `<prefix>_val<1..999>`, exactly as the original generator produced them.
+
+    A schema (`<prefix>_attribute_schema`) lists typed attributes that
+    every entity carries, e.g.::
+
+        {"name": "amount", "type": "float", "distribution": "lognormal", "mean": 3, "sigma": 1, "round": 2}
+        {"name": "quantity", "type": "int", "low": 1, "high": 20}
+        {"name": "priority", "type": "categorical", "values": ["low", "high"], "weights": [3, 1]}
+        {"name": "due", "type": "timestamp", "start": "2025-01-01T00:00:00", "end": "2025-12-31T00:00:00"}
+
+    Numeric and timestamp vocabularies hold the `attribute_vocabulary_size` (default 1024) quantiles
+    of their distribution ("uniform" with `low`/`high`, "normal" with
+    `mean`/`std`, "lognormal" with `mean`/`sigma` of the log, "exponential"
+    with `mean`), so a uniform index draw follows the distribution.
+    Integer attributes whose range fits the vocabulary use the range itself.
+
+    `quantile` is the configured triangular inverse CDF
+    (`ocelgen.sampling.triangular_quantile`), used by the `HashSampler`s
+    of hashed and lazy attribute values.
+    """
+
+    def __init__(self, prefix, params):
+        self.prefix = prefix
+        self.quantile = triangular_quantile(params)
+        self.count = (
+            params.get(f"{prefix}_attributes_min", 0),
+            params.get(f"{prefix}_attributes_mode", 0),
+            params.get(f"{prefix}_attributes_max", 0),
+        )
+        schema = params.get(f"{prefix}_attribute_schema")
+        size = params.get("attribute_vocabulary_size", 1024)
+        if schema:
+            self.keys = [spec["name"] for spec in schema]
+            self.vocabularies = [_vocabulary(spec, size) for spec in schema]
+            self.weights = [_cumulative_weights(spec) for spec in schema]
+        else:
+            self.keys = [f"{prefix}_attr{i+1}" for i in range(max(self.count[2], 0))]
+            self.vocabularies = None
+            self.legacy_values = [f"{prefix}_val{v}" for v in range(LEGACY_VALUES + 1)]
+
+    def draw(self, sampler):
+        """The attribute dict of one entity."""
+        if self.vocabularies is None:
+            values = self.legacy_values
+            n = sampler.triangular_int(*self.count)
+            keys = self.keys if n <= len(self.keys) else self._extend_keys(n)
+            return {keys[i]: values[sampler.randint(1, LEGACY_VALUES)] for i in range(n)}
+
+        attributes = {}
+        for key, vocabulary, weights in zip(self.keys, self.vocabularies, self.weights):
+            if weights is None:
+                attributes[key] = vocabulary[sampler.randint(0, len(vocabulary) - 1)]
+            else:
+                attributes[key] = vocabulary[bisect.bisect_right(weights, sampler.random() * weights[-1])]
+        return attributes
+
+    def _extend_keys(self, n):
+        # Degenerate triangles can exceed the configured maximum
+        self.keys.extend(f"{self.prefix}_attr{i+1}" for i in range(len(self.keys), n))
+        return self.keys
+
+
+def _cumulative_weights(spec):
+    """Cumulative weights of a weighted categorical attribute, or None for uniform draws."""
+    if spec["type"] != "categorical" or "weights" not in spec:
+        return None
+    if len(spec["weights"]) != len(spec["values"]):
+        raise ValueError(f"Attribute '{spec['name']}': 'weights' and 'values' differ in length")
+    total, cumulative = 0.0, []
+    for weight in spec["weights"]:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+
+def _vocabulary(spec, size):
+    """The value vocabulary of a typed attribute, in index order."""
+    kind = spec.get("type")
+    if kind not in ATTRIBUTE_TYPES:
+        raise ValueError(f"Attribute '{spec.get('name')}': unknown type '{kind}', expected one of {list(ATTRIBUTE_TYPES)}")
+    if kind == "categorical":
+        return list(spec["values"])
+
+    if kind == "timestamp":
+        start = datetime.fromisoformat(spec["start"])
+        span = (datetime.fromisoformat(spec["end"]) - start).total_seconds()
+        spec = {"distribution": "uniform", "low": 0.0, "high": span, **spec}
+        return [(start + timedelta(seconds=round(q))).isoformat() for q in _quantiles(spec, size)]
+
+    if kind == "int" and spec.get("distribution", "uniform") == "uniform" and spec["high"] - spec["low"] < size:
+        return list(range(spec["low"], spec["high"] + 1))
+    quantiles = _quantiles(spec, size)
+    if kind == "int":
+        return [int(round(q)) for q in quantiles]
+    digits = spec.get("round")
+    return [round(q, digits) for q in quantiles] if digits is not None else quantiles
+
+
+def _quantiles(spec, size):
+    """The quantiles at (i + 0.5) / size, i < size, of the attribute's distribution."""
+    distribution = spec.get("distribution", "uniform")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Attribute '{spec['name']}': unknown distribution '{distribution}', "
+                         f"expected one of {list(DISTRIBUTIONS)}")
+    probabilities = [(i + 0.5) / size for i in range(size)]
+    if distribution == "uniform":
+        low, high = spec["low"], spec["high"]
+        return [low + p * (high - low) for p in probabilities]
+    if distribution == "exponential":
+        return [-spec["mean"] * math.log1p(-p) for p in probabilities]
+    if distribution == "normal":
+        normal = NormalDist(spec["mean"], spec["std"])
+        return [normal.inv_cdf(p) for p in probabilities]
+    normal = NormalDist(spec["mean"], spec["sigma"])
+    return [math.exp(normal.inv_cdf(p)) for p in probabilities]
+
+
+class HashSampler:
+    """
+    Sampler over the fixed uniform sequence `hash(key, 1), hash(key, 2), ...`.
+
+    Implements the draws `AttributeEngine.draw` uses, so the attributes of
+    an entity become a pure function of its key. Triangular draws map one
+    uniform through `quantile`, the same inverse CDF the other samplers use
+    for the configured `triangular_parameterization`.
+    """
+
+    __slots__ = ("key", "counter", "quantile")
+
+    def __init__(self, key, quantile=legacy_triangular_int_quantile):
+        self.key = key
+        self.counter = 0
+        self.quantile = quantile
+
+    def random(self):
+        self.counter += 1
+        x = (self.key + self.counter * _GOLDEN_GAMMA) & _MASK64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return ((x ^ (x >> 31)) >> 11) * (1.0 / (1 << 53))
+
+    def triangular_int(self, low, mode, high):
+        return self.quantile(self.random(), low, mode, high)
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+
+class HashedAttributes:
+    """
+    Derives entity attributes from `(seed, entity kind, entity id)` instead of the trace's sampler.
+
+    Used by `"attribute_values": "hashed"` (dicts built when the entity is
+    emitted) and `"lazy"` (`LazyAttributes` placeholders, materialized by
+    `write_ocel` right before the writer serializes the entity). Both give
+    the same values, independent of conversion order or process.
+    """
+
+    def __init__(self, seed, event_engine, object_engine, lazy=False):
+        self.seed = seed.to_bytes(8, "little", signed=True)
+        self.event_engine = event_engine
+        self.object_engine = object_engine
+        self.lazy = lazy
+
+    def _key(self, engine, entity_id):
+        data = f"{engine.prefix}:{entity_id}".encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8, key=self.seed).digest(), "little")
+
+    def object(self, object_id):
+        """The `ocel:ovmap` of an object."""
+        key = self._key(self.object_engine, object_id)
+        if self.lazy:
+            return LazyAttributes(self.object_engine, key)
+        return self.object_engine.draw(HashSampler(key, self.object_engine.quantile))
+
+    def event(self, event_id, base):
+        """The `ocel:vmap` of an event: its original attributes `base` plus the synthetic ones."""
+        key = self._key(self.event_engine, event_id)
+        if self.lazy:
+            return LazyAttributes(self.event_engine, key, base)
+        base.update(self.event_engine.draw(HashSampler(key, self.event_engine.quantile)))
+        return base
+
+
+class LazyAttributes(Mapping):
+    """Read-only attribute mapping whose values are only computed when read (see `HashedAttributes`)."""
+
+    __slots__ = ("engine", "key", "base")
+
+    def __init__(self, engine, key, base=None):
+        self.engine = engine
+        self.key = key
+        self.base = base or None
+
+    def materialize(self):
+        """The attributes as a plain dict."""
+        values = dict(self.base) if self.base else {}
+        values.update(self.engine.draw(HashSampler(self.key, self.engine.quantile)))
+        return values
+
+    def __getitem__(self, name):
+        return self.materialize()[name]
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.materialize())
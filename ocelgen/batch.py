@@ -0,0 +1,128 @@
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import multiprocessing
+import os
+import time
+from ocelgen.pipeline import run_pipeline
+
+SUMMARY_FIELDS = ["log_id", "config", "status", "xes_runtime_sec", "ocel_runtime_sec", "total_runtime_sec", "error"]
+
+
+def load_configs(sources):
+    """
+    Resolve config sources into `(name, config)` pairs.
+
+    Args:
+        sources (list): Config dicts, JSON file paths, directories (all
+            `*.json` inside) or glob patterns such as `configs/log_*.json`.
+    """
+    items = []
+    for source in sources:
+        if isinstance(source, dict):
+            items.append((source.get("output_ocel_path", f"config_{len(items) + 1}"), source))
+            continue
+        if os.path.isdir(source):
+            paths = sorted(glob.glob(os.path.join(source, "*.json")))
+        elif glob.has_magic(source):
+            paths = sorted(glob.glob(source))
+        else:
+            paths = [source]
+        for path in paths:
+            with open(path, "r") as f:
+                items.append((path, json.load(f)))
+    return items
+
+
+def _run_one(task):
+    """Generate one log; never raises, failures are reported in the summary row."""
+    name, config, quiet = task
+    log_id = os.path.splitext(os.path.basename(config.get("output_ocel_path", name)))[0]
+    row = {"log_id": log_id, "config": name, "status": "ok", "error": ""}
+    t1 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            reports = run_pipeline(config)
+        row["xes_runtime_sec"] = round(reports["xes"]["runtime_sec"], 4)
+        row["ocel_runtime_sec"] = round(reports["ocel"]["runtime_sec"], 4)
+    except Exception as e:
+        row["status"] = "failed"
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["total_runtime_sec"] = round(time.perf_counter() - t1, 4)
+    return row
+
+
+def run_batch(sources, jobs=1, summary_path=None, quiet=True):
+    """
+    Generate many logs in one warm process or a pool of worker processes.
+
+    PM4Py is imported once per process instead of once per log, and every
+    config is passed around in memory, so no shared `config.json` is needed.
+    Each log is generated with `ocelgen.pipeline.run_pipeline`, so
+    `target_size` configs are generated up to their target.
+
+    Args:
+        sources (list): See `load_configs`.
+        jobs (int): Number of worker processes; 1 runs everything in-process.
+        summary_path (str, optional): CSV receiving one row per log with
+            status, error and per-phase runtimes.
+        quiet (bool): Suppress the per-log progress output of the generator.
+
+    Returns:
+        list: The summary rows, in input order.
+    """
+    items = load_configs(sources)
+    tasks = []
+    for name, config in items:
+        if jobs > 1 and config.get("jobs"):
+            # Pool workers cannot start their own pool; any N >= 1 gives the same log
+            config = dict(config, jobs=1)
+        tasks.append((name, config, quiet))
+
+    print(f"[INFO] Generating {len(tasks)} log(s) with {jobs} job(s)...")
+    rows = []
+    if jobs > 1:
+        with multiprocessing.Pool(jobs) as pool:
+            for row in pool.imap(_run_one, tasks):
+                _report(row)
+                rows.append(row)
+    else:
+        for task in tasks:
+            row = _run_one(task)
+            _report(row)
+            rows.append(row)
+
+    if summary_path:
+        summary_dir = os.path.dirname(summary_path)
+        if summary_dir:
+            os.makedirs(summary_dir, exist_ok=True)
+        with open(summary_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[DONE] Batch summary saved to: {summary_path}")
+
+    failed = sum(row["status"] != "ok" for row in rows)
+    print(f"[STATS] Logs: {len(rows)}, failed: {failed}")
+    return rows
+
+
+def _report(row):
+    if row["status"] == "ok":
+        print(f"[DONE] {row['log_id']}: XES={row['xes_runtime_sec']}s, OCEL={row['ocel_runtime_sec']}s")
+    else:
+        print(f"[ERROR] {row['log_id']} failed: {row['error']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate OCEL logs for many configs in one process.")
+    parser.add_argument("sources", nargs="+", help="Config files, directories or glob patterns")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--summary", default="batch_summary.csv", help="Path of the summary CSV")
+    parser.add_argument("--verbose", action="store_true", help="Show the generator output of every log")
+    args = parser.parse_args()
+
+    run_batch(args.sources, jobs=args.jobs, summary_path=args.summary, quiet=not args.verbose)
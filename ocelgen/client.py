@@ -0,0 +1,129 @@
+import argparse
+import http.client
+import json
+import os
+import socket
+import sys
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+PATH_KEYS = ("xes_log_path", "output_ocel_path", "instrumentation_path", "tree_cache_dir", "plan_calibration_path")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class OcelgenClient:
+    """
+    Thin client of an `ocelgen.server`, in place of running `main.py` per log.
+
+    Imports only the standard library, so it starts instantly; PM4Py is
+    only loaded by the server's workers.
+
+    Args:
+        url (str): Server address, e.g. `http://127.0.0.1:8765`.
+        socket_path (str, optional): Unix socket of the server; overrides `url`.
+        timeout (float, optional): Seconds to wait for a response (default: no limit).
+    """
+
+    def __init__(self, url=DEFAULT_URL, socket_path=None, timeout=None):
+        self.url = urlsplit(url)
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _request(self, method, path, body=None):
+        if self.socket_path:
+            conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self.url.hostname, self.url.port, timeout=self.timeout)
+        try:
+            data = None if body is None else json.dumps(body).encode("utf-8")
+            conn.request(method, path, body=data, headers={"Content-Type": "application/json"})
+            return json.loads(conn.getresponse().read())
+        finally:
+            conn.close()
+
+    def health(self):
+        """The server status, `{"status", "workers", "pid"}`."""
+        return self._request("GET", "/health")
+
+    def wait(self, timeout=60.0):
+        """Block until the server answers, e.g. right after starting it."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self.health()
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+
+    def generate(self, config):
+        """
+        Generate the log of `config` on the server.
+
+        Relative paths in the config are made absolute first, so the log
+        lands where a local run would put it.
+
+        Returns:
+            dict: `output_ocel_path`, `runtime_sec` (in the worker), the
+            span `reports` of both phases and the `worker` pid.
+
+        Raises:
+            RuntimeError: If generation failed on the server.
+        """
+        return self._checked(self._request("POST", "/generate", _absolute_paths(config)))
+
+    def plan(self, config):
+        """The `ocelgen.plan` estimates of `config`, computed by a warm worker."""
+        return self._checked(self._request("POST", "/plan", _absolute_paths(config)))
+
+    @staticmethod
+    def _checked(result):
+        if result.get("status") != "ok":
+            raise RuntimeError(f"OCEL-Gen server: {result.get('error')}")
+        return result
+
+
+def _absolute_paths(config):
+    config = dict(config)
+    for key in PATH_KEYS:
+        if isinstance(config.get(key), str) and config[key] != "-":
+            config[key] = os.path.abspath(config[key])
+    return config
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate OCEL logs on a running OCEL-Gen server.")
+    parser.add_argument("configs", nargs="+", help="Paths to JSON config files")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Server address")
+    parser.add_argument("--socket", default=None, help="Unix socket of the server (overrides --url)")
+    parser.add_argument("--plan", action="store_true", help="Print the estimates instead of generating")
+    args = parser.parse_args()
+
+    client = OcelgenClient(args.url, args.socket)
+    failed = 0
+    for path in args.configs:
+        with open(path, "r") as f:
+            config = json.load(f)
+        try:
+            if args.plan:
+                for line in client.plan(config)["summary"]:
+                    print(f"[PLAN] {line}")
+                continue
+            result = client.generate(config)
+        except RuntimeError as e:
+            print(f"[ERROR] {path}: {e}")
+            failed += 1
+            continue
+        print(f"[DONE] {path}: {result['output_ocel_path']} in {result['runtime_sec']}s")
+    sys.exit(1 if failed else 0)
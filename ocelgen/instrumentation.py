@@ -0,0 +1,204 @@
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class NullSink:
+    """Discards every record."""
+
+    def write(self, record):
+        pass
+
+    def close(self):
+        pass
+
+
+class MemorySink:
+    """Collects records in `self.records`."""
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """Appends every record as one JSON line to `path`."""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, record):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+SINKS = {"none": NullSink, "memory": MemorySink, "jsonl": JsonLinesSink}
+
+# Allocation sites that are noise in a phase profile (lazy imports, tracemalloc itself)
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+
+def reset_peak_rss():
+    """Reset the kernel's RSS high-water mark (Linux only); False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Resident-set high-water mark of this process in MiB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Instrumentation:
+    """
+    Named wall-time spans and counters of one generation phase.
+
+    Span durations of the same name add up. Every finished span is passed
+    to the sink as `{"phase", "span", "seconds"}`; `report()` sends and
+    returns the totals as `{"phase", "spans", "counters"}`.
+
+    With `memory=True` every span also records its tracemalloc peak, the
+    RSS high-water mark and the `top_n` largest allocation sites still
+    alive when it ends. The report then has a `memory` entry with these
+    per span plus the phase-wide `tracemalloc_peak_mb` and `rss_peak_mb`.
+    Tracing allocations slows the phase down considerably, so span times
+    of a memory-profiled run are not comparable to normal runs.
+
+    Args:
+        phase (str): Label of the phase, e.g. "xes" or "ocel".
+        sink (optional): Object with `write(record)`; defaults to `NullSink`.
+        memory (bool): Profile memory per span.
+        top_n (int): Allocation sites kept per span.
+    """
+
+    def __init__(self, phase, sink=None, memory=False, top_n=5):
+        self.phase = phase
+        self.sink = sink if sink is not None else NullSink()
+        self.spans = {}
+        self.counters = {}
+        self.memory = {} if memory else None
+        self.top_n = top_n
+        self._started_tracing = False
+
+    @contextmanager
+    def span(self, name):
+        if self.memory is not None:
+            self._start_memory_span()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - t0
+            self.spans[name] = self.spans.get(name, 0.0) + seconds
+            record = {"phase": self.phase, "span": name, "seconds": seconds}
+            if self.memory is not None:
+                record.update(self._end_memory_span(name))
+            self.sink.write(record)
+
+    def _start_memory_span(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        reset_peak_rss()
+
+    def _end_memory_span(self, name):
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        rss = peak_rss_mb()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        stats = snapshot.statistics("lineno")[:self.top_n]
+        top = [
+            {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             "size_kb": stat.size / 1024, "count": stat.count}
+            for stat in stats
+        ]
+        usage = self.memory.setdefault(name, {"tracemalloc_peak_mb": 0.0, "rss_peak_mb": 0.0})
+        usage["tracemalloc_peak_mb"] = max(usage["tracemalloc_peak_mb"], peak)
+        usage["rss_peak_mb"] = max(usage["rss_peak_mb"], rss)
+        usage["top_allocations"] = top
+        return {"tracemalloc_peak_mb": peak, "rss_peak_mb": rss, "top_allocations": top}
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        report = {"phase": self.phase, "spans": dict(self.spans), "counters": dict(self.counters)}
+        if self.memory is not None:
+            usages = self.memory.values()
+            report["memory"] = {
+                "tracemalloc_peak_mb": max((u["tracemalloc_peak_mb"] for u in usages), default=0.0),
+                "rss_peak_mb": max((u["rss_peak_mb"] for u in usages), default=0.0),
+                "spans": dict(self.memory),
+            }
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        self.sink.write(report)
+        return report
+
+
+def make_instrumentation(phase, config, sink=None):
+    """Instrumentation for `phase` with the config's sink and `memory_profile` setting."""
+    return Instrumentation(
+        phase, sink if sink is not None else make_sink(config),
+        memory=config.get("memory_profile", False)
+    )
+
+
+def make_sink(config):
+    """
+    Sink selected by `instrumentation_sink` ("none", "memory" or "jsonl").
+
+    The JSON-lines sink appends to `instrumentation_path`
+    (default `instrumentation.jsonl`).
+    """
+    kind = config.get("instrumentation_sink", "none")
+    if kind not in SINKS:
+        raise ValueError(f"Unknown instrumentation_sink '{kind}', expected one of {', '.join(SINKS)}")
+    if kind == "jsonl":
+        return JsonLinesSink(config.get("instrumentation_path", "instrumentation.jsonl"))
+    return SINKS[kind]()
+
+
+def format_spans(report):
+    """One-line summary such as `tree_generation=0.0123s, playout=0.4567s`."""
+    return ", ".join(f"{name}={seconds:.4f}s" for name, seconds in report["spans"].items())
+
+
+def format_memory(report):
+    """One-line summary of the per-span tracemalloc and RSS peaks of a memory-profiled report."""
+    return ", ".join(
+        f"{name}={usage['tracemalloc_peak_mb']:.1f} MiB (RSS {usage['rss_peak_mb']:.1f} MiB)"
+        for name, usage in report["memory"]["spans"].items()
+    )
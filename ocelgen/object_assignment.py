@@ -0,0 +1,122 @@
+from array import array
+
+OBJECT_ASSIGNMENTS = ("draws", "distinct")
+
+
+class ObjectAssigner:
+    """
+    Picks the objects of each (event, object type) pair of one trace.
+
+    Owns the trace's reuse pools and creates new objects in `store`,
+    emitting them through `emit_object` with their synthetic attributes.
+
+    `"object_assignment": "draws"` (default) makes `n` independent draws,
+    each reusing a random pool object with probability `reuse_prob` or
+    creating a new one. Repeated picks are dropped with a set lookup, so an
+    event can end up with fewer than `n` objects of the type.
+
+    `"distinct"` decides reuse vs. new for each of the `n` slots, then draws
+    the reused objects without replacement: a partial Fisher-Yates shuffle
+    of the trace pool, which reorders the pool in place. Every event gets
+    exactly `n` distinct objects, and the cost is linear in `n`.
+
+    With `shared_pools` (cross-trace `RingPool`s of OCEL ids), reused
+    objects are registered in the trace's store under their id; distinct
+    draws then reject repeats, so the pool's recency skew is kept. The
+    rejection stops after `4 * k` draws for `k` reused slots; a slot still
+    unfilled then (a heavily skewed or nearly exhausted window) gets a new
+    object instead, so an event may reuse fewer objects than decided, but
+    always gets `n` distinct ones.
+
+    `new` and `reused` count the event-to-object links to new and to pooled
+    objects, in both modes; repeated draws dropped by `"draws"` count
+    neither.
+    """
+
+    def __init__(self, ctx, sampler, store, emit_object, shared_pools=None):
+        self.sampler = sampler
+        self.store = store
+        self.emit_object = emit_object
+        self.reuse_prob = ctx["reuse_prob"]
+        self.object_attributes = ctx["object_attributes"]
+        # Hashed attributes are derived from the entity ids by the emitter
+        self.hashed = ctx["hashed_attributes"] is not None
+        self.type_codes = {ot: store.add_type(ot) for ot in ctx["object_types"]}
+        self.shared = shared_pools is not None
+        if self.shared:
+            self.pools = dict(shared_pools)
+            self.local_oids = {}  # OCEL id -> oid of the shared objects used in this trace
+        else:
+            self.pools = {ot: array("L") for ot in ctx["object_types"]}
+        self.assign = self._distinct if ctx["object_assignment"] == "distinct" else self._draws
+        self.new = 0
+        self.reused = 0
+
+    def new_object(self, ot):
+        """Create, pool and emit a new object of type `ot`."""
+        oid = self.store.new_object(self.type_codes[ot])
+        if self.shared:
+            object_id = self.store.object_id(oid)
+            self.local_oids[object_id] = oid
+            self.pools[ot].append(object_id)
+        else:
+            self.pools[ot].append(oid)
+        self.new += 1
+        self.emit_object(oid, None if self.hashed else self.object_attributes.draw(self.sampler))
+        return oid
+
+    def _reuse(self, ot, u):
+        """The oid of the shared object picked by the uniform draw `u`."""
+        object_id = self.pools[ot].choice(u)
+        oid = self.local_oids.get(object_id)
+        if oid is None:
+            oid = self.local_oids[object_id] = self.store.add_named(self.type_codes[ot], object_id)
+        return oid
+
+    def _draws(self, ot, n):
+        random, choice = self.sampler.random, self.sampler.choice
+        reuse_prob = self.reuse_prob
+        pool = self.pools[ot]
+        if n == 1:  # the common case needs no de-duplication
+            if random() < reuse_prob and pool:
+                self.reused += 1
+                return [self._reuse(ot, random()) if self.shared else choice(pool)]
+            return [self.new_object(ot)]
+        ids, seen = [], set()
+        reused = 0
+        for _ in range(n):
+            if random() < reuse_prob and pool:
+                oid = self._reuse(ot, random()) if self.shared else choice(pool)
+                if oid in seen:  # Avoid duplicates in same event
+                    continue
+                reused += 1
+            else:
+                oid = self.new_object(ot)
+            seen.add(oid)
+            ids.append(oid)
+        self.reused += reused
+        return ids
+
+    def _distinct(self, ot, n):
+        sampler = self.sampler
+        pool = self.pools[ot]
+        k = min(sum(sampler.random() < self.reuse_prob for _ in range(n)), len(pool))
+        if self.shared:
+            ids, seen = [], set()
+            for _ in range(4 * k):  # rejection; expected O(k) while k << window
+                if len(ids) == k:
+                    break
+                oid = self._reuse(ot, sampler.random())
+                if oid not in seen:
+                    seen.add(oid)
+                    ids.append(oid)
+        else:
+            size = len(pool)
+            for i in range(k):
+                j = i + int(sampler.random() * (size - i))
+                pool[i], pool[j] = pool[j], pool[i]
+            ids = list(pool[:k])
+        self.reused += len(ids)
+        # New objects for the other slots, including reused ones the rejection left unfilled
+        ids.extend(self.new_object(ot) for _ in range(n - len(ids)))
+        return ids
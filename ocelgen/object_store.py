@@ -0,0 +1,131 @@
+import sys
+from array import array
+
+
+class ObjectStore:
+    """
+    Compact, integer-keyed registry of the objects created by the converter.
+
+    Objects are plain integers (their position in the store). The type code
+    and the per-type serial number of each object live in typed arrays, so
+    an object costs a few bytes instead of a string key plus a nested dict.
+    The OCEL id (e.g. `ot3_0042`) is only formatted when it is written out.
+
+    Case objects keep the trace id as their OCEL id; those names are the
+    only strings the store holds. When objects are never referenced again
+    (e.g. after their trace is done), `release` drops them while keeping
+    the serial counters, so the store only grows with the live objects.
+    """
+
+    __slots__ = ("type_names", "_type_index", "_type_codes", "_serials", "_counters", "_names")
+
+    def __init__(self):
+        self.type_names = []
+        self._type_index = {}
+        self._type_codes = array("H")
+        self._serials = array("L")
+        self._counters = array("L")
+        self._names = {}
+
+    def __len__(self):
+        return len(self._type_codes)
+
+    def add_type(self, name):
+        """Register an object type and return its code (idempotent)."""
+        code = self._type_index.get(name)
+        if code is None:
+            code = self._type_index[name] = len(self.type_names)
+            self.type_names.append(name)
+            self._counters.append(0)
+        return code
+
+    def new_object(self, type_code):
+        """Create an object with the next serial number of its type."""
+        self._counters[type_code] += 1
+        self._type_codes.append(type_code)
+        self._serials.append(self._counters[type_code])
+        return len(self._type_codes) - 1
+
+    def add_named(self, type_code, name):
+        """Create an object whose OCEL id is `name` (used for case objects)."""
+        self._type_codes.append(type_code)
+        self._serials.append(0)
+        oid = len(self._type_codes) - 1
+        self._names[oid] = name
+        return oid
+
+    def type_code(self, oid):
+        return self._type_codes[oid]
+
+    def type_name(self, oid):
+        return self.type_names[self._type_codes[oid]]
+
+    def name(self, oid):
+        """OCEL id given to a named object, or None."""
+        return self._names.get(oid)
+
+    def object_id(self, oid):
+        """Format the OCEL id of an object."""
+        name = self._names.get(oid)
+        if name is not None:
+            return name
+        return f"{self.type_names[self._type_codes[oid]]}_{self._serials[oid]:04d}"
+
+    def release(self):
+        """
+        Forget all objects, keeping the types and per-type serial counters.
+
+        Ids handed out before are invalid afterwards; new objects continue
+        the serial numbers, so their OCEL ids stay unique.
+        """
+        self._type_codes = array("H")
+        self._serials = array("L")
+        self._names = {}
+
+    def nbytes(self):
+        """Approximate memory held by the store, in bytes."""
+        arrays = (self._type_codes, self._serials, self._counters)
+        total = sum(sys.getsizeof(a) for a in arrays)
+        total += sys.getsizeof(self._names)
+        total += sum(sys.getsizeof(name) for name in self._names.values())
+        total += sys.getsizeof(self.type_names) + sys.getsizeof(self._type_index)
+        return total
+
+
+class RingPool:
+    """
+    Fixed-capacity window of the most recently created objects of one type.
+
+    Used for cross-trace reuse (`"object_reuse_scope": "global"`). Adding
+    an object beyond `capacity` overwrites the oldest one, so appends and
+    draws are O(1) and memory stays bounded however many objects the log
+    has. `choice` picks the k-th most recent object with
+    k = floor(n * u ** (1 + skew)): `skew` 0 is uniform over the window,
+    larger values favour recent objects.
+    """
+
+    __slots__ = ("capacity", "skew", "items", "head")
+
+    def __init__(self, capacity, skew=0.0):
+        if capacity < 1:
+            raise ValueError(f"reuse_window must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self.skew = skew
+        self.items = []
+        self.head = 0  # slot the next object overwrites once the window is full
+
+    def __len__(self):
+        return len(self.items)
+
+    def append(self, item):
+        if len(self.items) < self.capacity:
+            self.items.append(item)
+        else:
+            self.items[self.head] = item
+            self.head = (self.head + 1) % self.capacity
+
+    def choice(self, u):
+        """The object for the uniform draw `u` in [0, 1)."""
+        n = len(self.items)
+        k = int(n * u ** (1.0 + self.skew))
+        return self.items[(self.head - 1 - k) % n]
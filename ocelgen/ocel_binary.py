@@ -0,0 +1,233 @@
+import argparse
+import glob
+import json
+import os
+import shutil
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+NO_TYPE = 0xFFFF  # object referenced by an event before (or without) its definition
+
+
+def binary_path(ocel_path):
+    """Directory of the binary copy of an OCEL log: `log.jsonocel` -> `log.ocelbin`."""
+    return os.path.splitext(ocel_path)[0] + ".ocelbin"
+
+
+def _timestamp_us(timestamp):
+    """Microseconds since the epoch (UTC) of an ISO timestamp."""
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - EPOCH) // MICROSECOND
+
+
+class OcelBinaryWriter:
+    """
+    Writer for the memory-mappable binary OCEL format.
+
+    Same interface as `OcelJsonWriter`. The log becomes a directory of
+    `.npy` arrays plus `meta.json`:
+
+        event_activity   uint32  activity code per event (into meta "activities")
+        event_timestamp  int64   microseconds since the epoch (UTC)
+        event_id         S<n>    UTF-8 encoded event ids
+        e2o_offsets      int64   CSR offsets (num_events + 1)
+        e2o_objects      uint32  object indices; event i has
+                                 e2o_objects[e2o_offsets[i]:e2o_offsets[i + 1]]
+        object_type      uint16  type code per object (into meta "object_types")
+        object_id        S<n>    UTF-8 encoded object ids
+
+    Attribute values are not part of the format. Entities are collected in
+    compact typed arrays and the directory is written in `finalize`. The ids
+    cannot be spooled that way: the writer holds every event id (encoded)
+    and every object id (the keys of its object index) in memory until
+    `finalize`, so memory grows with the size of the log.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.num_events = 0
+        self.num_objects = 0
+        self._activities, self._activity_codes = [], {}
+        self._types, self._type_codes = [], {}
+        self._event_activity = array("I")
+        self._event_timestamp = array("q")
+        self._event_ids = []  # UTF-8 encoded
+        self._e2o_offsets = array("q", [0])
+        self._e2o_objects = array("I")
+        self._object_type = array("H")
+        self._object_index = {}  # object id -> index, in index order
+        self._last_timestamp = (None, 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _object(self, object_id):
+        index = self._object_index.get(object_id)
+        if index is None:
+            index = self._object_index[object_id] = len(self._object_index)
+            self._object_type.append(NO_TYPE)
+        return index
+
+    def write_event(self, event_id, event):
+        """Append one event."""
+        activity = event["ocel:activity"]
+        code = self._activity_codes.get(activity)
+        if code is None:
+            code = self._activity_codes[activity] = len(self._activities)
+            self._activities.append(activity)
+        timestamp = event["ocel:timestamp"]
+        if timestamp != self._last_timestamp[0]:  # consecutive events often share one
+            self._last_timestamp = (timestamp, _timestamp_us(timestamp))
+        self._event_activity.append(code)
+        self._event_timestamp.append(self._last_timestamp[1])
+        self._event_ids.append(event_id.encode("utf-8"))
+        self._e2o_objects.extend(self._object(oid) for oid in event["ocel:omap"])
+        self._e2o_offsets.append(len(self._e2o_objects))
+        self.num_events += 1
+
+    def write_object(self, object_id, obj):
+        """Append (or complete) one object."""
+        object_type = obj["ocel:type"]
+        code = self._type_codes.get(object_type)
+        if code is None:
+            code = self._type_codes[object_type] = len(self._types)
+            self._types.append(object_type)
+        index = self._object(object_id)
+        if self._object_type[index] == NO_TYPE:
+            self.num_objects += 1
+        self._object_type[index] = code
+
+    def finalize(self, global_log):
+        """Write the arrays and `meta.json` (via a temporary directory), replacing an existing copy."""
+        tmp_path = self.output_path + ".tmp"
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        os.makedirs(tmp_path)
+        arrays = {
+            "event_activity": np.frombuffer(self._event_activity, dtype=np.uint32),
+            "event_timestamp": np.frombuffer(self._event_timestamp, dtype=np.int64),
+            "event_id": np.array(self._event_ids, dtype="S"),
+            "e2o_offsets": np.frombuffer(self._e2o_offsets, dtype=np.int64),
+            "e2o_objects": np.frombuffer(self._e2o_objects, dtype=np.uint32),
+            "object_type": np.frombuffer(self._object_type, dtype=np.uint16),
+            "object_id": np.array([oid.encode("utf-8") for oid in self._object_index], dtype="S"),
+        }
+        for name, values in arrays.items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), values)
+        with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "version": 1,
+                "num_events": self.num_events,
+                "num_objects": len(self._object_index),
+                "activities": self._activities,
+                "object_types": self._types,
+                "global_log": global_log,
+            }, f, indent=2)
+        if os.path.exists(self.output_path):
+            shutil.rmtree(self.output_path)
+        os.replace(tmp_path, self.output_path)
+
+    def close(self):
+        pass
+
+
+class OcelBinary:
+    """
+    A binary OCEL log opened with `numpy.memmap` (via `np.load(mmap_mode="r")`).
+
+    Opening only reads `meta.json` and the array headers; array pages are
+    loaded by the OS when accessed. See `OcelBinaryWriter` for the arrays.
+    """
+
+    ARRAYS = ("event_activity", "event_timestamp", "event_id", "e2o_offsets",
+              "e2o_objects", "object_type", "object_id")
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.activities = self.meta["activities"]
+        self.object_types = self.meta["object_types"]
+        for name in self.ARRAYS:
+            setattr(self, name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r"))
+
+    @property
+    def num_events(self):
+        return len(self.event_activity)
+
+    @property
+    def num_objects(self):
+        return len(self.object_type)
+
+    def event_objects(self, i):
+        """Object indices of event `i`."""
+        return self.e2o_objects[self.e2o_offsets[i]:self.e2o_offsets[i + 1]]
+
+    def event_name(self, i):
+        """Id of event `i`."""
+        return self.event_id[i].decode("utf-8")
+
+    def object_name(self, i):
+        """Id of object `i`."""
+        return self.object_id[i].decode("utf-8")
+
+    def event_times(self):
+        """Event timestamps as `datetime64[us]`."""
+        return self.event_timestamp.view("datetime64[us]")
+
+
+def open_ocel_binary(path):
+    """Open a binary log; `path` may also be the `.jsonocel` it was written next to."""
+    if not path.endswith(".ocelbin"):
+        path = binary_path(path)
+    return OcelBinary(path)
+
+
+def convert_jsonocel_to_binary(json_path, output_path=None):
+    """
+    Convert an OCEL 1.0 JSON log to the binary format.
+
+    Args:
+        json_path (str): Path of the `.jsonocel` file.
+        output_path (str, optional): Target directory; defaults to `binary_path(json_path)`.
+
+    Returns:
+        str: The path of the binary log.
+    """
+    output_path = output_path or binary_path(json_path)
+    with open(json_path, encoding="utf-8") as f:
+        log = json.load(f)
+    writer = OcelBinaryWriter(output_path)
+    # Objects first, so object indices follow the order of `ocel:objects`
+    for object_id, obj in log.get("ocel:objects", {}).items():
+        writer.write_object(object_id, obj)
+    for event_id, event in log.get("ocel:events", {}).items():
+        writer.write_event(event_id, event)
+    writer.finalize(log.get("ocel:global-log", {}))
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert .jsonocel logs to the memory-mapped binary format.")
+    parser.add_argument("sources", nargs="+", help="Files, directories or glob patterns")
+    args = parser.parse_args()
+
+    paths = []
+    for source in args.sources:
+        if os.path.isdir(source):
+            paths.extend(sorted(glob.glob(os.path.join(source, "*.jsonocel"))))
+        elif glob.has_magic(source):
+            paths.extend(sorted(glob.glob(source)))
+        else:
+            paths.append(source)
+    for path in paths:
+        print(f"[DONE] {path} -> {convert_jsonocel_to_binary(path)}")
@@ -0,0 +1,511 @@
+import contextlib
+import csv
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from ocelgen.ocel_binary import OcelBinaryWriter, binary_path
+
+
+class OcelJsonWriter:
+    """
+    Incremental writer for OCEL 1.0 JSON logs.
+
+    Events and objects are serialized one by one as the converter produces
+    them, so the full log is never held in memory. Each section is spooled
+    to a temporary file next to the output; `finalize` writes the
+    `ocel:global-log` header (only known once every entity has been seen)
+    and appends the two sections behind it.
+
+    The header comes first in the file but depends on every entity, so
+    nothing can go to `output_path` before `finalize`. Every byte of the
+    log is therefore written twice, and the spools need temporary disk space
+    the size of the log next to the output. `OcelJsonLinesWriter` writes its
+    header record last and avoids both costs.
+
+    With the default `compact=False` the file is byte-identical to
+    `json.dump(log, f, indent=2)`. `compact=True` drops all whitespace.
+
+    Usage:
+        with OcelJsonWriter(path) as writer:
+            writer.write_event("e1", {...})
+            writer.write_object("o1", {...})
+            writer.finalize(global_log)
+    """
+
+    def __init__(self, output_path, compact=False):
+        self.output_path = output_path
+        self.indent = None if compact else 2
+        self.separators = (",", ":") if compact else (",", ": ")
+        self.num_events = 0
+        self.num_objects = 0
+        self.bytes_written = 0  # entries spooled so far, without the header
+
+        out_dir = os.path.dirname(output_path)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        self._events = tempfile.TemporaryFile("w+", encoding="utf-8", dir=out_dir or None)
+        self._objects = tempfile.TemporaryFile("w+", encoding="utf-8", dir=out_dir or None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _newline(self, depth):
+        """Line break plus indentation for the given nesting depth ('' in compact mode)."""
+        if self.indent is None:
+            return ""
+        return "\n" + " " * (self.indent * depth)
+
+    def _dumps(self, value, depth):
+        """Serialize `value` as if it were nested `depth` levels deep."""
+        text = json.dumps(value, indent=self.indent, separators=self.separators)
+        if self.indent is not None:
+            # json.dumps escapes newlines inside strings, so every raw newline is structural
+            text = text.replace("\n", self._newline(depth))
+        return text
+
+    def _write_entry(self, spool, first, key, value):
+        entry = self._newline(2) + json.dumps(key) + self.separators[1] + self._dumps(value, 2)
+        if not first:
+            entry = "," + entry
+        spool.write(entry)
+        self.bytes_written += len(entry)  # JSON is ASCII-only (ensure_ascii)
+
+    def write_event(self, event_id, event):
+        """Append one entry of `ocel:events`."""
+        self._write_entry(self._events, self.num_events == 0, event_id, event)
+        self.num_events += 1
+
+    def write_object(self, object_id, obj):
+        """Append one entry of `ocel:objects`."""
+        self._write_entry(self._objects, self.num_objects == 0, object_id, obj)
+        self.num_objects += 1
+
+    def _write_section(self, f, name, spool, count, last=False):
+        f.write(self._newline(1) + json.dumps(name) + self.separators[1] + "{")
+        if count:
+            spool.seek(0)
+            shutil.copyfileobj(spool, f)
+            f.write(self._newline(1))
+        f.write("}" if last else "},")
+
+    def finalize(self, global_log):
+        """Write the header and both spooled sections to `output_path`."""
+        key_sep = self.separators[1]
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            f.write("{")
+            f.write(self._newline(1) + '"ocel:global-log"' + key_sep + self._dumps(global_log, 1) + ",")
+            f.write(self._newline(1) + '"ocel:global-event"' + key_sep + "{},")
+            f.write(self._newline(1) + '"ocel:global-object"' + key_sep + "{},")
+            self._write_section(f, "ocel:events", self._events, self.num_events)
+            self._write_section(f, "ocel:objects", self._objects, self.num_objects, last=True)
+            f.write(self._newline(0) + "}")
+
+    def close(self):
+        """Discard the temporary spools."""
+        self._events.close()
+        self._objects.close()
+
+
+class _BufferedRowWriter:
+    """
+    Base of the table-oriented writers: flattens entities into row buffers.
+
+    Subclasses implement `_load(rows)`, which receives a dict of row lists
+    keyed by table ("event", "event_object", "event_attribute", "object",
+    "object_attribute") once `batch_size` entities are buffered and in
+    `finalize`.
+    """
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.num_events = 0
+        self.num_objects = 0
+        self._reset_buffers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _reset_buffers(self):
+        self._rows = {name: [] for name in ("event", "event_object", "event_attribute", "object", "object_attribute")}
+        self._pending = 0
+
+    @staticmethod
+    def _value(value):
+        return value if isinstance(value, (str, int, float)) or value is None else str(value)
+
+    def write_event(self, event_id, event):
+        """Buffer one event with its objects and attributes."""
+        rows = self._rows
+        rows["event"].append((event_id, event["ocel:activity"], event["ocel:timestamp"]))
+        rows["event_object"].extend((event_id, oid) for oid in event["ocel:omap"])
+        rows["event_attribute"].extend((event_id, k, self._value(v)) for k, v in event["ocel:vmap"].items())
+        self.num_events += 1
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self._flush()
+
+    def write_object(self, object_id, obj):
+        """Buffer one object with its attributes."""
+        rows = self._rows
+        rows["object"].append((object_id, obj["ocel:type"]))
+        rows["object_attribute"].extend((object_id, k, self._value(v)) for k, v in obj["ocel:ovmap"].items())
+        self.num_objects += 1
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        self._load(self._rows)
+        self._reset_buffers()
+
+
+class OcelSqliteWriter(_BufferedRowWriter):
+    """
+    Incremental writer for OCEL 2.0-style SQLite logs.
+
+    Same interface as `OcelJsonWriter`. Rows are buffered and loaded with
+    `executemany` in one transaction per `batch_size` events or objects;
+    the indexes are only built in `finalize`, after the load. Tables:
+
+        event(ocel_id, ocel_type, ocel_time)
+        object(ocel_id, ocel_type)
+        event_object(ocel_event_id, ocel_object_id, ocel_qualifier)
+        event_attribute(ocel_event_id, ocel_name, ocel_value)
+        object_attribute(ocel_object_id, ocel_name, ocel_value)
+        global_log(ocel_name, ocel_value)  -- JSON-encoded `ocel:global-log` entries
+
+    OCEL 1.0 has no qualifiers, so `ocel_qualifier` is empty.
+
+    Usage:
+        with OcelSqliteWriter(path) as writer:
+            writer.write_event("e1", {...})
+            writer.write_object("o1", {...})
+            writer.finalize(global_log)
+    """
+
+    SCHEMA = (
+        "CREATE TABLE event (ocel_id TEXT, ocel_type TEXT, ocel_time TEXT)",
+        "CREATE TABLE object (ocel_id TEXT, ocel_type TEXT)",
+        "CREATE TABLE event_object (ocel_event_id TEXT, ocel_object_id TEXT, ocel_qualifier TEXT)",
+        "CREATE TABLE event_attribute (ocel_event_id TEXT, ocel_name TEXT, ocel_value)",
+        "CREATE TABLE object_attribute (ocel_object_id TEXT, ocel_name TEXT, ocel_value)",
+        "CREATE TABLE global_log (ocel_name TEXT, ocel_value TEXT)",
+    )
+    INSERTS = {
+        "event": "INSERT INTO event VALUES (?, ?, ?)",
+        "event_object": "INSERT INTO event_object VALUES (?, ?, '')",
+        "event_attribute": "INSERT INTO event_attribute VALUES (?, ?, ?)",
+        "object": "INSERT INTO object VALUES (?, ?)",
+        "object_attribute": "INSERT INTO object_attribute VALUES (?, ?, ?)",
+    }
+    INDEXES = (
+        "CREATE UNIQUE INDEX event_id ON event (ocel_id)",
+        "CREATE INDEX event_type ON event (ocel_type)",
+        "CREATE UNIQUE INDEX object_id ON object (ocel_id)",
+        "CREATE INDEX object_type ON object (ocel_type)",
+        "CREATE INDEX event_object_event ON event_object (ocel_event_id)",
+        "CREATE INDEX event_object_object ON event_object (ocel_object_id)",
+        "CREATE INDEX event_attribute_event ON event_attribute (ocel_event_id)",
+        "CREATE INDEX object_attribute_object ON object_attribute (ocel_object_id)",
+    )
+
+    def __init__(self, output_path, batch_size=10000):
+        super().__init__(batch_size)
+        self.output_path = output_path
+
+        out_dir = os.path.dirname(output_path)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        self._db = sqlite3.connect(output_path)
+        # A generated log is rebuilt from scratch on failure, so no journal is needed
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        for statement in self.SCHEMA:
+            self._db.execute(statement)
+
+    def _load(self, rows):
+        """Load the buffered rows in one transaction."""
+        with self._db:
+            for table, insert in self.INSERTS.items():
+                self._db.executemany(insert, rows[table])
+
+    def finalize(self, global_log):
+        """Load the remaining rows, store the global log and build the indexes."""
+        self._flush()
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO global_log VALUES (?, ?)",
+                [(k, json.dumps(v)) for k, v in global_log.items()]
+            )
+            for statement in self.INDEXES:
+                self._db.execute(statement)
+
+    def close(self):
+        """Close the database connection."""
+        self._db.close()
+
+
+class OcelTableWriter(_BufferedRowWriter):
+    """
+    Writer for flat columnar tables, one file per table in `output_dir`.
+
+    Tables (all values as strings, attributes in long format):
+
+        events(ocel_id, ocel_activity, ocel_timestamp)
+        objects(ocel_id, ocel_type)
+        e2o(ocel_event_id, ocel_object_id)
+        event_attributes(ocel_event_id, name, value)
+        object_attributes(ocel_object_id, name, value)
+
+    plus `global_log.json`. Every `batch_size` entities the buffers are
+    appended as a Parquet row group (if pyarrow is installed) or as a chunk
+    of CSV rows. `read_ocel_tables` loads the tables into DataFrames.
+
+    Args:
+        output_dir (str): Directory receiving the tables.
+        table_format (str): "parquet", "csv" or "auto" (Parquet when available).
+        batch_size (int): Entities buffered before a chunk is written.
+    """
+
+    TABLES = {
+        "event": ("events", ["ocel_id", "ocel_activity", "ocel_timestamp"]),
+        "object": ("objects", ["ocel_id", "ocel_type"]),
+        "event_object": ("e2o", ["ocel_event_id", "ocel_object_id"]),
+        "event_attribute": ("event_attributes", ["ocel_event_id", "name", "value"]),
+        "object_attribute": ("object_attributes", ["ocel_object_id", "name", "value"]),
+    }
+
+    def __init__(self, output_dir, table_format="auto", batch_size=50000):
+        super().__init__(batch_size)
+        self.output_dir = output_dir
+        self.table_format = _resolve_table_format(table_format)
+        os.makedirs(output_dir, exist_ok=True)
+        self._files = {}
+        for key, (name, columns) in self.TABLES.items():
+            path = os.path.join(output_dir, f"{name}.{self.table_format}")
+            if self.table_format == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                schema = pa.schema([(column, pa.string()) for column in columns])
+                self._files[key] = pq.ParquetWriter(path, schema)
+            else:
+                f = open(path, "w", newline="", encoding="utf-8")
+                csv.writer(f).writerow(columns)
+                self._files[key] = f
+
+    def _load(self, rows):
+        """Append the buffered rows to every table."""
+        for key, table_rows in rows.items():
+            if not table_rows:
+                continue
+            if self.table_format == "parquet":
+                import pyarrow as pa
+                columns = self.TABLES[key][1]
+                arrays = [
+                    pa.array([None if v is None else str(v) for v in values], pa.string())
+                    for values in zip(*table_rows)
+                ]
+                self._files[key].write_table(pa.Table.from_arrays(arrays, names=columns))
+            else:
+                csv.writer(self._files[key]).writerows(table_rows)
+
+    def finalize(self, global_log):
+        """Write the remaining rows and `global_log.json`."""
+        self._flush()
+        with open(os.path.join(self.output_dir, "global_log.json"), "w", encoding="utf-8") as f:
+            json.dump(global_log, f, indent=2)
+
+    def close(self):
+        """Close all table files."""
+        for f in self._files.values():
+            f.close()
+
+
+def _resolve_table_format(table_format):
+    """Map "auto" to "parquet" if pyarrow is importable, else "csv"."""
+    if table_format not in ("auto", "parquet", "csv"):
+        raise ValueError(f"Unknown ocel_table_format '{table_format}', expected 'auto', 'parquet' or 'csv'")
+    if table_format == "csv":
+        return "csv"
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        if table_format == "parquet":
+            raise ImportError("ocel_table_format 'parquet' requires pyarrow (pip install pyarrow)")
+        return "csv"
+    return "parquet"
+
+
+def read_ocel_tables(output_dir):
+    """
+    Load the tables written by `OcelTableWriter` into pandas DataFrames.
+
+    Returns:
+        dict: DataFrames keyed "events", "objects", "e2o", "event_attributes"
+        and "object_attributes" (timestamps parsed), plus the "global_log" dict.
+    """
+    import pandas as pd
+
+    tables = {}
+    for name, _ in OcelTableWriter.TABLES.values():
+        parquet_path = os.path.join(output_dir, f"{name}.parquet")
+        if os.path.exists(parquet_path):
+            tables[name] = pd.read_parquet(parquet_path)
+        else:
+            tables[name] = pd.read_csv(os.path.join(output_dir, f"{name}.csv"), dtype=str, keep_default_na=False)
+    tables["events"]["ocel_timestamp"] = pd.to_datetime(tables["events"]["ocel_timestamp"], format="ISO8601")
+    with open(os.path.join(output_dir, "global_log.json"), encoding="utf-8") as f:
+        tables["global_log"] = json.load(f)
+    return tables
+
+
+class OcelJsonLinesWriter:
+    """
+    Stream emitter writing one JSON object per line as entities arrive.
+
+    Lines are `{"type": "object", "id": ..., "ocel:type", "ocel:ovmap"}`,
+    `{"type": "event", "id": ..., "ocel:activity", ...}` and, last,
+    `{"type": "global-log", ...}`. Nothing is buffered beyond the file
+    object, so the output can be piped (`output_path="-"` writes to the
+    process's stdout; see `redirect_progress` for the progress lines).
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.num_events = 0
+        self.num_objects = 0
+        self.bytes_written = 0
+        if output_path == "-":
+            self._file = sys.__stdout__  # not a stdout redirected by `redirect_progress`
+        else:
+            out_dir = os.path.dirname(output_path)
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
+            self._file = open(output_path, "w", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _write(self, record):
+        line = json.dumps(record) + "\n"
+        self._file.write(line)
+        self.bytes_written += len(line)
+
+    def write_event(self, event_id, event):
+        self._write({"type": "event", "id": event_id, **event})
+        self.num_events += 1
+
+    def write_object(self, object_id, obj):
+        self._write({"type": "object", "id": object_id, **obj})
+        self.num_objects += 1
+
+    def finalize(self, global_log):
+        self._write({"type": "global-log", **global_log})
+        self._file.flush()
+
+    def close(self):
+        if self.output_path != "-":
+            self._file.close()
+
+
+class _TeeWriter:
+    """Passes every entity to a primary writer and a secondary copy (e.g. the binary cache)."""
+
+    def __init__(self, primary, secondary):
+        self.primary = primary
+        self.secondary = secondary
+
+    @property
+    def num_events(self):
+        return self.primary.num_events
+
+    @property
+    def num_objects(self):
+        return self.primary.num_objects
+
+    @property
+    def bytes_written(self):
+        return self.primary.bytes_written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write_event(self, event_id, event):
+        self.primary.write_event(event_id, event)
+        self.secondary.write_event(event_id, event)
+
+    def write_object(self, object_id, obj):
+        self.primary.write_object(object_id, obj)
+        self.secondary.write_object(object_id, obj)
+
+    def finalize(self, global_log):
+        self.primary.finalize(global_log)
+        self.secondary.finalize(global_log)
+
+    def close(self):
+        self.primary.close()
+        self.secondary.close()
+
+
+OCEL_OUTPUT_FORMATS = ("json", "sqlite", "tables", "jsonl")
+
+
+def redirect_progress(config):
+    """
+    Context sending the `[INFO]`/`[DONE]`/`[STATS]` lines to stderr while the log is streamed to stdout.
+
+    With `output_ocel_path` "-" the JSONL stream owns stdout, so anything
+    printed inside the context goes to stderr instead; otherwise it does
+    nothing.
+    """
+    if config.get("output_ocel_path") == "-":
+        return contextlib.redirect_stdout(sys.stderr)
+    return contextlib.nullcontext()
+
+
+def make_ocel_writer(config):
+    """
+    Writer selected by `ocel_output_format`: "json" (default), "sqlite",
+    "tables" or "jsonl".
+
+    The log is written to `output_ocel_path` (a directory for "tables",
+    "-" for stdout with "jsonl").
+    `ocel_json_compact` applies to JSON, `ocel_sqlite_batch_size` to SQLite
+    and `ocel_table_format` ("auto", "parquet" or "csv") to tables. With
+    `"ocel_binary_cache": true` a memory-mappable binary copy is written
+    next to it as well (see `ocelgen.ocel_binary`).
+    """
+    writer = _make_primary_writer(config)
+    if config.get("ocel_binary_cache", False):
+        writer = _TeeWriter(writer, OcelBinaryWriter(binary_path(config["output_ocel_path"])))
+    return writer
+
+
+def _make_primary_writer(config):
+    fmt = config.get("ocel_output_format", "json")
+    if fmt == "json":
+        return OcelJsonWriter(config["output_ocel_path"], compact=config.get("ocel_json_compact", False))
+    if fmt == "sqlite":
+        return OcelSqliteWriter(config["output_ocel_path"], batch_size=config.get("ocel_sqlite_batch_size", 10000))
+    if fmt == "tables":
+        return OcelTableWriter(config["output_ocel_path"], table_format=config.get("ocel_table_format", "auto"))
+    if fmt == "jsonl":
+        return OcelJsonLinesWriter(config["output_ocel_path"])
+    raise ValueError(f"Unknown ocel_output_format '{fmt}', expected one of {', '.join(OCEL_OUTPUT_FORMATS)}")
@@ -0,0 +1,63 @@
+import time
+import tracemalloc
+from ocelgen.instrumentation import make_instrumentation, make_sink
+from ocelgen.ocel_writer import redirect_progress
+from ocelgen.plan import target_size
+from ocelgen.target_size import generate_to_target
+from ocelgen.xes_generator import generate_xes_log
+from ocelgen.xes_to_ocel_converter import convert_xes_to_ocel
+
+
+def run_pipeline(config: dict):
+    """
+    Run both generation phases, handing the XES log over in memory.
+
+    The intermediate XES file is only written when `"write_xes": true`
+    is set in the config. Both phases report to the sink selected with
+    `instrumentation_sink`; `"memory_profile": true` adds per-phase
+    tracemalloc and RSS peaks and the top allocation sites.
+
+    With `target_size` the phases run interleaved, trace by trace, until
+    the log reaches the target (see `ocelgen.target_size.generate_to_target`).
+    When the log is streamed to stdout (`output_ocel_path` "-"), progress
+    lines go to stderr.
+
+    Args:
+        config (dict): Configuration dictionary loaded from a JSON file.
+
+    Returns:
+        dict: The span reports of both phases, keyed "xes" and "ocel",
+        each with the phase's wall time as `runtime_sec`. Interleaved
+        target-size phases count the XES spans as the XES phase and the
+        rest of the run as the OCEL phase.
+    """
+    with redirect_progress(config):
+        sink = make_sink(config)
+        # Trace across both phases so the OCEL peak includes the XES log handed over
+        memory_profile = config.get("memory_profile", False) and not tracemalloc.is_tracing()
+        if memory_profile:
+            tracemalloc.start()
+        try:
+            t0 = time.perf_counter()
+            if target_size(config) is not None:
+                print("[PHASE 1+2] Generating and converting traces up to the target size...")
+                reports = generate_to_target(
+                    config, make_instrumentation("xes", config, sink), make_instrumentation("ocel", config, sink)
+                )
+                xes_report, ocel_report = reports["xes"], reports["ocel"]
+                xes_report["runtime_sec"] = sum(xes_report["spans"].values())
+                ocel_report["runtime_sec"] = time.perf_counter() - t0 - xes_report["runtime_sec"]
+            else:
+                print("[PHASE 1] Generating synthetic XES log...")
+                xes_log, xes_report = generate_xes_log(config, make_instrumentation("xes", config, sink))
+                t1 = time.perf_counter()
+                xes_report["runtime_sec"] = t1 - t0
+
+                print("[PHASE 2] Converting XES log to OCEL format...")
+                ocel_report = convert_xes_to_ocel(config, xes_log=xes_log, instrumentation=make_instrumentation("ocel", config, sink))
+                ocel_report["runtime_sec"] = time.perf_counter() - t1
+        finally:
+            sink.close()
+            if memory_profile:
+                tracemalloc.stop()
+    return {"xes": xes_report, "ocel": ocel_report}
@@ -0,0 +1,458 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import tempfile
+from collections import namedtuple
+from types import MappingProxyType
+from pm4py.objects.process_tree.obj import Operator
+from ocelgen.attributes import ATTRIBUTE_VALUES
+from ocelgen.instrumentation import Instrumentation
+from ocelgen.object_assignment import OBJECT_ASSIGNMENTS
+from ocelgen.ocel_writer import OCEL_OUTPUT_FORMATS, make_ocel_writer
+from ocelgen.playout import play_out_native
+from ocelgen.sampling import RNG_MODES, SAMPLING_MODES, TRIANGULAR_PARAMETERIZATIONS, make_sampler, stream_seed
+from ocelgen.timestamps import TIMESTAMP_MODELS, TimestampModel, stamp_activity_log, timestamp_model
+from ocelgen.xes_generator import process_tree
+from ocelgen.xes_to_ocel_converter import build_context, iter_ocel_events, write_ocel
+
+PLAYOUT_ENGINES = ("pm4py", "native", "variants")
+TARGET_UNITS = ("events", "objects", "bytes")
+PILOT_TRACES = 200
+CALIBRATION_FILE = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "csv_files", "plan_calibration.json"))
+
+# Seconds per event relative to PM4Py's play-out (measured on 5k-trace logs)
+ENGINE_SPEED = {"pm4py": 1.0, "native": 0.2, "variants": 0.15}
+
+# Used until `runtime_experiments/calibrate_plan.py` has written CALIBRATION_FILE
+DEFAULT_CALIBRATION = {
+    "xes_fixed_sec": 0.002,
+    "xes_sec_per_event": 9.0e-6,
+    "ocel_fixed_sec": 0.002,
+    "ocel_sec_per_event": 3.0e-5,
+    "ocel_sec_per_object": 8.0e-6,
+    "source": "built-in defaults",
+}
+
+_TRIANGLE_DRAWS = 20000  # draws when averaging the object types per event
+_SIMULATED_EVENTS = 50000  # events of the object pool simulation
+
+
+GenerationPlan = namedtuple("GenerationPlan", [
+    "config", "num_traces", "engine", "output_format", "mean_trace_length", "events",
+    "objects_per_type", "objects", "links", "bytes_per_format", "xes_seconds", "ocel_seconds",
+    "calibration", "target",
+])
+GenerationPlan.__doc__ = """
+A validated config with the expected size and runtime of the log it produces.
+
+`config` is a read-only copy of the compiled config: its sections are
+read-only mappings too, and lists become tuples. Counts are
+expectations: `events`, `objects` (case objects included, per type in
+`objects_per_type`) and `links` (event-to-object relations).
+`mean_trace_length` follows the native play-out semantics
+(`expected_trace_length`) for every engine; `format_plan` marks it as
+such for the PM4Py engine, whose OR semantics differ.
+`bytes_per_format` estimates the output size of every OCEL writer, and
+`xes_seconds`/`ocel_seconds` the phase runtimes under `calibration`.
+With a `target` (`(unit, size)`, see `target_size`), `num_traces` is the
+expected number of traces needed to reach it.
+"""
+
+
+def _format_bytes(n):
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{n:,.0f} {unit}" if unit == "B" else f"{n:,.1f} {unit}"
+        n /= 1024
+
+
+def format_plan(plan):
+    """Human-readable summary lines of a `GenerationPlan`."""
+    traces = f"Traces: {plan.num_traces:,}"
+    if plan.target is not None:
+        traces = f"Traces: ~{plan.num_traces:,} to reach {plan.target[1]:,} {plan.target[0]}"
+    length = f"expected trace length {plan.mean_trace_length:.2f}"
+    if plan.engine == "pm4py":
+        length += " (native play-out semantics; PM4Py's traces are shorter with OR nodes)"
+    lines = [
+        f"{traces} ({plan.engine} play-out), {length}",
+        f"Events: {plan.events:,.0f}, Objects: {plan.objects:,.0f}, E2O links: {plan.links:,.0f}",
+        "Objects per type: " + ", ".join(f"{ot}={n:,.0f}" for ot, n in plan.objects_per_type.items()),
+    ]
+    if plan.bytes_per_format:
+        lines.append("Output size: " + ", ".join(
+            f"{fmt}{' (selected)' if fmt == plan.output_format else ''}={_format_bytes(n)}"
+            for fmt, n in plan.bytes_per_format.items()
+        ))
+    lines.append(f"Runtime: XES ~{plan.xes_seconds:.2f}s, OCEL ~{plan.ocel_seconds:.2f}s "
+                 f"(calibration: {plan.calibration['source']})")
+    return lines
+
+
+def target_size(config):
+    """
+    The `(unit, size)` of a target-size config, or None if `num_traces` sets the log size.
+
+    `"target_size": N` replaces `num_traces`: traces are generated until the
+    log holds N `"target_unit"`s, "events" (default), "objects" or "bytes"
+    of output (see `ocelgen.target_size`).
+    """
+    size = config.get("target_size")
+    if size is None:
+        return None
+    unit = config.get("target_unit", "events")
+    if unit not in TARGET_UNITS:
+        raise ValueError(f"Unknown target_unit '{unit}', expected one of {list(TARGET_UNITS)}")
+    if not isinstance(size, (int, float)) or size <= 0:
+        raise ValueError(f"target_size: expected a positive number, got {size!r}")
+    return unit, size
+
+
+def validate_config(config):
+    """
+    Check a config for missing keys, invalid ranges and unsupported combinations.
+
+    Returns:
+        list: Error messages; empty if the config is valid.
+    """
+    errors = []
+    tree = config.get("process_tree_params")
+    params = config.get("ocel_generation_parameters")
+    if not isinstance(tree, dict) or not isinstance(params, dict):
+        return ["config needs 'process_tree_params' and 'ocel_generation_parameters' sections"]
+
+    def check_triangle(section, name, prefix, low_bound):
+        keys = [f"{prefix}_min", f"{prefix}_mode", f"{prefix}_max"] if prefix else ["min", "mode", "max"]
+        missing = [key for key in keys if key not in section]
+        if missing:
+            errors.append(f"{name}: missing {', '.join(missing)}")
+            return
+        low, mode, high = (section[key] for key in keys)
+        if not low_bound <= low <= mode <= high:
+            errors.append(f"{name}: expected {low_bound} <= min <= mode <= max, got {low}, {mode}, {high}")
+
+    def check_choice(section, key, choices, default):
+        value = section.get(key, default)
+        if value not in choices:
+            errors.append(f"{key}: unknown value '{value}', expected one of {list(choices)}")
+        return value
+
+    check_triangle(tree, "activities", None, 1)
+    for key in ("sequence", "choice", "parallel", "loop", "silent", "lt_dependency", "duplicate", "or"):
+        if not 0.0 <= tree.get(key, 0.0) <= 1.0:
+            errors.append(f"process_tree_params.{key}: probability {tree[key]} outside [0, 1]")
+    engine = check_choice(tree, "playout_engine", PLAYOUT_ENGINES, "pm4py")
+    if "target_size" in config:
+        try:
+            target_size(config)
+        except ValueError as e:
+            errors.append(str(e))
+        if engine != "native":
+            errors.append(f"target_size requires playout_engine 'native', got '{engine}'")
+        if config.get("jobs"):
+            errors.append("target_size needs the sequential conversion (no jobs)")
+    elif not isinstance(tree.get("num_traces"), int) or tree["num_traces"] < 1:
+        errors.append(f"num_traces: expected a positive integer, got {tree.get('num_traces')!r}")
+    check_choice(tree, "timestamp_model", TIMESTAMP_MODELS, "synthetic")
+
+    check_triangle(params, "object types", "object_types", 1)
+    check_triangle(params, "object types per event", "object_types_per_event", 0)
+    check_triangle(params, "objects per type per event", "objects_per_type_per_event", 0)
+    for prefix in ("event_attributes", "object_attributes"):
+        if f"{prefix}_min" in params:
+            check_triangle(params, prefix.replace("_", " "), prefix, 0)
+    if not 0.0 <= params.get("reuse_object_probability", -1) <= 1.0:
+        errors.append("reuse_object_probability: expected a probability in [0, 1]")
+    if "case_object_type" not in params:
+        errors.append("ocel_generation_parameters: missing case_object_type")
+    check_choice(params, "sampling_mode", SAMPLING_MODES, "scalar")
+    check_choice(params, "triangular_parameterization", TRIANGULAR_PARAMETERIZATIONS, "legacy")
+    check_choice(params, "attribute_values", ATTRIBUTE_VALUES, "sampled")
+    check_choice(params, "object_assignment", OBJECT_ASSIGNMENTS, "draws")
+    scope = check_choice(params, "object_reuse_scope", ("trace", "global"), "trace")
+    rng_mode = check_choice(config, "rng_mode", RNG_MODES, "sequential")
+    check_choice(config, "ocel_output_format", OCEL_OUTPUT_FORMATS, "json")
+
+    if rng_mode == "counter" and engine != "native":
+        errors.append(f"rng_mode 'counter' requires playout_engine 'native', got '{engine}'")
+    if scope == "global" and (config.get("jobs") or rng_mode == "counter"):
+        errors.append("object_reuse_scope 'global' needs the sequential conversion (no jobs, rng_mode 'sequential')")
+    if not errors:
+        try:
+            build_context(params, make_sampler(params, 0), 0)  # also builds the attribute vocabularies
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append(f"ocel_generation_parameters: {e}")
+    return errors
+
+
+def expected_trace_length(tree):
+    """
+    Expected number of visible activities per trace of a process tree.
+
+    Follows the play-out semantics of `ocelgen.playout`: XOR picks a child
+    uniformly, loops repeat `do` + `redo` with probability 1/2, OR runs
+    each child with probability 1/2 (conditioned on at least one), and
+    parallel/interleaving nodes run all children. These are also the
+    semantics of the variants engine, but not PM4Py's: its OR nodes run
+    each child with probability 1/2, possibly none, and the trace only
+    continues past them when every child ran.
+    """
+    if tree.operator is None:
+        return 0.0 if tree.label is None else 1.0
+    lengths = [expected_trace_length(child) for child in tree.children]
+    op = tree.operator
+    if op is Operator.XOR:
+        return sum(lengths) / len(lengths)
+    if op is Operator.LOOP:
+        # do (redo do)^k with P(k) = 2^-(k+1), so E[k] = 1
+        return 2 * lengths[0] + lengths[1]
+    if op is Operator.OR:
+        return 0.5 * sum(lengths) / (1.0 - 0.5 ** len(lengths))
+    return sum(lengths)
+
+
+def expected_objects(ctx, num_traces, trace_length, scope="trace", window=1000, skew=0.0):
+    """
+    Expected objects per type and event-to-object links of a log.
+
+    Every event picks `min(T, K)` of the `K` object types and `N` objects
+    per picked type (the triangular parameters), each reusing a pooled
+    object with probability `reuse_object_probability`. How many picks are
+    new or repeated depends on the pool sizes, so the pool of one object
+    type is simulated over `_SIMULATED_EVENTS` events with the configured
+    sampler and `object_assignment`; types are symmetric, so the result
+    scales to all of them. With `scope` "global" the pool is kept across
+    traces and picks follow the `RingPool` of size `window` and `skew`;
+    per-trace pools are drawn from uniformly, so `skew` does not apply.
+
+    Returns:
+        tuple: `(objects_per_type, links)`, the case objects included.
+    """
+    sampler = make_sampler(ctx["params"], 0)
+    random, triangular_int = sampler.random, sampler.triangular_int
+    object_types = ctx["object_types"]
+    k = len(object_types)
+    p = ctx["reuse_prob"]
+    distinct = ctx["object_assignment"] == "distinct"
+
+    touched = sum(min(triangular_int(*ctx["object_types_per_event"]), k)
+                  for _ in range(_TRIANGLE_DRAWS)) / (_TRIANGLE_DRAWS * k)
+    exponent = 1.0 + (skew if scope == "global" else 0.0)
+    whole, fraction = divmod(trace_length, 1.0)
+    traces = max(min(num_traces, _SIMULATED_EVENTS // max(int(trace_length), 1)), 1)
+    new = links = pool = 0
+    for _ in range(traces):
+        if scope != "global":
+            pool = 0
+        for _ in range(int(whole) + (random() < fraction)):
+            if random() >= touched:
+                continue
+            n = triangular_int(*ctx["objects_per_type_per_event"])
+            size = min(pool, window) if scope == "global" else pool
+            if distinct:
+                created = n - min(sum(random() < p for _ in range(n)), size)
+                links += n
+            else:
+                created, picked = 0, set()
+                for _ in range(n):
+                    if random() < p and size:
+                        picked.add(int(size * random() ** exponent))
+                    else:
+                        created += 1
+                links += created + len(picked)
+            new += created
+            pool += created
+
+    objects_per_type = {ot: num_traces * new / traces for ot in object_types}
+    objects_per_type[ctx["case_type"]] = float(num_traces)
+    links = num_traces * trace_length + num_traces * k * links / traces
+    return objects_per_type, links
+
+
+def load_calibration(path=CALIBRATION_FILE):
+    """Runtime coefficients fitted by `runtime_experiments/calibrate_plan.py`, or the defaults."""
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return {**DEFAULT_CALIBRATION, **json.load(f)}
+    return dict(DEFAULT_CALIBRATION)
+
+
+def pilot_sizes(config, tree, pilot_traces=PILOT_TRACES):
+    """
+    Size model of every OCEL writer, measured on a pilot log.
+
+    Writes the first half and all of a `pilot_traces`-trace native
+    play-out of `tree` with each writer and fits the two file sizes, so
+    per-file overhead (headers, SQLite pages) is not extrapolated with the
+    log size. Entities are events, objects and event-to-object links.
+
+    Args:
+        config (dict): Configuration dictionary; `jobs` and the binary
+            cache are ignored for the pilot.
+        tree (ProcessTree): The config's process tree (see
+            `ocelgen.xes_generator.process_tree`).
+        pilot_traces (int): Traces in the pilot log.
+
+    Returns:
+        dict: `{output format: (fixed bytes, bytes per entity)}`.
+    """
+    seed = config.get("global_seed", 42)
+    keyed = config.get("rng_mode", "sequential") == "counter"
+    tree_params = config["process_tree_params"]
+    log = play_out_native(tree, pilot_traces, seed, keyed=keyed)
+    if timestamp_model(tree_params) == "synthetic":
+        stamp_activity_log(log, TimestampModel(tree_params, seed))
+    pilot_config = dict(config, jobs=None, ocel_binary_cache=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        traces = list(iter_ocel_events(pilot_config, log))
+    samples = [traces[:max(len(traces) // 2, 1)], traces]
+
+    sizes = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in OCEL_OUTPUT_FORMATS:
+            points = []
+            for i, sample in enumerate(samples):
+                path = os.path.join(tmp, f"pilot{i}.{fmt}")
+                writer = make_ocel_writer(dict(pilot_config, ocel_output_format=fmt, output_ocel_path=path))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    write_ocel(sample, writer)
+                entities = sum(len(trace.objects) + sum(1 + len(event["ocel:omap"]) for _, event in trace.events)
+                               for trace in sample)
+                points.append((entities, _disk_size(path)))
+            (e1, b1), (e2, b2) = points
+            per_entity = (b2 - b1) / (e2 - e1) if e2 > e1 else b2 / max(e2, 1)
+            sizes[fmt] = (max(b1 - per_entity * e1, 0.0), per_entity)
+    return sizes
+
+
+def _disk_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(path) for name in names)
+    return os.path.getsize(path)
+
+
+def _traces_for_target(target, ctx, trace_length, sizes, output_format, **reuse):
+    """Expected number of traces until the log reaches `target`."""
+    unit, size = target
+    reference = 1000
+    objects_per_type, links = expected_objects(ctx, reference, trace_length, **reuse)
+    if unit == "events":
+        per_trace = trace_length
+    elif unit == "objects":
+        per_trace = sum(objects_per_type.values()) / reference
+    else:
+        fixed, per_entity = sizes[output_format]
+        per_trace = per_entity * (trace_length + (sum(objects_per_type.values()) + links) / reference)
+        size -= fixed
+    if per_trace <= 0:
+        raise ValueError(f"Traces of this process tree hold no {unit}, target_size cannot be reached")
+    return max(math.ceil(size / per_trace), 1)
+
+
+def _frozen(value):
+    """A read-only copy of a JSON value: dicts become `MappingProxyType`s, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+def compile_plan(config, calibration=None, pilot_traces=PILOT_TRACES):
+    """
+    Validate a config and estimate the log it will produce, without generating it.
+
+    The process tree is generated (or taken from the tree cache) to get the
+    expected trace length; event and object counts follow from it and the
+    OCEL generation parameters (`expected_objects`). Output sizes come from
+    writing a `pilot_traces`-trace sample with every writer (0 skips this,
+    except for byte targets), runtimes from the calibration
+    (`load_calibration`). For a `target_size` config, the log size is the
+    expected number of traces needed to reach the target.
+
+    Args:
+        config (dict): Configuration dictionary loaded from a JSON file.
+        calibration (dict, optional): Runtime coefficients; by default
+            loaded from `plan_calibration_path` (or `CALIBRATION_FILE`).
+        pilot_traces (int): Traces written per output format to measure sizes.
+
+    Returns:
+        GenerationPlan: The frozen plan.
+
+    Raises:
+        ValueError: If the config is invalid (all problems are listed).
+    """
+    errors = validate_config(config)
+    if errors:
+        raise ValueError("Invalid config:\n  - " + "\n  - ".join(errors))
+    config = json.loads(json.dumps(config))  # detached copy
+    if calibration is None:
+        calibration = load_calibration(config.get("plan_calibration_path", CALIBRATION_FILE))
+
+    seed = config.get("global_seed", 42)
+    keyed = config.get("rng_mode", "sequential") == "counter"
+    tree_params = config["process_tree_params"]
+    params = config["ocel_generation_parameters"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        tree = process_tree(config, seed, Instrumentation("xes"), isolated=True)
+    trace_length = expected_trace_length(tree)
+
+    target = target_size(config)
+    output_format = config.get("ocel_output_format", "json")
+    if target is not None and target[0] == "bytes":
+        pilot_traces = pilot_traces or PILOT_TRACES
+    sizes = {}
+    if pilot_traces:
+        sizes = pilot_sizes(config, tree, pilot_traces if target else min(pilot_traces, tree_params["num_traces"]))
+
+    ctx = build_context(params, make_sampler(params, stream_seed(seed, "context") if keyed else seed), seed)
+    reuse = {
+        "scope": params.get("object_reuse_scope", "trace"),
+        "window": params.get("reuse_window", 1000),
+        "skew": params.get("reuse_skew", 0.0),
+    }
+    if target is None:
+        num_traces = tree_params["num_traces"]
+    else:
+        num_traces = _traces_for_target(target, ctx, trace_length, sizes, output_format, **reuse)
+    objects_per_type, links = expected_objects(ctx, num_traces, trace_length, **reuse)
+    events = num_traces * trace_length
+    objects = sum(objects_per_type.values())
+    entities = events + objects + links
+    bytes_per_format = {fmt: fixed + per_entity * entities for fmt, (fixed, per_entity) in sizes.items()}
+
+    engine = tree_params.get("playout_engine", "pm4py")
+    xes_seconds = calibration["xes_fixed_sec"] + calibration["xes_sec_per_event"] * ENGINE_SPEED[engine] * events
+    ocel_seconds = (calibration["ocel_fixed_sec"] + calibration["ocel_sec_per_event"] * events
+                    + calibration["ocel_sec_per_object"] * objects)
+    return GenerationPlan(
+        config=_frozen(config),
+        num_traces=num_traces,
+        engine=engine,
+        output_format=output_format,
+        mean_trace_length=trace_length,
+        events=events,
+        objects_per_type=MappingProxyType(objects_per_type),
+        objects=objects,
+        links=links,
+        bytes_per_format=MappingProxyType(bytes_per_format),
+        xes_seconds=xes_seconds,
+        ocel_seconds=ocel_seconds,
+        calibration=MappingProxyType(calibration),
+        target=target,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimate the size and runtime of an OCEL-Gen config.")
+    parser.add_argument("config", help="Path to the JSON config file")
+    parser.add_argument("--pilot", type=int, default=PILOT_TRACES, help="Traces written per format to measure sizes (0: skip)")
+    args = parser.parse_args()
+    with open(args.config, encoding="utf-8") as f:
+        plan = compile_plan(json.load(f), pilot_traces=args.pilot)
+    for line in format_plan(plan):
+        print(f"[PLAN] {line}")
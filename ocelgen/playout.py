@@ -0,0 +1,247 @@
+import random
+from array import array
+from datetime import datetime
+from pm4py.objects.log.obj import Event, EventLog, Trace
+from pm4py.objects.process_tree.obj import Operator
+from ocelgen.sampling import stream_seed
+from ocelgen.timestamps import format_timestamps, to_datetimes
+
+SILENT = -1  # marker appended for silent steps during play-out
+
+
+class ActivityLog:
+    """
+    Lightweight play-out result: one integer activity sequence per trace.
+
+    Activity codes index into `activities`. Compared to a PM4Py EventLog
+    there is no per-event object; `iter_traces` yields the same
+    `(trace_id, events)` tuples the converter builds from an EventLog, and
+    `to_event_log` materializes a full EventLog when an XES file is wanted.
+    Trace ids count from `offset`, so a log holding only trace k of a
+    larger log (see `play_out_native`) keeps that trace's id.
+
+    Synthetic event times (`ocelgen.timestamps`) are kept in `event_times`,
+    one int64 microsecond value per event with the traces concatenated;
+    without them every event carries the log's generation time
+    (`generated_at`, taken once when the log or play-out batch is created).
+    """
+
+    __slots__ = ("activities", "traces", "generated_at", "offset", "event_times")
+
+    FORMAT_BLOCK = 4096  # traces whose timestamps are formatted in one call
+
+    def __init__(self, activities, offset=0, generated_at=None):
+        self.activities = activities
+        self.offset = offset
+        self.traces = []
+        self.generated_at = generated_at if generated_at is not None else datetime.now()
+        self.event_times = None
+
+    def __len__(self):
+        return len(self.traces)
+
+    def append(self, sequence):
+        """Add a trace; an `array("H")` is stored as is, so traces may share one."""
+        if not isinstance(sequence, array):
+            sequence = array("H", sequence)
+        self.traces.append(sequence)
+
+    def extend(self, sequences):
+        """Add many `array("H")` traces at once (e.g. shared variant arrays)."""
+        self.traces.extend(sequences)
+
+    def iter_traces(self):
+        """Yield `(trace_id, events)` with events as `(activity, timestamp, attributes)` tuples."""
+        activities = self.activities
+        if self.event_times is not None:
+            yield from self._iter_timed_traces()
+            return
+        iso = self.generated_at.isoformat()
+        for i, sequence in enumerate(self.traces, self.offset):
+            yield str(i), [(activities[code], iso, {}) for code in sequence]
+
+    def _iter_timed_traces(self):
+        activities = self.activities
+        pos = 0
+        for block in range(0, len(self.traces), self.FORMAT_BLOCK):
+            sequences = self.traces[block:block + self.FORMAT_BLOCK]
+            n = sum(map(len, sequences))
+            isos = format_timestamps(self.event_times[pos:pos + n])
+            pos += n
+            j = 0
+            for i, sequence in enumerate(sequences, self.offset + block):
+                yield str(i), [(activities[code], iso, {}) for code, iso in zip(sequence, isos[j:j + len(sequence)])]
+                j += len(sequence)
+
+    def to_event_log(self):
+        """Build the equivalent, enriched PM4Py EventLog."""
+        log = EventLog()
+        times = iter(to_datetimes(self.event_times)) if self.event_times is not None else None
+        timestamp = self.generated_at
+        for i, sequence in enumerate(self.traces, self.offset):
+            trace = Trace()
+            trace.attributes["concept:name"] = str(i)
+            for code in sequence:
+                trace.append(Event({
+                    "concept:name": self.activities[code],
+                    "time:timestamp": timestamp if times is None else next(times),
+                    "lifecycle:transition": "complete",
+                }))
+            log.append(trace)
+        return log
+
+
+class ActivityLogStream:
+    """
+    Unbounded play-out result: `ActivityLog` batches, consumed one at a time.
+
+    Stands in for an `ActivityLog` in the converter (`iter_traces`,
+    `offset`), but only the current batch is held, and the consumer can
+    stop after any trace without the rest of the log being simulated.
+    """
+
+    offset = 0
+
+    def __init__(self, batches):
+        self.batches = batches
+
+    def iter_traces(self):
+        """Yield `(trace_id, events)` of every batch in turn."""
+        for log in self.batches:
+            yield from log.iter_traces()
+
+
+def compile_process_tree(tree):
+    """
+    Compile a PM4Py process tree into a play-out function.
+
+    Every node becomes a closure `run(rng, out)` that appends the activity
+    codes of one execution to `out`, so simulating a trace is a chain of
+    plain function calls with no tree inspection.
+
+    Supported operators: sequence, XOR, parallel (AND), OR, loop and
+    interleaving, plus silent steps. Semantics follow PM4Py's top-bottom
+    play-out, including silent steps taking part in parallel interleavings
+    (they are emitted as `SILENT` and dropped afterwards). OR executes a
+    non-empty random subset of its children in parallel.
+
+    Returns:
+        tuple: `(run, activities)` with `activities` the list of labels.
+    """
+    activities = []
+    codes = {}
+
+    def compile_node(node):
+        if node.operator is None:
+            if node.label is None:
+                return lambda rng, out: out.append(SILENT)
+            code = codes.get(node.label)
+            if code is None:
+                code = codes[node.label] = len(activities)
+                activities.append(node.label)
+            return lambda rng, out: out.append(code)
+
+        kids = [compile_node(child) for child in node.children]
+        op = node.operator
+
+        if op is Operator.SEQUENCE:
+            def run(rng, out):
+                for kid in kids:
+                    kid(rng, out)
+        elif op is Operator.XOR:
+            n = len(kids)
+
+            def run(rng, out):
+                kids[int(rng.random() * n)](rng, out)
+        elif op is Operator.LOOP:
+            do, redo = kids[0], kids[1]
+
+            def run(rng, out):
+                while True:
+                    do(rng, out)
+                    if rng.random() > 0.5:
+                        break
+                    redo(rng, out)
+        elif op is Operator.INTERLEAVING:
+            def run(rng, out):
+                for kid in rng.sample(kids, len(kids)):
+                    kid(rng, out)
+        elif op is Operator.PARALLEL:
+            def run(rng, out):
+                _interleave(rng, kids, out)
+        elif op is Operator.OR:
+            def run(rng, out):
+                chosen = []
+                while not chosen:
+                    chosen = [kid for kid in kids if rng.random() < 0.5]
+                _interleave(rng, chosen, out)
+        else:
+            raise ValueError(f"Unsupported process tree operator: {op}")
+        return run
+
+    return compile_node(tree), activities
+
+
+def _interleave(rng, kids, out):
+    """Run every branch and merge their sequences in a random order-preserving interleaving."""
+    branches, choices = [], []
+    for i, kid in enumerate(kids):
+        seq = []
+        kid(rng, seq)
+        branches.append(iter(seq))
+        choices.extend([i] * len(seq))
+    rng.shuffle(choices)
+    out.extend(next(branches[i]) for i in choices)
+
+
+def play_out_native(tree, num_traces, seed, keyed=False, start=0):
+    """
+    Simulate `num_traces` traces of `tree` with the compiled engine.
+
+    By default all traces draw from one random stream. With `keyed`, trace
+    i draws from its own stream `stream_seed(seed, "playout", i)`, so any
+    range of traces (e.g. the single trace `start`) is simulated exactly as
+    in the full log without simulating the traces before it.
+
+    Args:
+        tree (ProcessTree): Tree returned by `generate_process_tree`.
+        num_traces (int): Number of traces to simulate.
+        seed (int): Seed of the play-out's own random stream.
+        keyed (bool): Use one keyed stream per trace.
+        start (int): Index of the first trace (keyed play-out only).
+
+    Returns:
+        ActivityLog: The traces as integer activity sequences.
+    """
+    run, activities = compile_process_tree(tree)
+    return _play_out_batch(run, activities, random.Random(seed), seed, keyed, start, num_traces)
+
+
+def iter_play_out_native(tree, seed, keyed=False, batch_size=4096):
+    """
+    Simulate traces of `tree` with the compiled engine, `batch_size` at a time, without end.
+
+    The random stream continues across batches, so the first n traces are
+    those of `play_out_native(tree, n, seed, keyed)` however the stream is cut.
+
+    Yields:
+        ActivityLog: The next `batch_size` traces, with their `offset` in the log.
+    """
+    run, activities = compile_process_tree(tree)
+    rng = random.Random(seed)
+    start = 0
+    while True:
+        yield _play_out_batch(run, activities, rng, seed, keyed, start, batch_size)
+        start += batch_size
+
+
+def _play_out_batch(run, activities, rng, seed, keyed, start, num_traces):
+    log = ActivityLog(activities, offset=start)
+    traces = log.traces
+    for i in range(start, start + num_traces):
+        if keyed:
+            rng = random.Random(stream_seed(seed, "playout", i))
+        out = []
+        run(rng, out)
+        traces.append(array("H", [code for code in out if code != SILENT]))
+    return log
@@ -0,0 +1,254 @@
+import math
+import random
+
+import numpy as np
+
+
+def derive_seed(seed, *keys):
+    """
+    Derive an independent, reproducible seed for a sub-stream of `seed`.
+
+    Used to give every trace its own random stream (`derive_seed(seed, trace_idx)`)
+    so traces can be converted in any order or process.
+    """
+    return int(np.random.SeedSequence([seed, *keys]).generate_state(1)[0])
+
+
+# Purposes of the keyed streams of `"rng_mode": "counter"`
+STREAM_PURPOSES = {
+    "context": 0,   # log-wide draws (number of object types)
+    "playout": 1,   # control flow of a trace
+    "objects": 2,   # objects, attributes and event-to-object links of a trace
+    "arrivals": 3,  # case inter-arrival times
+    "durations": 4, # event durations
+    "activities": 5,  # mean duration per activity
+}
+
+RNG_MODES = ("sequential", "counter")
+
+
+def stream_seed(seed, purpose, index=0):
+    """
+    Seed of the random stream keyed on `(seed, purpose, index)`.
+
+    The stream of trace `index` depends on nothing but its key, so a trace
+    can be regenerated on its own, in any order, process or thread.
+    """
+    return derive_seed(seed, STREAM_PURPOSES[purpose], index)
+
+
+def counter_uniforms(seed, purpose, *counters):
+    """
+    Counter-based uniforms in [0, 1): one per element of the broadcast `counters`.
+
+    Each value is a SplitMix64 hash of `(seed, purpose, *counters)`, so
+    drawing the value for e.g. `(trace, event)` costs the same for any
+    position and needs no generator state. Vectorized over NumPy arrays.
+    """
+    key = np.random.SeedSequence([seed, STREAM_PURPOSES[purpose]]).generate_state(1, np.uint64)[0]
+    x = np.full(np.broadcast(*counters).shape, key, dtype=np.uint64)
+    with np.errstate(over="ignore"):  # wrapping is intended (scalars would warn)
+        for counter in counters:
+            x = _splitmix64(x + np.asarray(counter, dtype=np.uint64) * _GOLDEN_GAMMA)
+    return (x >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _splitmix64(x):
+    """SplitMix64 finalizer on a uint64 array (wrapping arithmetic)."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def rng_mode(config):
+    """The config's `rng_mode`, validated ("sequential" by default)."""
+    mode = config.get("rng_mode", "sequential")
+    if mode not in RNG_MODES:
+        raise ValueError(f"Unknown rng_mode '{mode}', expected one of {list(RNG_MODES)}")
+    return mode
+
+
+def triangular_int_quantile(u, low, mode, high):
+    """
+    Inverse CDF of the triangular distribution on [low, high] peaking at `mode`, truncated to int.
+
+    The `"triangular_parameterization": "min_mode_max"` reading of the
+    `(min, mode, max)` config triples. `u` is a uniform in [0, 1) or a NumPy
+    array of them (one value each). `mode` is clipped to the range, which
+    callers may narrow below it (`object_types_per_event_max` is capped at
+    the number of object types); an empty or single-point range gives `low`.
+    """
+    if high <= low:
+        return np.full(np.shape(u), int(low), dtype=np.int64) if isinstance(u, np.ndarray) else int(low)
+    c = (min(max(mode, low), high) - low) / (high - low)
+    if isinstance(u, np.ndarray):
+        values = np.where(
+            u <= c,
+            low + (high - low) * np.sqrt(u * c),
+            high - (high - low) * np.sqrt((1.0 - u) * (1.0 - c)),
+        )
+        return values.astype(np.int64)
+    if u <= c:
+        return int(low + (high - low) * math.sqrt(u * c))
+    return int(high - (high - low) * math.sqrt((1.0 - u) * (1.0 - c)))
+
+
+def legacy_triangular_int_quantile(u, low, mode, high):
+    """
+    `int(random.triangular(low, mode, high))` for the uniform `u`.
+
+    The default `"triangular_parameterization": "legacy"`, the draw of the
+    original generator. `random.triangular` takes `(low, high, mode)`, so
+    the config's mode is passed as the upper bound and its max as the peak;
+    this reproduces that arithmetic exactly, for a scalar or a NumPy array
+    of uniforms.
+    """
+    if mode == low:  # random.triangular's ZeroDivisionError case
+        return np.full(np.shape(u), int(low), dtype=np.int64) if isinstance(u, np.ndarray) else int(low)
+    c = (high - low) / (mode - low)
+    if isinstance(u, np.ndarray):
+        with np.errstate(invalid="ignore"):  # c may lie outside [0, 1]; the unused branch can be NaN
+            values = np.where(
+                u > c,
+                mode + (low - mode) * np.sqrt((1.0 - u) * (1.0 - c)),
+                low + (mode - low) * np.sqrt(u * c),
+            )
+        return values.astype(np.int64)
+    if u > c:
+        return int(mode + (low - mode) * math.sqrt((1.0 - u) * (1.0 - c)))
+    return int(low + (mode - low) * math.sqrt(u * c))
+
+
+TRIANGULAR_PARAMETERIZATIONS = {
+    "legacy": legacy_triangular_int_quantile,
+    "min_mode_max": triangular_int_quantile,
+}
+
+
+def triangular_quantile(params):
+    """
+    The triangular inverse CDF selected by `triangular_parameterization`.
+
+    Args:
+        params (dict): The `ocel_generation_parameters` section of the config.
+    """
+    name = params.get("triangular_parameterization", "legacy")
+    if name not in TRIANGULAR_PARAMETERIZATIONS:
+        raise ValueError(f"Unknown triangular_parameterization '{name}', "
+                         f"expected one of {list(TRIANGULAR_PARAMETERIZATIONS)}")
+    return TRIANGULAR_PARAMETERIZATIONS[name]
+
+
+class ScalarSampler:
+    """
+    Draws every value with its own call into a `random.Random` instance.
+
+    This is the original behaviour of the converter: it consumes the same
+    uniforms as before the sampling engine existed, and with the default
+    `legacy_triangular_int_quantile` draws the same values.
+    """
+
+    def __init__(self, seed, quantile=legacy_triangular_int_quantile):
+        self.rng = random.Random(seed)
+        self.quantile = quantile
+
+    def triangular_int(self, low, mode, high):
+        return self.quantile(self.rng.random(), low, mode, high)
+
+    def random(self):
+        return self.rng.random()
+
+    def choice(self, seq):
+        return self.rng.choice(seq)
+
+    def sample(self, seq, k):
+        return self.rng.sample(seq, k)
+
+    def randint(self, a, b):
+        return self.rng.randint(a, b)
+
+
+class NumpySampler:
+    """
+    Pre-draws values in vectorized blocks from a seeded `numpy.random.Generator`.
+
+    Every distinct distribution (triangular parameters, randint range, plain
+    uniforms) gets its own buffer that is refilled `block_size` values at a
+    time, so the per-event cost is a list lookup instead of a Python-level
+    RNG call. Output is reproducible for a given seed and follows the same
+    distributions (the same triangular `quantile`), but the values differ
+    from `ScalarSampler`'s.
+    """
+
+    def __init__(self, seed, block_size=4096, quantile=legacy_triangular_int_quantile):
+        self.rng = np.random.default_rng(seed)
+        self.block_size = block_size
+        self.quantile = quantile
+        self._streams = {}
+        self._uniforms = self._stream(self.rng.random)
+
+    def _stream(self, draw):
+        """Endless iterator over Python scalars, refilled a block at a time."""
+        while True:
+            yield from draw(self.block_size).tolist()
+
+    def triangular_int(self, low, mode, high):
+        key = ("triangular", low, mode, high)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = self._stream(
+                lambda size: self.quantile(self.rng.random(size), low, mode, high)
+            )
+        return next(stream)
+
+    def random(self):
+        return next(self._uniforms)
+
+    def choice(self, seq):
+        return seq[int(next(self._uniforms) * len(seq))]
+
+    def sample(self, seq, k):
+        # Partial Fisher-Yates shuffle driven by the pre-drawn uniforms
+        pool = list(seq)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative")
+        for i in range(k):
+            j = i + int(next(self._uniforms) * (n - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def randint(self, a, b):
+        key = ("randint", a, b)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = self._stream(
+                lambda size: self.rng.integers(a, b + 1, size)
+            )
+        return next(stream)
+
+
+SAMPLING_MODES = {
+    "scalar": ScalarSampler,
+    "numpy": NumpySampler,
+}
+
+
+def make_sampler(params, seed):
+    """
+    Build the sampler selected by `sampling_mode` in the OCEL generation parameters.
+
+    Args:
+        params (dict): The `ocel_generation_parameters` section of the config.
+        seed (int): The config's `global_seed`.
+    """
+    mode = params.get("sampling_mode", "scalar")
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling_mode '{mode}', expected one of {sorted(SAMPLING_MODES)}")
+    quantile = triangular_quantile(params)
+    if mode == "numpy":
+        return NumpySampler(seed, block_size=params.get("sampling_block_size", 4096), quantile=quantile)
+    return ScalarSampler(seed, quantile=quantile)
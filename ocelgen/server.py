@@ -0,0 +1,235 @@
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import socketserver
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ocelgen.pipeline import run_pipeline
+from ocelgen.plan import compile_plan, format_plan
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TIMEOUT = 3600.0  # seconds a request may wait for its worker
+_POLL_SEC = 1.0  # how often a waiting request checks for dead workers
+
+# Tiny log generated once per worker so imports, compiled code paths and caches are hot
+WARMUP_CONFIG = {
+    "global_seed": 1,
+    "tree_cache_size": 0,
+    "process_tree_params": {
+        "min": 4, "mode": 6, "max": 8,
+        "sequence": 0.5, "choice": 0.2, "parallel": 0.2, "loop": 0.1,
+        "silent": 0.0, "lt_dependency": 0.0, "duplicate": 0.0, "or": 0.0,
+        "num_traces": 5,
+    },
+    "ocel_generation_parameters": {
+        "object_types_min": 1, "object_types_mode": 2, "object_types_max": 3,
+        "object_types_per_event_min": 1, "object_types_per_event_mode": 1, "object_types_per_event_max": 2,
+        "objects_per_type_per_event_min": 1, "objects_per_type_per_event_mode": 1, "objects_per_type_per_event_max": 2,
+        "reuse_object_probability": 0.5,
+        "case_object_type": "ProcessCase",
+    },
+}
+
+
+def _worker_init(quiet, warmup, ready):
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)  # workers replaced after start-up would inherit `_interrupt`
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+    with tempfile.TemporaryDirectory() as tmp:
+        config = dict(WARMUP_CONFIG, output_ocel_path=os.path.join(tmp, "warmup.jsonocel"))
+        for _ in range(warmup):
+            run_pipeline(config)
+    ready.release()
+
+
+def _generate(config):
+    """Worker: generate one log; failures are returned, not raised."""
+    # Pool workers cannot start their own pool; any N >= 1 gives the same log
+    if config.get("jobs"):
+        config = dict(config, jobs=1)
+    t0 = time.perf_counter()
+    try:
+        reports = run_pipeline(config)
+    except Exception as e:
+        return {"status": "failed", "error": f"{type(e).__name__}: {e}", "client_error": isinstance(e, (KeyError, ValueError))}
+    result = {
+        "status": "ok",
+        "output_ocel_path": config["output_ocel_path"],
+        "runtime_sec": round(time.perf_counter() - t0, 4),
+        "reports": reports,
+        "worker": os.getpid(),
+    }
+    if config.get("write_xes", False):
+        result["xes_log_path"] = config["xes_log_path"]
+    return result
+
+
+def _plan(config):
+    """Worker: compile the plan of a config (see `ocelgen.plan`)."""
+    try:
+        plan = compile_plan(config)
+    except Exception as e:
+        return {"status": "failed", "error": f"{type(e).__name__}: {e}", "client_error": isinstance(e, (KeyError, ValueError))}
+    return {
+        "status": "ok",
+        "summary": format_plan(plan),
+        "num_traces": plan.num_traces,
+        "events": plan.events,
+        "objects": plan.objects,
+        "links": plan.links,
+        "bytes_per_format": dict(plan.bytes_per_format),
+        "xes_seconds": plan.xes_seconds,
+        "ocel_seconds": plan.ocel_seconds,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON API: `GET /health`, `POST /generate` and `POST /plan` with a config as body."""
+
+    routes = {"/generate": _generate, "/plan": _plan}
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self._send(404, {"status": "failed", "error": f"Unknown path: {self.path}"})
+        self._send(200, {"status": "ok", "workers": self.server.jobs, "pid": os.getpid()})
+
+    def do_POST(self):
+        worker = self.routes.get(self.path)
+        if worker is None:
+            return self._send(404, {"status": "failed", "error": f"Unknown path: {self.path}"})
+        try:
+            config = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as e:  # also bad UTF-8 and a bad Content-Length
+            return self._send(400, {"status": "failed", "error": f"Invalid JSON: {e}"})
+        if not isinstance(config, dict):
+            return self._send(400, {"status": "failed", "error": f"Expected a config object, got {type(config).__name__}"})
+        result = _wait(self.server.pool, self.server.pool.apply_async(worker, (config,)), self.server.request_timeout)
+        if result is None:
+            return self._send(503, {"status": "failed", "error": "No result: the worker timed out or died"})
+        status = 200 if result["status"] == "ok" else 400 if result.pop("client_error") else 500
+        self._send(status, result)
+        print(f"[INFO] {self.path} -> {result['status']}"
+              + (f" in {result['runtime_sec']}s: {result['output_ocel_path']}" if "runtime_sec" in result else ""))
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # requests are reported by do_POST
+
+
+def _wait(pool, result, timeout):
+    """
+    The value of the `AsyncResult` `result`, or None after `timeout` seconds
+    or if a pool worker dies first.
+
+    A worker killed mid-task (out of memory, a signal) loses the task, and
+    `multiprocessing.Pool` replaces the worker without ever completing it.
+    The workers running at submission are polled, so such a request fails
+    instead of blocking its thread forever. A death fails every request in
+    flight at that time, since the pool does not tell which task was lost.
+    """
+    workers = list(pool._pool)
+    deadline = time.monotonic() + timeout
+    while not result.ready():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or any(worker.exitcode is not None for worker in workers):
+            return None
+        result.wait(min(remaining, _POLL_SEC))
+    return result.get()
+
+
+def _interrupt(signum, frame):
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)  # a second SIGTERM ends the process at once
+    raise KeyboardInterrupt
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, jobs=1, warmup=1, quiet=True,
+          timeout=DEFAULT_TIMEOUT):
+    """
+    Serve log generation from a pool of warm worker processes until interrupted.
+
+    Every worker imports PM4Py and generates `warmup` tiny logs once at
+    start-up, before the server starts listening, so a request only pays
+    for its own generation. Requests are handled concurrently, up to `jobs`
+    at a time; each worker keeps its process tree cache across requests.
+    Relative paths in a config are resolved against the server's working
+    directory (`ocelgen.client` sends absolute ones).
+
+    Endpoints (JSON in and out):
+        GET /health: `{"status", "workers", "pid"}`.
+        POST /generate: Body is a config. Returns `{"status",
+            "output_ocel_path", "runtime_sec", "reports", "worker"}` (plus
+            `xes_log_path` with `write_xes`), or `{"status": "failed",
+            "error"}` with HTTP 400 (invalid JSON or config) or 500.
+        POST /plan: Body is a config. Returns the `ocelgen.plan` estimates.
+
+    A request whose worker takes longer than `timeout` seconds, or dies,
+    gets HTTP 503. A timed-out task keeps its worker busy until it ends.
+
+    Args:
+        host (str): Interface to listen on; only local addresses are meant to be used.
+        port (int): TCP port.
+        socket_path (str, optional): Listen on this Unix socket instead of TCP.
+        jobs (int): Worker processes.
+        warmup (int): Warm-up generations per worker.
+        quiet (bool): Silence the generator output of the workers.
+        timeout (float): Seconds a request waits for its worker.
+    """
+    ready = multiprocessing.Semaphore(0)
+    pool = multiprocessing.Pool(jobs, initializer=_worker_init, initargs=(quiet, warmup, ready))
+    t0 = time.perf_counter()
+    for _ in range(jobs):
+        ready.acquire()
+    print(f"[INFO] {jobs} worker(s) warmed up in {time.perf_counter() - t0:.2f}s")
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = _UnixHTTPServer(socket_path, _Handler)
+        address = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+        address = f"http://{host}:{server.server_address[1]}"
+    server.pool = pool
+    server.jobs = jobs
+    server.request_timeout = timeout
+    signal.signal(signal.SIGTERM, _interrupt)  # shut down cleanly when terminated, too
+    print(f"[INFO] Serving OCEL-Gen on {address} with {jobs} worker(s)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[INFO] Shutting down...")
+    finally:
+        server.server_close()
+        pool.terminate()
+        pool.join()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve OCEL log generation from warm worker processes.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument("--socket", default=None, help="Listen on this Unix socket instead of TCP")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--warmup", type=int, default=1, help="Warm-up generations per worker")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds a request waits for its worker")
+    parser.add_argument("--verbose", action="store_true", help="Show the generator output of every log")
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.socket, args.jobs, args.warmup, quiet=not args.verbose, timeout=args.timeout)
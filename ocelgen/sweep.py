@@ -0,0 +1,240 @@
+import copy
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from ocelgen.instrumentation import make_instrumentation, peak_rss_mb, reset_peak_rss
+from ocelgen.pipeline import run_pipeline
+from ocelgen.plan import target_size
+from ocelgen.xes_generator import generate_xes_log
+from ocelgen.xes_to_ocel_converter import convert_xes_to_ocel
+
+PHASES = ("xes", "ocel")
+
+
+def deep_merge(base, overrides):
+    """Return a copy of `base` with the nested dict `overrides` merged in."""
+    merged = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def sweep_points(spec):
+    """
+    Expand a sweep spec into `(log_id, level, config)` points.
+
+    A spec is a dict with:
+        parameter (str): Name of the swept column in the results CSV.
+        levels (list): Values of the swept parameter.
+        repetitions (int): Logs generated per level.
+        base_config (dict): Config shared by all points.
+        overrides (callable): `level -> dict` merged into the base config.
+        seed_base (int): Point `i` (1-based, across all levels) uses seed `seed_base + i`.
+        output_dir (str): Directory for the generated logs and their configs.
+        results_file (str): CSV written by `run_sweep`.
+    """
+    points = []
+    log_index = 1
+    for level in spec["levels"]:
+        for _ in range(spec["repetitions"]):
+            log_id = f"log_{log_index:04}"
+            config = deep_merge(spec["base_config"], spec["overrides"](level))
+            config["global_seed"] = spec["seed_base"] + log_index
+            config["xes_log_path"] = os.path.join(spec["output_dir"], f"{log_id}.xes")
+            config["output_ocel_path"] = os.path.join(spec["output_dir"], f"{log_id}.jsonocel")
+            points.append((log_id, level, config))
+            log_index += 1
+    return points
+
+
+def _measure(fn):
+    """Run `fn` and return its result with wall time, CPU time and peak RSS."""
+    reset_peak_rss()
+    wall0, cpu0 = time.perf_counter_ns(), time.process_time_ns()
+    result = fn()
+    wall, cpu = time.perf_counter_ns() - wall0, time.process_time_ns() - cpu0
+    return result, {"runtime_sec": wall / 1e9, "cpu_sec": cpu / 1e9, "peak_rss_mb": peak_rss_mb()}
+
+
+def run_point(config, handoff="memory", memory=False):
+    """
+    Generate one log and measure both phases.
+
+    With `memory=True` the log is generated a second time with allocation
+    tracing, which adds `<phase>_tracemalloc_peak_mb` without inflating the
+    timings of the first run.
+
+    Returns:
+        dict: `<phase>_runtime_sec`, `<phase>_cpu_sec` and `<phase>_peak_rss_mb`
+        for the `xes` and `ocel` phases, plus `<phase>_<span>_sec` for every
+        instrumentation span. Without a resettable high-water mark (non-Linux)
+        the RSS peak is the process-wide maximum so far.
+
+        A `target_size` config runs through `ocelgen.pipeline.run_pipeline`,
+        whose phases are interleaved: the runtimes are its per-phase
+        `runtime_sec`, while the CPU time and RSS peak of the whole run are
+        reported for the `ocel` phase only.
+    """
+    config = dict(config, write_xes=handoff == "disk")
+    if target_size(config) is not None:
+        if handoff == "disk":
+            raise ValueError("target_size needs the in-memory hand-off (no write_xes)")
+        reports, run = _measure(lambda: run_pipeline(config))
+        xes_report, ocel_report = reports["xes"], reports["ocel"]
+        xes = {"runtime_sec": xes_report["runtime_sec"]}
+        ocel = dict(run, runtime_sec=ocel_report["runtime_sec"])
+    else:
+        (xes_log, xes_report), xes = _measure(lambda: generate_xes_log(config))
+        if handoff == "disk":
+            ocel_report, ocel = _measure(lambda: convert_xes_to_ocel(config))
+        else:
+            ocel_report, ocel = _measure(lambda: convert_xes_to_ocel(config, xes_log=xes_log))
+    metrics = {}
+    for phase, values in zip(PHASES, (xes, ocel)):
+        for name, value in values.items():
+            metrics[f"{phase}_{name}"] = round(value, 6)
+    for phase, report in zip(PHASES, (xes_report, ocel_report)):
+        for name, seconds in report["spans"].items():
+            metrics[f"{phase}_{name}_sec"] = round(seconds, 6)
+    if memory:
+        metrics.update(_memory_pass(config, handoff))
+    return metrics
+
+
+def _memory_pass(config, handoff):
+    """Regenerate a log under tracemalloc and return the per-phase traced peaks in MiB."""
+    config = dict(config, memory_profile=True, tree_cache_size=0)
+    if target_size(config) is not None:
+        reports = run_pipeline(config)
+        return {
+            f"{phase}_tracemalloc_peak_mb": round(reports[phase]["memory"]["tracemalloc_peak_mb"], 6)
+            for phase in PHASES
+        }
+    xes_instr = make_instrumentation("xes", config)
+    ocel_instr = make_instrumentation("ocel", config)
+    tracemalloc.start()
+    try:
+        xes_log, xes_report = generate_xes_log(config, xes_instr)
+        ocel_report = convert_xes_to_ocel(
+            config, xes_log=None if handoff == "disk" else xes_log, instrumentation=ocel_instr
+        )
+    finally:
+        tracemalloc.stop()
+    return {
+        f"{phase}_tracemalloc_peak_mb": round(report["memory"]["tracemalloc_peak_mb"], 6)
+        for phase, report in zip(PHASES, (xes_report, ocel_report))
+    }
+
+
+def _warm_up(config, handoff, runs, memory=False):
+    """Run throwaway generations so imports and caches are hot before measuring."""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = dict(config, xes_log_path=os.path.join(tmp, "warmup.xes"),
+                      output_ocel_path=os.path.join(tmp, "warmup.jsonocel"), tree_cache_size=0)
+        for _ in range(runs):
+            run_point(config, handoff, memory)
+
+
+def _worker_init(config, handoff, runs, quiet, memory):
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+    _warm_up(config, handoff, runs, memory)
+
+
+def _run_task(task):
+    log_id, level, config, handoff, memory = task
+    try:
+        return log_id, level, run_point(config, handoff, memory), None
+    except Exception as e:
+        return log_id, level, None, f"{type(e).__name__}: {e}"
+
+
+def run_sweep(spec, jobs=None, warmup=1, handoff="memory", quiet=True, memory=False):
+    """
+    Run every point of a sweep spec (see `sweep_points`) and write the results CSV.
+
+    Points run in a pool of `jobs` worker processes (default: all cores).
+    Each worker first performs `warmup` unmeasured runs. The CSV keeps the
+    `log_id, <parameter>, xes_runtime_sec, ocel_runtime_sec` layout read by
+    `experiments_summary.plot_runtime_summary`, followed by CPU time and
+    peak RSS per phase and the instrumentation spans.
+
+    Args:
+        spec (dict): The sweep spec.
+        jobs (int, optional): Worker processes; 1 runs in-process.
+        warmup (int): Unmeasured runs per worker.
+        handoff (str): "memory" (in-memory XES hand-off) or "disk" (write and re-import XES).
+        quiet (bool): Silence the generator output of the measured runs.
+        memory (bool): Add tracemalloc peaks per phase (see `run_point`).
+
+    Returns:
+        list: One result row per successful point.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    points = sweep_points(spec)
+    config_dir = os.path.join(spec["output_dir"], "configs")
+    os.makedirs(config_dir, exist_ok=True)
+    for log_id, _, config in points:
+        config["write_xes"] = handoff == "disk"
+        with open(os.path.join(config_dir, f"{log_id}.json"), "w") as f:
+            json.dump(config, f, indent=2)
+
+    parameter = spec["parameter"]
+    header = ["log_id", parameter] + [f"{p}_runtime_sec" for p in PHASES] + [
+        f"{p}_{m}" for m in ("cpu_sec", "peak_rss_mb") for p in PHASES
+    ] + ([f"{p}_tracemalloc_peak_mb" for p in PHASES] if memory else []) + ["xes_handoff", "playout_engine"]
+
+    tasks = []
+    for log_id, level, config in points:
+        if jobs > 1 and config.get("jobs"):
+            # Pool workers cannot start their own pool; any N >= 1 gives the same log
+            config = dict(config, jobs=1)
+        tasks.append((log_id, level, config, handoff, memory))
+    init_args = (tasks[0][2], handoff, warmup, quiet, memory)
+    print(f"[INFO] Sweep '{parameter}': {len(tasks)} logs, {jobs} job(s), {warmup} warm-up run(s) per worker")
+
+    rows = []
+    if jobs > 1:
+        with multiprocessing.Pool(jobs, initializer=_worker_init, initargs=init_args) as pool:
+            results = list(pool.imap(_run_task, tasks))
+    else:
+        stdout = sys.stdout
+        try:
+            _worker_init(*init_args)
+            results = [_run_task(task) for task in tasks]
+        finally:
+            if sys.stdout is not stdout:
+                sys.stdout.close()
+                sys.stdout = stdout
+
+    for (log_id, level, metrics, error), (_, _, config) in zip(results, points):
+        if error:
+            print(f"[ERROR] {log_id} failed: {error}")
+            continue
+        engine = config["process_tree_params"].get("playout_engine", "pm4py")
+        rows.append({"log_id": log_id, parameter: level, **metrics,
+                     "xes_handoff": handoff, "playout_engine": engine})
+        print(f"[DONE] {log_id}: {parameter}={level}, "
+              f"XES={metrics['xes_runtime_sec']:.4f}s, OCEL={metrics['ocel_runtime_sec']:.4f}s")
+
+    spans = sorted({key for row in rows for key in row} - set(header))
+    header = header[:-2] + spans + header[-2:]
+
+    results_file = spec["results_file"]
+    results_dir = os.path.dirname(results_file)
+    if results_dir:
+        os.makedirs(results_dir, exist_ok=True)
+    with open(results_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=header)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"[DONE] Runtime results saved to: {results_file}")
+    return rows
@@ -0,0 +1,137 @@
+import random
+import numpy as np
+from ocelgen.instrumentation import Instrumentation, format_spans
+from ocelgen.ocel_writer import make_ocel_writer
+from ocelgen.plan import PILOT_TRACES, expected_trace_length, pilot_sizes, target_size
+from ocelgen.playout import ActivityLogStream, iter_play_out_native
+from ocelgen.sampling import rng_mode
+from ocelgen.timestamps import TimestampModel, stamp_activity_log, timestamp_model
+from ocelgen.xes_generator import process_tree
+from ocelgen.xes_to_ocel_converter import iter_ocel_events, write_ocel
+
+TARGET_BATCH_SIZE = 4096  # traces played out ahead of the conversion
+
+
+def generate_to_target(config, xes_instrumentation=None, ocel_instrumentation=None):
+    """
+    Generate an OCEL log of a target size instead of a fixed number of traces.
+
+    Traces are played out in batches of `target_batch_size` (default
+    4096), converted and written one at a time, and generation stops after
+    the first trace that brings the log to `target_size` (see
+    `ocelgen.plan.target_size`). Nothing past that trace is converted, and
+    at most one batch is played out ahead.
+
+    Event and object targets count the entities written. Byte targets use
+    the bytes the writer has written, for writers that count them (JSON,
+    JSON lines). The log holds whole traces, so in these cases it
+    overshoots the target by less than one trace. The other writers only
+    produce their file in `finalize`, so the target is converted into an
+    entity budget with the size model of a `PILOT_TRACES`-trace pilot
+    (`ocelgen.plan`). Their file can then overshoot or undershoot the byte
+    target by the pilot's estimation error, which is not bounded by one
+    trace.
+
+    The log equals the fixed-size log of the same config with `num_traces`
+    set to the number of traces written. This needs the native engine,
+    and the sequential conversion (no `jobs`); the XES log is never held,
+    so `write_xes` is not supported.
+
+    Args:
+        config (dict): Configuration dictionary with `target_size`.
+        xes_instrumentation (Instrumentation, optional): Receives the
+            `tree_generation`, `playout` and `timestamp_enrichment` spans.
+        ocel_instrumentation (Instrumentation, optional): Receives the
+            `object_sampling` (which includes the play-out) and `ocel_write` spans.
+
+    Returns:
+        dict: The span reports of both phases, keyed "xes" and "ocel".
+    """
+    target = target_size(config)
+    if target is None:
+        raise ValueError("generate_to_target needs a config with target_size")
+    engine = config["process_tree_params"].get("playout_engine", "pm4py")
+    if engine != "native":
+        raise ValueError(f"target_size requires playout_engine 'native', got '{engine}'")
+    if config.get("jobs"):
+        raise ValueError("target_size needs the sequential conversion (no jobs)")
+    if config.get("write_xes", False):
+        print("[WARN] write_xes is not supported with target_size; no XES log is written")
+    xes_instrumentation = xes_instrumentation or Instrumentation("xes")
+    ocel_instrumentation = ocel_instrumentation or Instrumentation("ocel")
+
+    seed = config.get("global_seed", 42)
+    keyed = rng_mode(config) == "counter"
+    if not keyed:
+        random.seed(seed)
+        np.random.seed(seed)
+    print("[INFO] Generating process tree...")
+    with xes_instrumentation.span("tree_generation"):
+        tree = process_tree(config, seed, xes_instrumentation, isolated=keyed)
+
+    unit, size = target
+    if unit == "events" and expected_trace_length(tree) == 0:
+        raise ValueError("The process tree only has silent steps, target_size in events cannot be reached")
+    writer = make_ocel_writer(config)
+    measured = unit == "bytes" and getattr(writer, "bytes_written", None) is not None
+    if unit == "bytes" and not measured:
+        output_format = config.get("ocel_output_format", "json")
+        fixed, per_entity = pilot_sizes(config, tree, PILOT_TRACES)[output_format]
+        size = (size - fixed) / per_entity
+        print(f"[INFO] Byte target: ~{size:,.0f} entities at {per_entity:.1f} bytes each")
+
+    print(f"[INFO] Generating traces until the log reaches {target[1]:,} {unit}...")
+    log = ActivityLogStream(_stamped_batches(
+        tree, config, seed, keyed, config.get("target_batch_size", TARGET_BATCH_SIZE), xes_instrumentation
+    ))
+    counters = {}
+    stream = _until_target(iter_ocel_events(config, log, counters), unit, size, writer if measured else None)
+    summary = write_ocel(stream, writer, ocel_instrumentation)
+
+    print(f"[DONE] OCEL log saved to: {config['output_ocel_path']}")
+    print(f"[STATS] Traces: {counters['traces']}, Events: {writer.num_events}, Objects: {writer.num_objects}")
+    print(f"[STATS] Object Types: {len(summary.object_types)}")
+    for name, n in counters.items():
+        ocel_instrumentation.count(name, n)
+    ocel_instrumentation.count("events", writer.num_events)
+    ocel_instrumentation.count("objects", writer.num_objects)
+    reports = {"xes": xes_instrumentation.report(), "ocel": ocel_instrumentation.report()}
+    for phase, report in reports.items():
+        print(f"[STATS] {phase.upper()} time: {format_spans(report)}")
+    return reports
+
+
+def _stamped_batches(tree, config, seed, keyed, batch_size, instrumentation):
+    """Play out `ActivityLog` batches without end, with synthetic timestamps if configured."""
+    tree_params = config["process_tree_params"]
+    model = TimestampModel(tree_params, seed) if timestamp_model(tree_params) == "synthetic" else None
+    batches = iter_play_out_native(tree, seed, keyed=keyed, batch_size=batch_size)
+    offset = 0
+    while True:
+        with instrumentation.span("playout"):
+            log = next(batches)
+        if model is not None:
+            with instrumentation.span("timestamp_enrichment"):
+                offset = stamp_activity_log(log, model, offset=offset)
+        instrumentation.count("simulated_traces", len(log))
+        yield log
+
+
+def _until_target(stream, unit, size, writer=None):
+    """
+    Pass `OcelTrace`s through until the log holds `size` events, objects or
+    entities ("bytes"), or the `writer` has written `size` bytes.
+    """
+    total = 0
+    for trace in stream:
+        yield trace
+        if writer is not None:
+            total = writer.bytes_written
+        elif unit == "events":
+            total += len(trace.events)
+        elif unit == "objects":
+            total += len(trace.objects)
+        else:
+            total += len(trace.objects) + sum(1 + len(event["ocel:omap"]) for _, event in trace.events)
+        if total >= size:
+            return
@@ -0,0 +1,148 @@
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+from ocelgen.sampling import counter_uniforms
+
+TIMESTAMP_MODELS = ("synthetic", "wallclock")
+
+EPOCH = np.datetime64(0, "us")
+MICROSECONDS = 1_000_000
+_PREFIX_CHUNK = 1 << 20  # inter-arrival times summed per step when skipping to a trace
+
+
+class TimestampModel:
+    """
+    Synthetic event times: Poisson case arrivals plus per-activity durations.
+
+    Cases arrive with exponential inter-arrival times (mean
+    `case_interarrival_sec`) after `timestamp_start`. Every activity gets
+    a mean duration between 0.2 and 1.8 times `activity_duration_sec`,
+    and each event completes an exponential duration with that mean after
+    the previous event of its case.
+
+    All draws are counter-based (`counter_uniforms` keyed on the trace
+    index, event position or activity label) and rounded to whole
+    microseconds, so the times of trace k are the same whether it is
+    computed in a batch or on its own, and sums are exact.
+    """
+
+    def __init__(self, tree_params, seed):
+        start = datetime.fromisoformat(tree_params.get("timestamp_start", "2025-01-01T00:00:00"))
+        self.start_us = int((np.datetime64(start, "us") - EPOCH) // np.timedelta64(1, "us"))
+        self.interarrival_us = tree_params.get("case_interarrival_sec", 600) * MICROSECONDS
+        self.duration_us = tree_params.get("activity_duration_sec", 1800) * MICROSECONDS
+        self.seed = seed
+
+    def _exponential_us(self, mean_us, purpose, *counters):
+        u = counter_uniforms(self.seed, purpose, *counters)
+        return np.rint(-np.log1p(-u) * mean_us).astype(np.int64)
+
+    def interarrivals(self, start, n):
+        """Inter-arrival times (µs) of traces `start .. start + n - 1`."""
+        return self._exponential_us(self.interarrival_us, "arrivals", np.arange(start, start + n))
+
+    def arrival_offset(self, start):
+        """Sum of the inter-arrival times of the traces before `start`."""
+        total = 0
+        for chunk in range(0, start, _PREFIX_CHUNK):
+            total += int(self.interarrivals(chunk, min(_PREFIX_CHUNK, start - chunk)).sum())
+        return total
+
+    def activity_means(self, labels):
+        """Mean duration (µs) of each activity label."""
+        keys = np.array([zlib.crc32(label.encode("utf-8")) for label in labels], dtype=np.uint64)
+        return self.duration_us * (0.2 + 1.6 * counter_uniforms(self.seed, "activities", keys))
+
+    def event_times(self, start, lengths, codes, means, offset=None):
+        """
+        Completion times (µs since the epoch) of the events of a batch of traces.
+
+        Args:
+            start (int): Index of the batch's first trace in the log.
+            lengths (np.ndarray): Number of events per trace.
+            codes (np.ndarray): Activity code of every event, traces concatenated.
+            means (np.ndarray): Mean duration per activity code (`activity_means`).
+            offset (int, optional): `arrival_offset(start)`, if already known.
+
+        Returns:
+            tuple: `(times, offset)`, the int64 event times and the arrival
+            offset of the trace after the batch.
+        """
+        if offset is None:
+            offset = self.arrival_offset(start)
+        steps = self.interarrivals(start, len(lengths))
+        arrivals = self.start_us + offset + np.cumsum(steps)
+
+        first = np.cumsum(lengths) - lengths  # position of each trace's first event
+        trace_idx = np.repeat(np.arange(start, start + len(lengths)), lengths)
+        position = np.arange(len(codes)) - np.repeat(first, lengths)
+        u = counter_uniforms(self.seed, "durations", trace_idx, position)
+        durations = np.rint(-np.log1p(-u) * means[codes]).astype(np.int64)
+        elapsed = np.cumsum(durations)
+        elapsed -= np.repeat(np.concatenate(([0], elapsed))[first], lengths)
+        return np.repeat(arrivals, lengths) + elapsed, offset + int(steps.sum())
+
+
+def format_timestamps(times):
+    """
+    ISO 8601 strings of int64 µs times, formatted in bulk by NumPy.
+
+    Same format as `datetime.isoformat()`, which the PM4Py and wallclock
+    paths use: microseconds are left out when they are zero.
+    """
+    datetimes = times.astype("datetime64[us]")
+    strings = np.datetime_as_string(datetimes, unit="us")
+    whole = times % 1_000_000 == 0
+    if whole.any():
+        strings[whole] = np.datetime_as_string(datetimes[whole], unit="s")
+    return strings.tolist()
+
+
+def to_datetimes(times):
+    """Naive `datetime` objects of int64 µs times."""
+    return times.astype("datetime64[us]").tolist()
+
+
+def timestamp_model(tree_params):
+    """The validated `timestamp_model` of the process tree parameters ("synthetic" by default)."""
+    model = tree_params.get("timestamp_model", "synthetic")
+    if model not in TIMESTAMP_MODELS:
+        raise ValueError(f"Unknown timestamp_model '{model}', expected one of {list(TIMESTAMP_MODELS)}")
+    return model
+
+
+def stamp_activity_log(log, model, batch_size=65536, offset=None):
+    """
+    Set `log.event_times` of an `ActivityLog`, `batch_size` traces per vectorized step.
+
+    Returns the arrival offset of the trace after the log; pass it as
+    `offset` when stamping the next batch of a longer log.
+    """
+    means = model.activity_means(log.activities)
+    lengths = np.fromiter(map(len, log.traces), dtype=np.int64, count=len(log.traces))
+    times = np.empty(int(lengths.sum()), dtype=np.int64)
+    pos = 0
+    for start in range(0, len(log.traces), batch_size):
+        sequences = log.traces[start:start + batch_size]
+        codes = np.concatenate([np.frombuffer(seq, dtype=np.uint16) for seq in sequences]).astype(np.intp)
+        batch, offset = model.event_times(log.offset + start, lengths[start:start + batch_size], codes, means, offset)
+        times[pos:pos + len(batch)] = batch
+        pos += len(batch)
+    log.event_times = times
+    return offset
+
+
+def stamp_event_log(log, model):
+    """Set `time:timestamp` of every event of a PM4Py `EventLog`."""
+    labels, codes = {}, []
+    for trace in log:
+        for event in trace:
+            codes.append(labels.setdefault(event["concept:name"], len(labels)))
+    lengths = np.fromiter(map(len, log), dtype=np.int64, count=len(log))
+    times, _ = model.event_times(0, lengths, np.array(codes, dtype=np.intp), model.activity_means(list(labels)))
+    stamps = iter(to_datetimes(times))
+    for trace in log:
+        for event in trace:
+            event["time:timestamp"] = next(stamps)
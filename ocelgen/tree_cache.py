@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import pickle
+import random
+from collections import OrderedDict
+
+import numpy as np
+import pm4py
+
+# Process tree parameters that influence the generated tree (num_traces etc. do not)
+TREE_PARAM_KEYS = (
+    "min", "mode", "max", "sequence", "choice", "parallel", "loop",
+    "silent", "lt_dependency", "duplicate", "or",
+)
+# Bumped when the entry layout or the stored RNG states change, invalidating on-disk entries
+CACHE_FORMAT = 2
+
+
+def tree_cache_key(tree_params, seed):
+    """Content hash of everything that determines the generated tree."""
+    payload = {
+        "params": {k: tree_params[k] for k in TREE_PARAM_KEYS},
+        "seed": seed,
+        "pm4py": pm4py.__version__,
+        "format": CACHE_FORMAT,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class TreeCache:
+    """
+    LRU cache of generated process trees, in memory and optionally on disk.
+
+    An entry holds the pickled tree together with the `random` and NumPy
+    global RNG states right after the tree was generated. Restoring them on
+    a hit makes the following play-out draw exactly what it would have
+    drawn after generating the tree, so cached and uncached runs are
+    identical. Every hit unpickles a fresh tree, since PM4Py's play-out
+    may reorder a tree's children in place.
+
+    Callers that generate trees from isolated RNGs (see
+    `ocelgen.xes_generator.process_tree`) pass the post-generation states
+    to `put` explicitly and skip the restore on `get`, so a cached entry
+    always holds the states of a freshly seeded generation.
+
+    Args:
+        max_entries (int): Maximum number of trees kept in memory.
+        cache_dir (str, optional): Directory for a persistent on-disk copy.
+    """
+
+    def __init__(self, max_entries=32, cache_dir=None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _remember(self, key, blob):
+        self._entries[key] = blob
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key, restore_rng=True):
+        """Return the cached tree (restoring the RNG states unless `restore_rng` is False) or None."""
+        blob = self._entries.get(key)
+        if blob is not None:
+            self._entries.move_to_end(key)
+        elif self.cache_dir and os.path.exists(self._path(key)):
+            with open(self._path(key), "rb") as f:
+                blob = f.read()
+            self._remember(key, blob)
+
+        if blob is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        tree, random_state, np_state = pickle.loads(blob)
+        if restore_rng:
+            random.setstate(random_state)
+            np.random.set_state(np_state)
+        return tree
+
+    def put(self, key, tree, rng_state=None):
+        """
+        Store `tree` with the RNG states right after generating it.
+
+        `rng_state` is a `(random state, NumPy state)` pair; by default the
+        current global states are taken (call right after generating it).
+        """
+        if rng_state is None:
+            rng_state = (random.getstate(), np.random.get_state())
+        blob = pickle.dumps((tree, *rng_state))
+        self._remember(key, blob)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, self._path(key))
+
+
+_caches = {}
+
+
+def get_tree_cache(config):
+    """
+    Process-wide cache configured by `tree_cache_size` / `tree_cache_dir`.
+
+    Returns None when `tree_cache_size` is 0.
+    """
+    size = config.get("tree_cache_size", 32)
+    cache_dir = config.get("tree_cache_dir")
+    if not size:
+        return None
+    cache = _caches.get(cache_dir)
+    if cache is None:
+        cache = _caches[cache_dir] = TreeCache(size, cache_dir)
+    cache.max_entries = size
+    return cache
@@ -0,0 +1,128 @@
+import random
+from array import array
+
+import numpy as np
+
+from ocelgen.playout import SILENT, ActivityLog, compile_process_tree
+
+
+class AliasTable:
+    """
+    Vose alias table for O(1) sampling from a discrete distribution.
+
+    Args:
+        weights (list): Non-negative weights, one per outcome.
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding error; prob/alias already say "keep"
+
+    def sample(self, rng, size):
+        """Draw `size` outcome indices with a `numpy.random.Generator`."""
+        n = len(self.prob)
+        slots = rng.integers(0, n, size)
+        keep = rng.random(size) < self.prob[slots]
+        return np.where(keep, slots, self.alias[slots])
+
+
+def play_out_variants(tree, num_traces, seed, max_simulated=10000, tolerance=0.01, batch_size=1000):
+    """
+    Generate a log by estimating the tree's variant distribution and sampling from it.
+
+    Traces are simulated with the compiled play-out engine in batches until
+    the Good-Turing estimate of the unseen probability mass (share of
+    traces whose variant was observed exactly once) drops to `tolerance`,
+    or `max_simulated` traces have been played out. The simulated traces
+    open the log; the remaining ones are drawn from the observed variant
+    frequencies with an alias table. Traces of the same variant share one
+    activity array.
+
+    If the estimate has not converged within `max_simulated` traces (e.g.
+    a tree where almost every trace is unique), sampling would only repeat
+    the variants seen so far, so the remaining traces are simulated instead.
+
+    Args:
+        tree (ProcessTree): Tree returned by `generate_process_tree`.
+        num_traces (int): Number of traces in the log.
+        seed (int): Seed for both the play-out and the variant sampling.
+        max_simulated (int): Upper bound on traces played out for the estimate.
+        tolerance (float): Target unseen probability mass.
+        batch_size (int): Traces simulated between convergence checks.
+
+    Returns:
+        tuple: `(ActivityLog, stats)` with `stats` holding `simulated`,
+        `variants`, `unseen_mass`, `converged` and `last_batch_shift` (total
+        variation distance between the estimates before and after the last
+        batch).
+    """
+    run, activities = compile_process_tree(tree)
+    rng = random.Random(seed)
+    log = ActivityLog(activities)
+
+    variant_index = {}  # tuple(sequence) -> variant id
+    variants, counts = [], []
+    simulated, unseen_mass, shift = 0, 1.0, 1.0
+    budget = min(num_traces, max_simulated)
+
+    while simulated < budget:
+        previous = counts[:]
+        for _ in range(min(batch_size, budget - simulated)):
+            out = []
+            run(rng, out)
+            key = tuple(code for code in out if code != SILENT)
+            vid = variant_index.get(key)
+            if vid is None:
+                vid = variant_index[key] = len(variants)
+                variants.append(array("H", key))
+                counts.append(0)
+            counts[vid] += 1
+            log.append(variants[vid])
+            simulated += 1
+
+        singletons = sum(1 for c in counts if c == 1)
+        unseen_mass = singletons / simulated
+        prev_total = sum(previous)
+        shift = 0.5 * sum(
+            abs(c / simulated - (previous[i] / prev_total if prev_total and i < len(previous) else 0.0))
+            for i, c in enumerate(counts)
+        )
+        # At least two batches, so the shift compares two real estimates
+        if unseen_mass <= tolerance and simulated >= 2 * batch_size:
+            break
+
+    converged = unseen_mass <= tolerance
+    remaining = num_traces - simulated
+    if remaining > 0 and converged:
+        table = AliasTable(counts)
+        np_rng = np.random.default_rng(seed)
+        log.extend(map(variants.__getitem__, table.sample(np_rng, remaining).tolist()))
+    elif remaining > 0:
+        print(f"[WARN] Variant distribution did not converge (unseen mass {unseen_mass:.4f} "
+              f"> {tolerance}); simulating the remaining {remaining} traces")
+        for _ in range(remaining):
+            out = []
+            run(rng, out)
+            log.append([code for code in out if code != SILENT])
+
+    stats = {
+        "simulated": simulated,
+        "variants": len(variants),
+        "unseen_mass": unseen_mass,
+        "converged": converged,
+        "last_batch_shift": shift,
+    }
+    return log, stats
@@ -1,27 +1,237 @@
 import json
 import random
 import os
+import time
 from datetime import datetime
+import numpy as np
 from pm4py import generate_process_tree, write_xes
 from pm4py.sim import play_out
+from ocelgen.instrumentation import Instrumentation, format_memory, format_spans, make_instrumentation
+from ocelgen.playout import play_out_native
+from ocelgen.sampling import rng_mode
+from ocelgen.timestamps import TimestampModel, stamp_activity_log, stamp_event_log, timestamp_model
+from ocelgen.tree_cache import get_tree_cache, tree_cache_key
+from ocelgen.variants import play_out_variants
 
 
-def generate_xes_log(config: dict):
+def generate_xes_log(config: dict, instrumentation=None):
     """
     Generate a synthetic XES log using PM4Py’s Process Tree simulator.
 
+    The log is returned in memory so it can be handed to `convert_xes_to_ocel`
+    directly. Writing it to `xes_log_path` is an opt-in side output enabled
+    with `"write_xes": true` in the config.
+
+    `process_tree_params.playout_engine` selects the simulator: "pm4py"
+    (default) or "native", ocelgen's compiled play-out engine, which returns
+    a lightweight `ActivityLog` of integer activity sequences instead.
+    "variants" plays out only until the variant distribution has converged
+    (`variant_sample_max`, `variant_tolerance`) and samples the remaining
+    traces from it, which makes very large `num_traces` cheap.
+
+    Generated trees are cached per (tree parameters, seed), see
+    `ocelgen.tree_cache`; `tree_cache_size` (0 disables) and
+    `tree_cache_dir` (persistent copy) control the cache.
+
+    Event times follow `process_tree_params.timestamp_model`: "synthetic"
+    (default) draws Poisson case arrivals (`case_interarrival_sec` after
+    `timestamp_start`) and per-activity durations (`activity_duration_sec`)
+    as NumPy arrays, deterministic under `global_seed`; "wallclock" stamps
+    events with the time they were generated.
+
+    Tree generation, play-out, timestamp enrichment and the XES write are
+    timed as spans of an `ocelgen.instrumentation.Instrumentation`; the
+    sink is chosen with `instrumentation_sink` unless one is passed in.
+
+    `"rng_mode": "counter"` (native engine only) plays out every trace
+    from its own stream keyed on `(global_seed, "playout", trace index)`
+    and leaves the global `random`/NumPy state untouched, so single traces
+    can be regenerated with `generate_trace`.
+
     Args:
         config (dict): Configuration dictionary loaded from a JSON file.
+        instrumentation (Instrumentation, optional): Collector for spans and counters.
+
+    Returns:
+        tuple: `(log, report)`, the simulated and enriched `EventLog` or
+        `ActivityLog` and the phase's span report.
     """
 
-    # For reproducibility 
-    random.seed(config.get("global_seed", 42))
+    own_instrumentation = instrumentation is None
+    if own_instrumentation:
+        instrumentation = make_instrumentation("xes", config)
+
+    seed = config.get("global_seed", 42)
+    keyed = _check_rng_mode(config)
+    if not keyed:
+        # For reproducibility (PM4Py's tree generator also draws from NumPy's global RNG)
+        random.seed(seed)
+        np.random.seed(seed)
 
     tree_params = config["process_tree_params"]
-    xes_file = config["xes_log_path"]
+    synthetic_times = timestamp_model(tree_params) == "synthetic"
+
+    print("[INFO] Generating process tree...")
+    with instrumentation.span("tree_generation"):
+        tree = process_tree(config, seed, instrumentation, isolated=keyed)
+
+    engine = tree_params.get("playout_engine", "pm4py")
+    print(f"[INFO] Simulating event log ({engine} play-out)...")
+    if engine == "native":
+        with instrumentation.span("playout"):
+            log = play_out_native(tree, tree_params["num_traces"], seed, keyed=keyed)
+    elif engine == "variants":
+        with instrumentation.span("playout"):
+            log, stats = play_out_variants(
+                tree, tree_params["num_traces"], seed,
+                max_simulated=tree_params.get("variant_sample_max", 10000),
+                tolerance=tree_params.get("variant_tolerance", 0.01)
+            )
+        instrumentation.count("variants", stats["variants"])
+        instrumentation.count("simulated_traces", stats["simulated"])
+        print(f"[STATS] Variants: {stats['variants']} distinct in {stats['simulated']} simulated traces, "
+              f"unseen mass {stats['unseen_mass']:.4f}, last batch shift {stats['last_batch_shift']:.4f}")
+    elif engine == "pm4py":
+        with instrumentation.span("playout"):
+            log = play_out(tree, parameters={"num_traces": tree_params["num_traces"]})
+
+        # Enrich events with attributes
+        with instrumentation.span("timestamp_enrichment"):
+            for i, trace in enumerate(log):
+                trace.attributes['concept:name'] = str(i)  # trace ID as string
+                for event in trace:
+                    if not synthetic_times:
+                        event["time:timestamp"] = datetime.now()
+                    event["lifecycle:transition"] = "complete"
+            if synthetic_times:
+                stamp_event_log(log, TimestampModel(tree_params, seed))
+    else:
+        raise ValueError(f"Unknown playout_engine '{engine}', expected 'pm4py', 'native' or 'variants'")
+
+    if synthetic_times and engine != "pm4py":
+        with instrumentation.span("timestamp_enrichment"):
+            stamp_activity_log(log, TimestampModel(tree_params, seed))
+
+    instrumentation.count("traces", len(log))
+    if config.get("write_xes", False):
+        xes_file = config["xes_log_path"]
+        xes_dir = os.path.dirname(xes_file)
+        if xes_dir:
+            os.makedirs(xes_dir, exist_ok=True)
+
+        with instrumentation.span("xes_write"):
+            write_xes(log if engine == "pm4py" else log.to_event_log(), xes_file)
+        print(f"[DONE] XES log saved to: {xes_file}")
+
+    report = instrumentation.report()
+    if own_instrumentation:
+        instrumentation.sink.close()
+    print(f"[STATS] Time: {format_spans(report)}")
+    if "memory" in report:
+        print(f"[STATS] Memory: {format_memory(report)}")
+    return log, report
+
+
+def generate_trace(config: dict, trace_index: int):
+    """
+    Regenerate trace `trace_index` of a `"rng_mode": "counter"` log on its own.
+
+    Only the process tree (usually a cache hit) and the requested trace are
+    simulated; the activity sequence and synthetic timestamps equal those
+    in the full log.
+
+    Args:
+        config (dict): Configuration the full log was generated with.
+        trace_index (int): Position of the trace in the log.
+
+    Returns:
+        ActivityLog: A log holding just that trace, with its original trace id.
+    """
+    if not _check_rng_mode(config):
+        raise ValueError("generate_trace requires \"rng_mode\": \"counter\"")
+    seed = config.get("global_seed", 42)
+    tree = process_tree(config, seed, Instrumentation("xes"), isolated=True)
+    log = play_out_native(tree, 1, seed, keyed=True, start=trace_index)
+    if timestamp_model(config["process_tree_params"]) == "synthetic":
+        stamp_activity_log(log, TimestampModel(config["process_tree_params"], seed))
+    return log
 
-    print("[INFO] Generating process tree...")  
-    tree = generate_process_tree(parameters={
+
+def _check_rng_mode(config):
+    """Whether the config uses keyed (counter) streams; these need the native engine."""
+    if rng_mode(config) != "counter":
+        return False
+    engine = config["process_tree_params"].get("playout_engine", "pm4py")
+    if engine != "native":
+        raise ValueError(f"rng_mode 'counter' requires playout_engine 'native', got '{engine}'")
+    return True
+
+
+def process_tree(config, seed, instrumentation, isolated=False):
+    """
+    Look up the process tree of a config in the tree cache, generating it on a miss.
+
+    PM4Py's generator draws from the global RNGs. Without `isolated` the
+    caller has seeded them and the play-out continues from them, as in
+    `generate_xes_log`. With `isolated` they are seeded for the generation
+    only and restored afterwards; the cache then stores the states right
+    after the seeded generation, which are the ones a later sequential run
+    must continue from, and a hit leaves the caller's states alone.
+
+    Args:
+        config (dict): Configuration dictionary (`process_tree_params`,
+            `tree_cache_size`, `tree_cache_dir`).
+        seed (int): The config's `global_seed`.
+        instrumentation (Instrumentation): Receives the cache hit/miss counters.
+        isolated (bool): Leave the global `random`/NumPy state untouched.
+
+    Returns:
+        ProcessTree: The tree, a fresh copy on cache hits.
+    """
+    tree_params = config["process_tree_params"]
+    cache = get_tree_cache(config)
+    if cache is None:
+        return _isolated_tree(tree_params, seed)[0] if isolated else _generate_tree(tree_params)
+
+    t0 = time.perf_counter()
+    key = tree_cache_key(tree_params, seed)
+    tree = cache.get(key, restore_rng=not isolated)
+    hit = tree is not None
+    if not hit:
+        if isolated:
+            tree, rng_state = _isolated_tree(tree_params, seed)
+            cache.put(key, tree, rng_state)
+        else:
+            tree = _generate_tree(tree_params)
+            cache.put(key, tree)
+    instrumentation.count("tree_cache_hits" if hit else "tree_cache_misses")
+    print(f"[INFO] Process tree cache {'hit' if hit else 'miss'} in {time.perf_counter() - t0:.4f}s "
+          f"({cache.hits} hits / {cache.misses} misses)")
+    return tree
+
+
+def _isolated_tree(tree_params: dict, seed):
+    """
+    Generate a tree from freshly seeded global RNGs, restoring their previous state.
+
+    Returns:
+        tuple: `(tree, rng_state)`, with the `(random, NumPy)` states right
+        after the generation, before the previous ones were restored.
+    """
+    state, np_state = random.getstate(), np.random.get_state()
+    random.seed(seed)
+    np.random.seed(seed)
+    try:
+        tree = _generate_tree(tree_params)
+        return tree, (random.getstate(), np.random.get_state())
+    finally:
+        random.setstate(state)
+        np.random.set_state(np_state)
+
+
+def _generate_tree(tree_params: dict):
+    """Generate a process tree with PM4Py's tree generator."""
+    return generate_process_tree(parameters={
         "min": tree_params["min"],
         "max": tree_params["max"],
         "mode": tree_params["mode"],
@@ -35,20 +245,3 @@ def generate_xes_log(config: dict):
         "or": tree_params["or"],
         "no_models": 1
     })
-
-    print("[INFO] Simulating event log...")
-    log = play_out(tree, parameters={"num_traces": tree_params["num_traces"]})
-
-    # Enrich events with attributes
-    for i, trace in enumerate(log):
-        trace.attributes['concept:name'] = str(i)  # trace ID as string
-        for event in trace:
-            event["time:timestamp"] = datetime.now()  
-            event["lifecycle:transition"] = "complete"
-
-    xes_dir = os.path.dirname(xes_file)
-    if xes_dir:
-        os.makedirs(xes_dir, exist_ok=True)
-
-    write_xes(log, xes_file)
-    print(f"[DONE] XES log saved to: {xes_file}")
@@ -1,172 +1,597 @@
-import os
-import json
-import random
+import multiprocessing
+from collections import namedtuple
+from array import array
 from datetime import datetime
-from collections import defaultdict
 from pm4py.objects.log.importer.xes import importer as xes_importer
+from ocelgen.attributes import ATTRIBUTE_VALUES, AttributeEngine, HashedAttributes, LazyAttributes
+from ocelgen.instrumentation import Instrumentation, format_memory, format_spans, make_instrumentation
+from ocelgen.object_assignment import OBJECT_ASSIGNMENTS, ObjectAssigner
+from ocelgen.object_store import ObjectStore, RingPool
+from ocelgen.ocel_writer import make_ocel_writer, redirect_progress
+from ocelgen.playout import ActivityLog, ActivityLogStream
+from ocelgen.sampling import derive_seed, make_sampler, rng_mode, stream_seed
+from ocelgen.xes_generator import generate_trace
 
 
-def convert_xes_to_ocel(config):
+OcelTrace = namedtuple("OcelTrace", ["trace_id", "objects", "events"])
+OcelTrace.__doc__ = """
+One converted trace: `objects` are the `(object_id, object)` pairs created
+in the trace and `events` its `(event_id, event)` pairs, both as OCEL 1.0
+entities (`{"ocel:type", "ocel:ovmap"}` / `{"ocel:activity",
+"ocel:timestamp", "ocel:omap", "ocel:vmap"}`).
+"""
+
+
+def iter_ocel_events(config, xes_log=None, counters=None):
+    """
+    Convert an XES log lazily, yielding one `OcelTrace` per trace.
+
+    By default objects are only reused within their trace, so each trace's
+    object pools (and its objects in the store) are dropped as soon as the
+    trace has been yielded; memory grows with the largest trace, not the log.
+    The stream can be drained into any OCEL writer with `write_ocel`.
+
+    With `"rng_mode": "counter"` trace k draws from the stream keyed on
+    `(global_seed, "objects", k)` and its object and event ids are scoped
+    to the trace (`<trace_id>/ot1_0001`, `<trace_id>/e1`), so every trace
+    is independent of the others; see `generate_ocel_trace`.
+
+    With `"object_reuse_scope": "global"` objects stay reusable across
+    traces: each object type keeps a `RingPool` of its `reuse_window`
+    (default 1000) most recent objects, drawn with `reuse_skew` (default 0,
+    uniform). Reused objects are re-registered in the current trace's
+    store under their OCEL id, so released traces still free their
+    objects. This needs the sequential conversion (no `jobs`, no counter
+    `rng_mode`), since traces depend on each other.
+
+    Args:
+        config (dict): Configuration dictionary loaded from a JSON file.
+        xes_log (EventLog | ActivityLog, optional): Log returned by
+            `generate_xes_log`. If omitted, the log is imported from `xes_log_path`.
+        counters (dict, optional): Receives the `traces`, `objects_new` and
+            `objects_reused` counts and the `object_store_peak_bytes` held
+            by the object store before a trace was released.
+
+    Yields:
+        OcelTrace: The trace's new objects and its events, in creation order.
+    """
+    params = config["ocel_generation_parameters"]
+    seed = config.get("global_seed", 42)
+    jobs = config.get("jobs")
+    keyed = rng_mode(config) == "counter"
+    sampler = make_sampler(params, stream_seed(seed, "context") if keyed else seed)
+    ctx = build_context(params, sampler, seed)
+    if counters is None:
+        counters = {}
+    for name in ("traces", "objects_new", "objects_reused"):
+        counters.setdefault(name, 0)
+
+    if xes_log is None:
+        xes_path = config["xes_log_path"]
+        print(f"[INFO] Loading XES log from: {xes_path}")
+        xes_log = xes_importer.apply(xes_path)
+
+    shared_pools = None
+    if params.get("object_reuse_scope", "trace") == "global":
+        if jobs or keyed:
+            raise ValueError("object_reuse_scope 'global' needs the sequential conversion (no jobs, rng_mode 'sequential')")
+        window, skew = params.get("reuse_window", 1000), params.get("reuse_skew", 0.0)
+        shared_pools = {ot: RingPool(window, skew) for ot in ctx["object_types"]}
+    elif params.get("object_reuse_scope", "trace") != "trace":
+        raise ValueError(f"Unknown object_reuse_scope '{params['object_reuse_scope']}', expected 'trace' or 'global'")
+
+    if keyed:
+        yield from _iter_keyed(ctx, xes_log, seed, jobs, counters)
+        return
+
+    store = _new_store(ctx)
+    emitter = _OcelEmitter(store, attributes=ctx["hashed_attributes"], counters=counters)
+
+    if jobs:
+        print(f"[INFO] Converting traces in {jobs} job(s)...")
+        yield from _iter_sharded(ctx, list(_iter_traces(xes_log)), seed, jobs, emitter, counters)
+        return
+
+    for trace_id, events in _iter_traces(xes_log):
+        _convert_trace(
+            ctx, sampler, store, trace_id, events, emitter.write_object, emitter.write_event, counters,
+            shared_pools
+        )
+        yield emitter.flush(trace_id)
+
+
+def generate_ocel_trace(config, trace_index):
+    """
+    Regenerate trace `trace_index` of a `"rng_mode": "counter"` log on its own.
+
+    The trace is played out and converted without touching any other
+    trace. Its activities, timestamps, objects, attributes and ids equal
+    those in the full log (timestamps only with the default synthetic
+    `timestamp_model`).
+
+    Args:
+        config (dict): Configuration the full log was generated with.
+        trace_index (int): Position of the trace in the log.
+
+    Returns:
+        OcelTrace: The trace's objects and events.
+    """
+    return next(iter_ocel_events(dict(config, jobs=None), generate_trace(config, trace_index)))
+
+
+def write_ocel(stream, writer, instrumentation=None):
+    """
+    Drain an `iter_ocel_events` stream into an OCEL writer and finalize it.
+
+    Any object with `write_object`, `write_event`, `finalize(global_log)`
+    and `close` works as a writer (see `ocelgen.ocel_writer`).
+
+    Args:
+        stream (iterable): `OcelTrace` items.
+        writer: The writer; it is closed afterwards.
+        instrumentation (Instrumentation, optional): Receives the
+            `object_sampling` and `ocel_write` spans.
+
+    Returns:
+        OcelLogSummary: Attribute names and object types seen in the stream.
+    """
+    if instrumentation is None:
+        instrumentation = Instrumentation("ocel")
+    summary = OcelLogSummary()
+    with writer:
+        with instrumentation.span("object_sampling"):
+            for trace in stream:
+                trace = _materialize(trace)
+                summary.add(trace)
+                for object_id, obj in trace.objects:
+                    writer.write_object(object_id, obj)
+                for event_id, event in trace.events:
+                    writer.write_event(event_id, event)
+        with instrumentation.span("ocel_write"):
+            writer.finalize(summary.global_log())
+    return summary
+
+
+class OcelLogSummary:
+    """Collects the `ocel:global-log` header from the streamed entities."""
+
+    def __init__(self):
+        self.event_attr_keys = set()
+        self.object_attr_keys = set()
+        self.object_types = set()
+
+    def add(self, trace):
+        for _, obj in trace.objects:
+            self.object_types.add(obj["ocel:type"])
+            self.object_attr_keys.update(obj["ocel:ovmap"])
+        for _, event in trace.events:
+            self.event_attr_keys.update(event["ocel:vmap"])
+
+    def global_log(self):
+        return {
+            "ocel:version": "1.0",
+            "ocel:ordering": "timestamp",
+            "ocel:attribute-names": sorted(self.event_attr_keys | {"activity", "timestamp"}),
+            "ocel:global-attribute-names": sorted(self.object_attr_keys),
+            "ocel:object-types": sorted(self.object_types)
+        }
+
+
+def convert_xes_to_ocel(config, xes_log=None, instrumentation=None):
     """
     Converts an XES event log into an Object-Centric Event Log (OCEL 1.0).
-    
+
+    Args:
+        config (dict): Configuration dictionary loaded from a JSON file.
+        xes_log (EventLog | ActivityLog, optional): Log returned by
+            `generate_xes_log`. If omitted, the log is imported from `xes_log_path`.
+        instrumentation (Instrumentation, optional): Collector for spans and
+            counters; by default one with the sink chosen by `instrumentation_sink`.
+
+    Returns:
+        dict: Span report with the `xes_import`, `object_sampling` (including
+        spooling the entities) and `ocel_write` spans and the `traces`,
+        `events`, `objects`, `objects_new`, `objects_reused` and
+        `object_store_peak_bytes` counters.
+
     Notes:
-        - Randomized object creation.
-        - Object attributes are generated synthetically.
+        - Randomized object creation. Counts and choices are drawn by the
+          sampler selected with `sampling_mode` ("scalar" or "numpy").
+        - Event and object attributes are generated synthetically by an
+          `ocelgen.attributes.AttributeEngine`; typed attributes are
+          declared with `event_attribute_schema`/`object_attribute_schema`.
+        - `"attribute_values": "hashed"` derives attribute values from
+          `(global_seed, entity id)`; `"lazy"` computes the same values only
+          when `write_ocel` hands the entity to the writer.
         - Output format follows OCEL 1.0 JSON spec.
+        - Events and objects are streamed to disk trace by trace (see
+          `iter_ocel_events`); set `"ocel_json_compact": true` to write
+          without indentation.
+        - `"ocel_output_format": "sqlite"` writes an OCEL 2.0-style SQLite
+          database instead of JSON (see `OcelSqliteWriter`).
+        - With `"jobs": N` traces are converted in N worker processes, each
+          trace drawing from its own seed stream derived from `global_seed`.
+          The output is identical for every N >= 1, but differs from the
+          default single-stream conversion, so setting `jobs` changes the
+          log (with `"rng_mode": "counter"` it does not).
+        - `"rng_mode": "counter"` keys every trace's stream on its index,
+          so any trace can be regenerated alone (`generate_ocel_trace`).
+        - With `output_ocel_path` "-" (JSONL to stdout) the progress lines
+          go to stderr.
     """
 
-    xes_path = config["xes_log_path"]
-    output_path = config["output_ocel_path"]
-    random.seed(config.get("global_seed", 42))
+    with redirect_progress(config):
+        own_instrumentation = instrumentation is None
+        if own_instrumentation:
+            instrumentation = make_instrumentation("ocel", config)
 
-    params = config["ocel_generation_parameters"]
+        output_path = config["output_ocel_path"]
+
+        if xes_log is None:
+            xes_path = config["xes_log_path"]
+            print(f"[INFO] Loading XES log from: {xes_path}")
+            with instrumentation.span("xes_import"):
+                xes_log = xes_importer.apply(xes_path)
+
+        writer = make_ocel_writer(config)
+        counters = {}
+        summary = write_ocel(iter_ocel_events(config, xes_log, counters), writer, instrumentation)
+
+        print(f"[DONE] OCEL log saved to: {output_path}")
+        print(f"[STATS] Events: {writer.num_events}, Objects: {writer.num_objects}")
+        print(f"[STATS] Object Types: {len(summary.object_types)}")
+        if "object_store_peak_bytes" in counters:
+            print(f"[STATS] Object store: peak {counters['object_store_peak_bytes'] / 1024:.1f} KiB")
+
+        for name, n in counters.items():
+            instrumentation.count(name, n)
+        instrumentation.count("events", writer.num_events)
+        instrumentation.count("objects", writer.num_objects)
+        report = instrumentation.report()
+        if own_instrumentation:
+            instrumentation.sink.close()
+        print(f"[STATS] Time: {format_spans(report)}")
+        if "memory" in report:
+            print(f"[STATS] Memory: {format_memory(report)}")
+        return report
+
+
+def _materialize(trace):
+    """Replace the `LazyAttributes` of a trace by plain dicts."""
+    objects = [
+        (object_id, {**obj, "ocel:ovmap": obj["ocel:ovmap"].materialize()})
+        if type(obj["ocel:ovmap"]) is LazyAttributes else (object_id, obj)
+        for object_id, obj in trace.objects
+    ]
+    events = [
+        (event_id, {**event, "ocel:vmap": event["ocel:vmap"].materialize()})
+        if type(event["ocel:vmap"]) is LazyAttributes else (event_id, event)
+        for event_id, event in trace.events
+    ]
+    return OcelTrace(trace.trace_id, objects, events)
+
+
+def build_context(params, sampler, seed):
+    """
+    Resolve the conversion parameters shared by every trace.
+
+    Draws the number of object types (the first draw of `sampler`) and
+    builds the attribute engines, so it also validates the enum settings
+    and attribute schemas of the parameters.
+
+    Args:
+        params (dict): The `ocel_generation_parameters` section of the config.
+        sampler: Sampler of the log-wide draws (see `ocelgen.sampling.make_sampler`).
+        seed (int): The config's `global_seed`, keying hashed attribute values.
+
+    Returns:
+        dict: The conversion context: `object_types`, `case_type`,
+        `reuse_prob`, `object_assignment`, the triangular parameters
+        `object_types_per_event`/`objects_per_type_per_event`, the
+        attribute engines and `hashed_attributes`.
+
+    Raises:
+        ValueError: On an unknown `attribute_values` or `object_assignment`.
+    """
 
     # --- Sample object type count ---
     ot_min = params["object_types_min"]
     ot_mode = params["object_types_mode"]
     ot_max = params["object_types_max"]
-    num_object_types = int(random.triangular(ot_min, ot_mode, ot_max))
+    num_object_types = sampler.triangular_int(ot_min, ot_mode, ot_max)
     object_types = [f"ot{i+1}" for i in range(num_object_types)]
 
-    # --- Sample event-to-object relationships ---
-    et_min = params["object_types_per_event_min"]
-    et_mode = params["object_types_per_event_mode"]
-    et_max = min(params["object_types_per_event_max"], num_object_types)
-
-    case_type = params["case_object_type"]
-    reuse_prob = params["reuse_object_probability"]
-    min_objs = params["objects_per_type_per_event_min"]
-    mode_objs = params["objects_per_type_per_event_mode"]
-    max_objs = params["objects_per_type_per_event_max"]
-
-    # --- Synthetic attribute sampling ---
-    event_attr_min = params.get("event_attributes_min", 0)
-    event_attr_mode = params.get("event_attributes_mode", 0)
-    event_attr_max = params.get("event_attributes_max", 0)
-
-    object_attr_min = params.get("object_attributes_min", 0)
-    object_attr_mode = params.get("object_attributes_mode", 0)
-    object_attr_max = params.get("object_attributes_max", 0)
-
-    # --- Internal bookkeeping ---
-    trace_objects = {}  # Keeps track of objects assigned per trace
-    ocel_objects = {}
-    ocel_events = {}
-    object_id_counters = defaultdict(int)
-    event_attr_keys = set()
-    object_attr_keys = set()
-    event_id = 1
-
-    def generate_synthetic_attributes(prefix, count):
-        """Create dummy attributes with random values."""
-        return {
-            f"{prefix}_attr{i+1}": f"{prefix}_val{random.randint(1, 999)}"
-            for i in range(count)
-        }
+    attribute_values = params.get("attribute_values", "sampled")
+    if attribute_values not in ATTRIBUTE_VALUES:
+        raise ValueError(f"Unknown attribute_values '{attribute_values}', expected one of {list(ATTRIBUTE_VALUES)}")
+    object_assignment = params.get("object_assignment", "draws")
+    if object_assignment not in OBJECT_ASSIGNMENTS:
+        raise ValueError(f"Unknown object_assignment '{object_assignment}', expected one of {list(OBJECT_ASSIGNMENTS)}")
+    event_attributes = AttributeEngine("event", params)
+    object_attributes = AttributeEngine("object", params)
 
-    print(f"[INFO] Loading XES log from: {xes_path}")
-    xes_log = xes_importer.apply(xes_path)
+    return {
+        "params": params,
+        "object_types": object_types,
+        "case_type": params["case_object_type"],
+        "reuse_prob": params["reuse_object_probability"],
+        "object_assignment": object_assignment,
+        # --- Event-to-object relationships ---
+        "object_types_per_event": (
+            params["object_types_per_event_min"],
+            params["object_types_per_event_mode"],
+            min(params["object_types_per_event_max"], num_object_types),
+        ),
+        "objects_per_type_per_event": (
+            params["objects_per_type_per_event_min"],
+            params["objects_per_type_per_event_mode"],
+            params["objects_per_type_per_event_max"],
+        ),
+        # --- Synthetic attribute sampling ---
+        "event_attributes": event_attributes,
+        "object_attributes": object_attributes,
+        # Set unless values are drawn from the trace's sampler
+        "hashed_attributes": None if attribute_values == "sampled" else HashedAttributes(
+            seed, event_attributes, object_attributes, lazy=attribute_values == "lazy"
+        ),
+    }
 
-    for trace_idx, trace in enumerate(xes_log):
-        trace_id = trace.attributes.get("concept:name", f"Trace_{trace_idx}")
-        trace_objects[trace_id] = {ot: [] for ot in object_types}
-        trace_objects[trace_id][case_type] = [trace_id]  # Always include the trace ID as case object
 
-        # --- Generate attributes for case-level object ---
-        case_attrs = generate_synthetic_attributes(
-            "object", int(random.triangular(object_attr_min, object_attr_mode, object_attr_max))
-        )
-        object_attr_keys.update(case_attrs.keys())
-        ocel_objects[trace_id] = {
-            "ocel:type": case_type,
-            "ocel:ovmap": case_attrs
-        }
+def _new_store(ctx):
+    """Object store with the context's types registered in a fixed order."""
+    store = ObjectStore()
+    for ot in ctx["object_types"]:
+        store.add_type(ot)
+    store.add_type(ctx["case_type"])
+    return store
+
 
+def _iter_traces(xes_log):
+    """Yield `(trace_id, events)` with events as `(activity, timestamp, attributes)` tuples."""
+    if isinstance(xes_log, (ActivityLog, ActivityLogStream)):
+        yield from xes_log.iter_traces()
+        return
+    for trace_idx, trace in enumerate(xes_log):
+        trace_id = trace.attributes.get("concept:name", f"Trace_{trace_idx}")
+        events = []
         for event_idx, event in enumerate(trace):
-            eid = f"e{event_id}"
             activity = event.get("concept:name", f"Activity_{event_idx}")
-            timestamp = event.get("time:timestamp", datetime.now()).isoformat()
-
-            omap = {case_type: [trace_id]}
-            flat_omap = [trace_id]
-
-            # --- Sample object types for this event ---
-            n_types = int(random.triangular(et_min, et_mode, et_max))
-            sampled_types = random.sample(object_types, min(n_types, len(object_types)))
-
-            for ot in sampled_types:
-                ids_for_event = []
-                n_objs = int(random.triangular(min_objs, mode_objs, max_objs))
-                pool = trace_objects[trace_id][ot]
-
-                for _ in range(n_objs):
-                    if random.random() < reuse_prob and pool:
-                        obj_id = random.choice(pool)
-                    else:
-                        object_id_counters[ot] += 1
-                        obj_id = f"{ot}_{object_id_counters[ot]:04d}"
-                        pool.append(obj_id)
-
-                        obj_attrs = generate_synthetic_attributes(
-                            "object", int(random.triangular(object_attr_min, object_attr_mode, object_attr_max))
-                        )
-                        object_attr_keys.update(obj_attrs.keys())
-
-                        ocel_objects[obj_id] = {
-                            "ocel:type": ot,
-                            "ocel:ovmap": obj_attrs
-                        }
-
-                    # Avoid duplicates in same event
-                    if obj_id not in ids_for_event:
-                        ids_for_event.append(obj_id)
-
-                if ids_for_event:
-                    omap[ot] = ids_for_event
-                    flat_omap.extend(ids_for_event)
-
-            # --- Merge original (XES) and new (OCEL) event attributes ---
+            timestamp = event.get("time:timestamp")
+            timestamp = (timestamp if timestamp is not None else datetime.now()).isoformat()
+            # Original (XES) event attributes, merged with the synthetic ones later
             attr_map = {
                 k: v for k, v in event.items()
                 if k not in {"concept:name", "time:timestamp", "lifecycle:transition"}
             }
-            event_attr_keys.update(attr_map.keys())
-
-            synthetic_attrs = generate_synthetic_attributes(
-                "event", int(random.triangular(event_attr_min, event_attr_mode, event_attr_max))
-            )
-            attr_map.update(synthetic_attrs)
-            event_attr_keys.update(synthetic_attrs.keys())
-
-            ocel_events[eid] = {
-                "ocel:activity": activity,
-                "ocel:timestamp": timestamp,
-                "ocel:omap": flat_omap,
-                "ocel:vmap": attr_map
-            }
+            events.append((activity, timestamp, attr_map))
+        yield trace_id, events
 
-            event_id += 1
 
-    # --- Compose OCEL structure ---
-    ocel_log = {
-        "ocel:global-log": {
-            "ocel:version": "1.0",
-            "ocel:ordering": "timestamp",
-            "ocel:attribute-names": sorted(event_attr_keys | {"activity", "timestamp"}),
-            "ocel:global-attribute-names": sorted(object_attr_keys),
-            "ocel:object-types": sorted({v["ocel:type"] for v in ocel_objects.values()})
-        },
-        "ocel:global-event": {},
-        "ocel:global-object": {},
-        "ocel:events": ocel_events,
-        "ocel:objects": ocel_objects
-    }
+def _convert_trace(ctx, sampler, store, trace_id, events, emit_object, emit_event, counters, shared_pools=None):
+    """
+    Sample the objects of one trace and emit its objects and events in creation order.
+
+    Objects are only reused within the trace, unless `shared_pools` maps
+    the object types to cross-trace `RingPool`s of OCEL ids; the objects of
+    each event are picked by an `ObjectAssigner`. Adds the trace and its
+    new and reused object draws to `counters`. Returns the trace's object pools.
+    """
+    object_types = ctx["object_types"]
+    case_type = ctx["case_type"]
+    # Hashed attributes are derived from the entity ids by the emitter
+    hashed = ctx["hashed_attributes"] is not None
+    event_attributes = ctx["event_attributes"]
+    assigner = ObjectAssigner(ctx, sampler, store, emit_object, shared_pools)
+    assign = assigner.assign
+
+    case_oid = store.add_named(store.add_type(case_type), trace_id)
+    assigner.pools[case_type] = array("L", [case_oid])  # Always include the trace ID as case object
+
+    # --- Generate attributes for case-level object ---
+    emit_object(case_oid, None if hashed else ctx["object_attributes"].draw(sampler))
+
+    for activity, timestamp, attr_map in events:
+        omap = [case_oid]
+
+        # --- Sample object types for this event ---
+        n_types = sampler.triangular_int(*ctx["object_types_per_event"])
+        sampled_types = sampler.sample(object_types, min(n_types, len(object_types)))
+
+        for ot in sampled_types:
+            omap.extend(assign(ot, sampler.triangular_int(*ctx["objects_per_type_per_event"])))
+
+        # --- Merge original (XES) and new (OCEL) event attributes ---
+        vmap = dict(attr_map)
+        if not hashed:
+            vmap.update(event_attributes.draw(sampler))
+        emit_event(activity, timestamp, omap, vmap)
+
+    counters["traces"] += 1
+    counters["objects_new"] += assigner.new
+    counters["objects_reused"] += assigner.reused
+    return assigner.pools
+
+
+class _OcelEmitter:
+    """
+    Formats store objects as OCEL entities and collects them per trace.
+
+    With a `scope` (the trace id), object and event ids are prefixed with
+    it, except for the case object, whose id already is the trace id.
+    With `attributes` (a `HashedAttributes`), synthetic attributes are
+    derived from the final entity ids here instead of being passed in.
+    With `counters`, every flush records the store's footprint before the
+    release as `object_store_peak_bytes`.
+    """
+
+    def __init__(self, store, scope=None, attributes=None, counters=None):
+        self.store = store
+        self.scope = scope
+        self.attributes = attributes
+        self.counters = counters
+        self.object_id = store.object_id if scope is None else self._scoped_object_id
+        self.event_id = 1
+        self.objects = []
+        self.events = []
+
+    def _scoped_object_id(self, oid):
+        name = self.store.name(oid)
+        return name if name is not None else f"{self.scope}/{self.store.object_id(oid)}"
+
+    def write_object(self, oid, ovmap):
+        object_id = self.object_id(oid)
+        if self.attributes is not None:
+            ovmap = self.attributes.object(object_id)
+        self.objects.append((object_id, {
+            "ocel:type": self.store.type_name(oid),
+            "ocel:ovmap": ovmap
+        }))
+
+    def write_event(self, activity, timestamp, omap, vmap):
+        object_id = self.object_id
+        event_id = f"e{self.event_id}" if self.scope is None else f"{self.scope}/e{self.event_id}"
+        if self.attributes is not None:
+            vmap = self.attributes.event(event_id, vmap)
+        self.events.append((event_id, {
+            "ocel:activity": activity,
+            "ocel:timestamp": timestamp,
+            "ocel:omap": [object_id(oid) for oid in omap],
+            "ocel:vmap": vmap
+        }))
+        self.event_id += 1
+
+    def flush(self, trace_id):
+        """Return the collected trace and release its objects from the store."""
+        trace = OcelTrace(trace_id, self.objects, self.events)
+        self.objects, self.events = [], []
+        if self.counters is not None:
+            _record_peak(self.counters, self.store.nbytes())
+        self.store.release()
+        return trace
+
+
+def _record_peak(counters, nbytes):
+    counters["object_store_peak_bytes"] = max(counters.get("object_store_peak_bytes", 0), nbytes)
+
+
+def _merge_counters(counters, chunk_counters):
+    """Add a worker's counters to the log's; peaks are combined with max."""
+    for name, n in chunk_counters.items():
+        if name == "object_store_peak_bytes":
+            _record_peak(counters, n)
+        else:
+            counters[name] += n
+
+
+def _chunk_traces(traces, jobs):
+    """
+    Split traces into contiguous chunks of roughly equal event count.
+
+    Several chunks per job keep the workers balanced when trace lengths
+    vary, while contiguity lets results be merged in trace order.
+    """
+    total_events = sum(len(events) for _, events in traces)
+    target = max(1, total_events // (jobs * 4))
+    chunks, current, load, start = [], [], 0, 0
+    for trace_idx, trace in enumerate(traces):
+        current.append(trace)
+        load += len(trace[1])
+        if load >= target:
+            chunks.append((start, current))
+            current, load, start = [], 0, trace_idx + 1
+    if current:
+        chunks.append((start, current))
+    return chunks
+
+
+def _convert_chunk(task):
+    """Worker: convert a chunk of traces, each with its own seed stream and local store."""
+    ctx, seed, start, traces = task
+    results = []
+    counters = {"traces": 0, "objects_new": 0, "objects_reused": 0}
+    for offset, (trace_id, events) in enumerate(traces):
+        sampler = make_sampler(ctx["params"], derive_seed(seed, start + offset))
+        store = _new_store(ctx)
+        objects, recorded_events = [], []
+        _convert_trace(
+            ctx, sampler, store, trace_id, events,
+            lambda oid, ovmap: objects.append((oid, ovmap)),
+            lambda *event: recorded_events.append(event),
+            counters
+        )
+        results.append((trace_id, store, objects, recorded_events))
+    return results, counters
+
+
+def _iter_sharded(ctx, traces, seed, jobs, emitter, counters):
+    """Convert traces chunk-wise (in a process pool if `jobs` > 1) and yield them in order."""
+    tasks = [(ctx, seed, start, chunk) for start, chunk in _chunk_traces(traces, jobs)]
+    yield from _merge_chunks(_map_chunks(_convert_chunk, tasks, jobs), emitter, counters)
+
+
+def _map_chunks(worker, tasks, jobs):
+    """Map `worker` over the chunk tasks in order, in a process pool if `jobs` > 1."""
+    if jobs == 1:
+        yield from map(worker, tasks)
+    else:
+        with multiprocessing.Pool(jobs) as pool:
+            yield from pool.imap(worker, tasks)
+
+
+def _convert_keyed_trace(ctx, seed, trace_index, trace_id, events, counters):
+    """Convert one trace from its keyed stream into trace-scoped OCEL entities."""
+    sampler = make_sampler(ctx["params"], stream_seed(seed, "objects", trace_index))
+    emitter = _OcelEmitter(_new_store(ctx), scope=trace_id, attributes=ctx["hashed_attributes"], counters=counters)
+    _convert_trace(
+        ctx, sampler, emitter.store, trace_id, events, emitter.write_object, emitter.write_event, counters
+    )
+    return emitter.flush(trace_id)
+
+
+def _convert_keyed_chunk(task):
+    """Worker: convert a chunk of traces of a keyed log."""
+    ctx, seed, start, traces = task
+    counters = {"traces": 0, "objects_new": 0, "objects_reused": 0}
+    results = [
+        _convert_keyed_trace(ctx, seed, start + offset, trace_id, events, counters)
+        for offset, (trace_id, events) in enumerate(traces)
+    ]
+    return results, counters
+
+
+def _iter_keyed(ctx, xes_log, seed, jobs, counters):
+    """
+    Convert the traces of a `"rng_mode": "counter"` log, each keyed on its index.
+
+    Traces share no state, so chunks can be converted in any process and
+    the output is the same for every `jobs`.
+    """
+    offset = xes_log.offset if isinstance(xes_log, (ActivityLog, ActivityLogStream)) else 0
+    if not jobs:
+        for trace_index, (trace_id, events) in enumerate(_iter_traces(xes_log), offset):
+            yield _convert_keyed_trace(ctx, seed, trace_index, trace_id, events, counters)
+        return
+
+    print(f"[INFO] Converting traces in {jobs} job(s)...")
+    chunks = _chunk_traces(list(_iter_traces(xes_log)), jobs)
+    tasks = [(ctx, seed, offset + start, chunk) for start, chunk in chunks]
+    for results, chunk_counters in _map_chunks(_convert_keyed_chunk, tasks, jobs):
+        _merge_counters(counters, chunk_counters)
+        yield from results
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(ocel_log, f, indent=2)
 
-    print(f"[DONE] OCEL log saved to: {output_path}")
-    print(f"[STATS] Events: {len(ocel_events)}, Objects: {len(ocel_objects)}")
-    print(f"[STATS] Object Types: {len(ocel_log['ocel:global-log']['ocel:object-types'])}")
+def _merge_chunks(results, emitter, counters):
+    """Renumber trace-local objects into the global store and yield the traces in order."""
+    store = emitter.store
+    for chunk_results, chunk_counters in results:
+        _merge_counters(counters, chunk_counters)
+        for trace_id, local_store, objects, events in chunk_results:
+            global_ids = {}
+            for oid, ovmap in objects:
+                name = local_store.name(oid)
+                code = local_store.type_code(oid)
+                global_ids[oid] = store.add_named(code, name) if name is not None else store.new_object(code)
+                emitter.write_object(global_ids[oid], ovmap)
+            for activity, timestamp, omap, vmap in events:
+                emitter.write_event(activity, timestamp, [global_ids[oid] for oid in omap], vmap)
+            yield emitter.flush(trace_id)
@@ -1,10 +1,11 @@
 import os
 import json
-import subprocess
 import random
-import shutil
 import csv
+import sys
 from itertools import product
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ocelgen.batch import run_batch
 
 # === Setup directories for config files, XES and OCEL files outputs ===
 CONFIG_DIR = "configsssss"
@@ -12,6 +13,8 @@ OUTPUT_DIR = "generated_logsssss"
 XES_DIR = os.path.join(OUTPUT_DIR, "xes")
 OCEL_DIR = os.path.join(OUTPUT_DIR, "ocel")
 SUMMARY_FILE = os.path.join(OUTPUT_DIR, "benchmark_summary1111111.csv")
+BATCH_SUMMARY_FILE = os.path.join(OUTPUT_DIR, "batch_runtimes.csv")
+BATCH_JOBS = 1  # worker processes used to generate the logs
 
 for directory in [CONFIG_DIR, XES_DIR, OCEL_DIR]:
     os.makedirs(directory, exist_ok=True)
@@ -56,6 +59,7 @@ csv_header = [
     "ctrl_profile", "sequence", "choice", "parallel", "loop"
 ]
 summary_rows = []
+pending = []  # (config_path, summary row) of every log to generate
 
 # === Generate logs based on combinations ===
 
@@ -122,23 +126,24 @@ for i, (act_mode, obj_mode, traces, obj_pool_size, ctrl_profile) in enumerate(pa
         }
     }
 
-    # Save config file and run generator
+    # Save config file; all logs are generated together below
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
 
-    shutil.copy(config_path, "config.json")  
-    print(f" Generating {log_id}...")
+    pending.append((config_path, [
+        log_id, seed, act_mode, obj_mode, traces,
+        obj_pool_size, reuse_prob,
+        objs_min, objs_mode, objs_max,
+        ctrl_profile, cf["sequence"], cf["choice"], cf["parallel"], cf["loop"]
+    ]))
 
-    result = subprocess.run(["python", "main.py"], capture_output=True, text=True)
+# === Generate all logs in one warm process (or BATCH_JOBS workers) ===
+results = run_batch([path for path, _ in pending], jobs=BATCH_JOBS, summary_path=BATCH_SUMMARY_FILE)
 
-    if result.returncode == 0:
-        print(f"✅ {log_id} generated successfully.")
-        summary_rows.append([
-            log_id, seed, act_mode, obj_mode, traces,
-            obj_pool_size, reuse_prob,
-            objs_min, objs_mode, objs_max,
-            ctrl_profile, cf["sequence"], cf["choice"], cf["parallel"], cf["loop"]
-        ])
+for (config_path, row), result in zip(pending, results):
+    if result["status"] == "ok":
+        print(f"✅ {row[0]} generated successfully.")
+        summary_rows.append(row)
     else:
-        print(f" Failed to generate {log_id}:\n{result.stderr.strip()}")
+        print(f" Failed to generate {row[0]}:\n{result['error']}")
 
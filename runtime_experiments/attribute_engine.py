@@ -0,0 +1,85 @@
+import argparse
+import csv
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ocelgen.attributes import AttributeEngine
+from ocelgen.sampling import make_sampler
+
+# === Output Setup ===
+RESULTS_FILE = os.path.join("csv_files", "attribute_engine_results.csv")
+
+# === Experiment Parameters ===
+num_entities = 1_000_000
+ATTRIBUTE_COUNTS = {"object_attributes_min": 1, "object_attributes_mode": 2, "object_attributes_max": 3}
+TYPED_SCHEMA = [
+    {"name": "amount", "type": "float", "distribution": "lognormal", "mean": 3, "sigma": 1, "round": 2},
+    {"name": "quantity", "type": "int", "low": 1, "high": 20},
+    {"name": "priority", "type": "categorical", "values": ["low", "medium", "high"], "weights": [6, 3, 1]},
+    {"name": "due", "type": "timestamp", "start": "2025-01-01T00:00:00", "end": "2025-12-31T00:00:00"},
+]
+
+csv_header = ["engine", "sampling_mode", "entities", "attributes", "runtime_sec", "sec_per_million", "retained_mib_per_million"]
+
+
+def fstring_attributes(sampler, prefix, count):
+    """The original per-entity generator, kept here as the baseline."""
+    return {
+        f"{prefix}_attr{i+1}": f"{prefix}_val{sampler.randint(1, 999)}"
+        for i in range(count)
+    }
+
+
+def variants():
+    """`(engine, sampling_mode, draw)` for every measured configuration."""
+    counts = tuple(ATTRIBUTE_COUNTS.values())
+    for mode in ("scalar", "numpy"):
+        params = {**ATTRIBUTE_COUNTS, "sampling_mode": mode}
+        yield "f-string", mode, params, lambda engine, sampler: fstring_attributes(
+            sampler, "object", sampler.triangular_int(*counts))
+        yield "vocabulary", mode, params, lambda engine, sampler: engine.draw(sampler)
+        yield "typed", mode, {**params, "object_attribute_schema": TYPED_SCHEMA}, \
+            lambda engine, sampler: engine.draw(sampler)
+
+
+def measure(params, draw, n, seed=42):
+    """Time `n` draws, then measure what keeping them alive costs (tracemalloc)."""
+    engine = AttributeEngine("object", params)
+    sampler = make_sampler(params, seed)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        draw(engine, sampler)
+    runtime = time.perf_counter() - t0
+
+    sampler = make_sampler(params, seed)
+    tracemalloc.start()
+    kept = [draw(engine, sampler) for _ in range(n)]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    attributes = sum(map(len, kept))
+    return runtime, retained, attributes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare attribute generation with and without value vocabularies.")
+    parser.add_argument("--entities", type=int, default=num_entities, help="Entities per configuration")
+    args = parser.parse_args()
+
+    rows = []
+    scale = 1_000_000 / args.entities
+    for engine, mode, params, draw in variants():
+        runtime, retained, attributes = measure(params, draw, args.entities)
+        rows.append([engine, mode, args.entities, attributes, round(runtime, 4),
+                     round(runtime * scale, 4), round(retained * scale / (1024 * 1024), 2)])
+        print(f"[DONE] {engine:<10} {mode:<6}: {runtime * scale:.3f}s and "
+              f"{retained * scale / (1024 * 1024):.1f} MiB per million entities")
+
+    # === Save CSV ===
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(csv_header)
+        writer.writerows(rows)
+    print(f"\n[DONE] Attribute engine results saved to: {RESULTS_FILE}")
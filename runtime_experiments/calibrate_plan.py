@@ -0,0 +1,90 @@
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ocelgen.plan import CALIBRATION_FILE, DEFAULT_CALIBRATION, compile_plan
+from ocelgen.sweep import sweep_points
+from run_sweeps import BASE_CONFIG, SWEEPS
+
+
+def history_points(sweeps):
+    """`(config, xes_runtime_sec, ocel_runtime_sec)` of every run recorded in the sweeps' results CSVs."""
+    points = []
+    for name in sweeps:
+        spec = dict(SWEEPS[name], base_config=BASE_CONFIG)
+        if not os.path.exists(spec["results_file"]):
+            print(f"[WARN] No runtime history for sweep '{name}': {spec['results_file']}")
+            continue
+        with open(spec["results_file"], newline="") as f:
+            runtimes = {row["log_id"]: row for row in csv.DictReader(f)}
+        for log_id, _, config in sweep_points(spec):
+            row = runtimes.get(log_id)
+            if row is not None:
+                points.append((config, float(row["xes_runtime_sec"]), float(row["ocel_runtime_sec"])))
+    return points
+
+
+def fit(columns, runtimes):
+    """Non-negative least-squares coefficients of `runtimes ~ columns` (negative terms are dropped and refitted)."""
+    X = np.column_stack(columns)
+    active = np.ones(X.shape[1], dtype=bool)
+    while True:
+        coef = np.zeros(X.shape[1])
+        coef[active] = np.linalg.lstsq(X[:, active], runtimes, rcond=None)[0]
+        if (coef >= 0).all():
+            return coef
+        active &= coef > 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit the plan runtime estimates on the sweep runtime history.")
+    parser.add_argument("sweeps", nargs="*", help=f"Sweeps to use: {', '.join(SWEEPS)} (default: all)")
+    parser.add_argument("--output", default=CALIBRATION_FILE, help="Calibration JSON to write")
+    args = parser.parse_args()
+
+    points = history_points(args.sweeps or list(SWEEPS))
+    if not points:
+        sys.exit("[WARN] No runtime history found, nothing to calibrate")
+    print(f"[INFO] Estimating {len(points)} recorded runs...")
+    events, objects, xes_runtime, ocel_runtime = [], [], [], []
+    for config, xes_sec, ocel_sec in points:
+        with contextlib.redirect_stdout(io.StringIO()):
+            plan = compile_plan(config, calibration=DEFAULT_CALIBRATION, pilot_traces=0)
+        events.append(plan.events)
+        objects.append(plan.objects)
+        xes_runtime.append(xes_sec)
+        ocel_runtime.append(ocel_sec)
+
+    events, objects = np.array(events), np.array(objects)
+    ones = np.ones(len(events))
+    xes_coef = fit([ones, events], np.array(xes_runtime))
+    ocel_coef = fit([ones, events, objects], np.array(ocel_runtime))
+    calibration = {
+        "xes_fixed_sec": float(xes_coef[0]),
+        "xes_sec_per_event": float(xes_coef[1]),
+        "ocel_fixed_sec": float(ocel_coef[0]),
+        "ocel_sec_per_event": float(ocel_coef[1]),
+        "ocel_sec_per_object": float(ocel_coef[2]),
+        "source": f"{len(points)} sweep runs ({BASE_CONFIG['process_tree_params']['playout_engine']} play-out)",
+    }
+
+    # === Fit quality ===
+    for phase, coef, columns, runtimes in (
+        ("XES", xes_coef, [ones, events], xes_runtime),
+        ("OCEL", ocel_coef, [ones, events, objects], ocel_runtime),
+    ):
+        predicted = np.column_stack(columns) @ coef
+        error = np.abs(predicted - runtimes)
+        print(f"[STATS] {phase}: median absolute error {np.median(error):.4f}s "
+              f"({100 * np.median(error / runtimes):.1f}% of the run)")
+
+    # === Save JSON ===
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(calibration, f, indent=2)
+    print(f"\n[DONE] Plan calibration saved to: {args.output}")
@@ -3,6 +3,14 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+EXPERIMENTS = [
+    ("runtime_results_by_traces.csv", "Number of Traces", "num_traces"),
+    ("runtime_results_by_activities.csv", "Activity Mode", "activity_mode"),
+    ("runtime_results_by_reuse.csv", "Reuse Probability", "reuse_probability"),
+    ("runtime_results_by_objecttypes.csv", "Object Types", "object_types_mode"),
+    ("runtime_results_by_objecttypes_per_event.csv", "Types per Event", "types_per_event_mode"),
+]
+
 
 def plot_runtime_summary(csv_dir="csv_files", plot_dir="plots"):
     """
@@ -15,17 +23,36 @@ def plot_runtime_summary(csv_dir="csv_files", plot_dir="plots"):
     Outputs:
         Saves a single figure with subplots for each parameter.
     """
-    os.makedirs(plot_dir, exist_ok=True)
+    _plot_summary(
+        csv_dir, plot_dir, "runtime_sec", "Runtime (seconds)",
+        "Runtime Trends while varying Generator Parameters", "runtime_summary_plots.png"
+    )
+
+
+def plot_memory_summary(csv_dir="csv_files", plot_dir="plots", metric="peak_rss_mb"):
+    """
+    Plots the per-phase memory columns of the runtime CSVs for five key parameters.
+
+    Args:
+        csv_dir (str): Path to the directory containing runtime CSVs.
+        plot_dir (str): Path to the directory to save plots.
+        metric (str): "peak_rss_mb" or "tracemalloc_peak_mb" (sweeps run with `--memory`).
+
+    Outputs:
+        Saves a single figure with subplots for each parameter.
+    """
+    _plot_summary(
+        csv_dir, plot_dir, metric, "Peak memory (MiB)",
+        "Memory Trends while varying Generator Parameters", f"memory_summary_{metric}.png"
+    )
+
 
-    EXPERIMENTS = [
-        ("runtime_results_by_traces.csv", "Number of Traces", "num_traces"),
-        ("runtime_results_by_activities.csv", "Activity Mode", "activity_mode"),
-        ("runtime_results_by_reuse.csv", "Reuse Probability", "reuse_probability"),
-        ("runtime_results_by_objecttypes.csv", "Object Types", "object_types_mode"),
-        ("runtime_results_by_objecttypes_per_event.csv", "Types per Event", "types_per_event_mode"),
-    ]
+def _plot_summary(csv_dir, plot_dir, metric, y_label, title, plot_name):
+    """Plot `xes_<metric>` and `ocel_<metric>` against the swept parameter of every experiment."""
+    os.makedirs(plot_dir, exist_ok=True)
 
-    PLOT_FILE = os.path.join(plot_dir, "runtime_summary_plots.png")
+    PLOT_FILE = os.path.join(plot_dir, plot_name)
+    value_vars = [f"xes_{metric}", f"ocel_{metric}"]
 
     fig, axes = plt.subplots(1, 5, figsize=(22, 4), sharey=True, constrained_layout=True)
 
@@ -37,25 +64,28 @@ def plot_runtime_summary(csv_dir="csv_files", plot_dir="plots"):
             continue
 
         df = pd.read_csv(csv_path)
+        if not set(value_vars) <= set(df.columns):
+            print(f"[MISSING] {', '.join(value_vars)} in {csv_path}")
+            continue
 
         df_melted = pd.melt(
             df,
             id_vars=[x_col],
-            value_vars=["xes_runtime_sec", "ocel_runtime_sec"],
+            value_vars=value_vars,
             var_name="Stage",
-            value_name="Runtime"
+            value_name="Value"
         )
 
         df_melted["Stage"] = df_melted["Stage"].map({
-            "xes_runtime_sec": "Generating XES",
-            "ocel_runtime_sec": "Converting to OCEL"
+            value_vars[0]: "Generating XES",
+            value_vars[1]: "Converting to OCEL"
         })
 
         ax = axes[i]
         sns.lineplot(
             data=df_melted,
             x=x_col,
-            y="Runtime",
+            y="Value",
             hue="Stage",
             ci="sd",
             ax=ax,
@@ -64,7 +94,7 @@ def plot_runtime_summary(csv_dir="csv_files", plot_dir="plots"):
 
         ax.set_title(x_label)
         ax.set_xlabel("")
-        ax.set_ylabel("Runtime (seconds)" if i == 0 else "")
+        ax.set_ylabel(y_label if i == 0 else "")
         ax.grid(True, linestyle="--", alpha=0.3)
 
         if i != len(EXPERIMENTS) - 1:
@@ -73,7 +103,7 @@ def plot_runtime_summary(csv_dir="csv_files", plot_dir="plots"):
             ax.legend(loc="upper left")
 
     fig.supxlabel("Varying Generator Parameters", fontsize=12)
-    fig.suptitle("Runtime Trends while varying Generator Parameters", fontsize=14)
+    fig.suptitle(title, fontsize=14)
 
     plt.savefig(PLOT_FILE, dpi=300)
     print(f"[SAVED] {PLOT_FILE}")
@@ -82,3 +112,4 @@ def plot_runtime_summary(csv_dir="csv_files", plot_dir="plots"):
 
 if __name__ == "__main__":
     plot_runtime_summary()
+    plot_memory_summary()
@@ -0,0 +1,86 @@
+import argparse
+import contextlib
+import csv
+import io
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ocelgen.ocel_writer import OCEL_OUTPUT_FORMATS
+from ocelgen.xes_generator import generate_xes_log
+from ocelgen.xes_to_ocel_converter import convert_xes_to_ocel
+from run_sweeps import BASE_CONFIG
+
+# === Output Setup ===
+OUTPUT_DIR = "runtime_by_output_format"
+RESULTS_FILE = os.path.join("csv_files", "output_backend_results.csv")
+EXTENSIONS = {"json": "jsonocel", "sqlite": "sqlite"}
+
+# === Experiment Parameters ===
+trace_counts = [100, 500, 1000, 5000, 10000]
+samples_per_trace_count = 3
+
+csv_header = ["log_id", "num_traces", "ocel_output_format", "ocel_runtime_sec", "events", "events_per_sec", "file_size_mb"]
+
+
+def benchmark(trace_counts, samples, jobs=None):
+    """
+    Convert the same logs with every OCEL writer and compare throughput and file size.
+
+    Each log is simulated once (native play-out) and handed to the converter
+    in memory for every output format, so only the conversion and writing
+    differ between the rows of one log.
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    rows = []
+    log_index = 1
+    for num_traces in trace_counts:
+        for _ in range(samples):
+            log_id = f"log_{log_index:04}"
+            config = {
+                **BASE_CONFIG,
+                "global_seed": 14000 + log_index,
+                "jobs": jobs,
+                "process_tree_params": {
+                    **BASE_CONFIG["process_tree_params"],
+                    "num_traces": num_traces,
+                    "playout_engine": "native",
+                },
+            }
+            with contextlib.redirect_stdout(io.StringIO()):
+                xes_log, _ = generate_xes_log(config)
+
+            for fmt in OCEL_OUTPUT_FORMATS:
+                path = os.path.join(OUTPUT_DIR, f"{log_id}.{EXTENSIONS[fmt]}")
+                fmt_config = dict(config, ocel_output_format=fmt, output_ocel_path=path)
+                t1 = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    report = convert_xes_to_ocel(fmt_config, xes_log=xes_log)
+                ocel_time = time.perf_counter() - t1
+
+                events = report["counters"]["events"]
+                size_mb = os.path.getsize(path) / (1024 * 1024)
+                rows.append([log_id, num_traces, fmt, round(ocel_time, 4), events,
+                             round(events / ocel_time), round(size_mb, 3)])
+                print(f"[DONE] {log_id}: traces={num_traces}, {fmt}: {ocel_time:.4f}s, "
+                      f"{events / ocel_time:,.0f} events/s, {size_mb:.2f} MiB")
+            log_index += 1
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the OCEL output writers.")
+    parser.add_argument("--traces", type=int, nargs="+", default=trace_counts, help="Trace counts")
+    parser.add_argument("--samples", type=int, default=samples_per_trace_count, help="Logs per trace count")
+    parser.add_argument("--jobs", type=int, default=None, help="Conversion worker processes")
+    args = parser.parse_args()
+
+    rows = benchmark(args.traces, args.samples, args.jobs)
+
+    # === Save CSV ===
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(csv_header)
+        writer.writerows(rows)
+    print(f"\n[DONE] Output backend results saved to: {RESULTS_FILE}")
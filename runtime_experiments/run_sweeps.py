@@ -0,0 +1,159 @@
+import argparse
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ocelgen.sweep import run_sweep
+
+CSV_DIR = "csv_files"
+
+# === Shared base configuration (activity mode 10, 100 traces) ===
+BASE_CONFIG = {
+    "process_tree_params": {
+        "min": 6,
+        "mode": 10,
+        "max": 14,
+        "sequence": 0.5,
+        "choice": 0.3,
+        "parallel": 0.15,
+        "loop": 0.05,
+        "silent": 0.0,
+        "lt_dependency": 0.0,
+        "duplicate": 0.0,
+        "or": 0.0,
+        "num_traces": 100,
+        "playout_engine": "pm4py"
+    },
+    "ocel_generation_parameters": {
+        "object_types_min": 3,
+        "object_types_mode": 3,
+        "object_types_max": 3,
+        "object_types_per_event_min": 1,
+        "object_types_per_event_mode": 2,
+        "object_types_per_event_max": 2,
+        "objects_per_type_per_event_min": 1,
+        "objects_per_type_per_event_mode": 2,
+        "objects_per_type_per_event_max": 3,
+        "reuse_object_probability": 0.8,
+        "case_object_type": "ProcessCase",
+        "event_attributes_min": 1,
+        "event_attributes_mode": 2,
+        "event_attributes_max": 3,
+        "object_attributes_min": 1,
+        "object_attributes_mode": 2,
+        "object_attributes_max": 3
+    }
+}
+
+
+def activities(mode):
+    return {"min": int(mode * 0.6), "mode": mode, "max": int(mode * 1.4)}
+
+
+def object_types(mode):
+    obj_max = mode + 2
+    return {
+        "object_types_min": max(1, mode - 1),
+        "object_types_mode": mode,
+        "object_types_max": obj_max,
+        "object_type_prefixes": [f"Type{i}" for i in range(obj_max)],
+    }
+
+
+# === Sweep specs (see ocelgen.sweep.sweep_points) ===
+SWEEPS = {
+    "traces": {
+        "parameter": "num_traces",
+        "levels": [10, 25, 50, 75, 100, 150, 200, 300, 400, 500],
+        "repetitions": 20,
+        "seed_base": 9000,
+        "output_dir": "runtime_logs",
+        "results_file": os.path.join(CSV_DIR, "runtime_results_by_traces.csv"),
+        "overrides": lambda n: {
+            "process_tree_params": {"num_traces": n},
+            "ocel_generation_parameters": {
+                "object_types_min": 2,
+                "object_types_max": 5,
+                "object_types_per_event_max": 3,
+            },
+        },
+    },
+    "activities": {
+        "parameter": "activity_mode",
+        "levels": [3, 6, 9, 12, 15, 18, 21, 25],
+        "repetitions": 25,
+        "seed_base": 10000,
+        "output_dir": "runtime_by_activity",
+        "results_file": os.path.join(CSV_DIR, "runtime_results_by_activities.csv"),
+        "overrides": lambda m: {"process_tree_params": activities(m)},
+    },
+    "reuse": {
+        "parameter": "reuse_probability",
+        "levels": [0.1, 0.3, 0.5, 0.7, 0.9, 0.95],
+        "repetitions": 84,
+        "seed_base": 11000,
+        "output_dir": "runtime_by_reuse",
+        "results_file": os.path.join(CSV_DIR, "runtime_results_by_reuse.csv"),
+        "overrides": lambda p: {"ocel_generation_parameters": {"reuse_object_probability": p}},
+    },
+    "object_types": {
+        "parameter": "object_types_mode",
+        "levels": [1, 2, 3, 4, 5, 6, 7, 8],
+        "repetitions": 20,
+        "seed_base": 12000,
+        "output_dir": "runtime_by_object_types",
+        "results_file": os.path.join(CSV_DIR, "runtime_results_by_objecttypes.csv"),
+        "overrides": lambda m: {
+            "ocel_generation_parameters": {
+                **object_types(m),
+                "object_types_per_event_mode": min(4, m),
+                "object_types_per_event_max": m + 2,
+            },
+        },
+    },
+    "types_per_event": {
+        "parameter": "types_per_event_mode",
+        "levels": [1, 2, 3, 4, 5, 6],
+        "repetitions": 20,
+        "seed_base": 13000,
+        "output_dir": "runtime_by_types_per_event",
+        "results_file": os.path.join(CSV_DIR, "runtime_results_by_objecttypes_per_event.csv"),
+        "overrides": lambda t: {
+            "ocel_generation_parameters": {
+                **object_types(6),
+                "object_types_per_event_mode": t,
+                "object_types_per_event_max": min(8, t + 1),
+            },
+        },
+    },
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the OCEL-Gen runtime sweeps.")
+    parser.add_argument("sweeps", nargs="*", help=f"Sweeps to run: {', '.join(SWEEPS)} (default: all)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per worker")
+    parser.add_argument("--repetitions", type=int, default=None, help="Override the logs per level")
+    parser.add_argument("--handoff", choices=["memory", "disk"], default="memory",
+                        help="'memory' hands the log straight to the converter, 'disk' writes and re-imports the XES file")
+    parser.add_argument("--engine", choices=["pm4py", "native", "variants"], default="pm4py",
+                        help="Play-out engine")
+    parser.add_argument("--memory", action="store_true",
+                        help="Add tracemalloc peaks per phase (measured in a separate, untimed run)")
+    parser.add_argument("--verbose", action="store_true", help="Show the generator output of every log")
+    args = parser.parse_args()
+    unknown = [name for name in args.sweeps if name not in SWEEPS]
+    if unknown:
+        parser.error(f"unknown sweep(s): {', '.join(unknown)}")
+
+    for name in args.sweeps or list(SWEEPS):
+        spec = dict(SWEEPS[name])
+        spec["base_config"] = {
+            **BASE_CONFIG,
+            "process_tree_params": {**BASE_CONFIG["process_tree_params"], "playout_engine": args.engine},
+        }
+        if args.repetitions:
+            spec["repetitions"] = args.repetitions
+        print(f"\n=== Sweep: {name} ===")
+        run_sweep(spec, jobs=args.jobs, warmup=args.warmup, handoff=args.handoff,
+                  quiet=not args.verbose, memory=args.memory)
@@ -0,0 +1,101 @@
+import argparse
+import copy
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(REPO_DIR)
+from ocelgen.client import OcelgenClient
+from run_sweeps import BASE_CONFIG
+
+# === Output Setup ===
+OUTPUT_DIR = "runtime_by_serving"
+RESULTS_FILE = os.path.join("csv_files", "serve_latency_results.csv")
+SOCKET_PATH = os.path.join(OUTPUT_DIR, "ocelgen.sock")
+
+# === Experiment Parameters ===
+num_logs = 20
+trace_counts = [10, 100]
+
+csv_header = ["log_id", "num_traces", "mode", "latency_sec", "generation_sec"]
+
+
+def write_configs(num_logs, num_traces):
+    """Write `num_logs` configs (distinct seeds) and return their paths."""
+    config_dir = os.path.join(OUTPUT_DIR, "configs")
+    os.makedirs(config_dir, exist_ok=True)
+    paths = []
+    for i in range(1, num_logs + 1):
+        log_id = f"log_{num_traces}_{i:03}"
+        config = copy.deepcopy(BASE_CONFIG)
+        config["process_tree_params"]["num_traces"] = num_traces
+        config["global_seed"] = 14000 + i
+        config["output_ocel_path"] = os.path.abspath(os.path.join(OUTPUT_DIR, f"{log_id}.jsonocel"))
+        path = os.path.join(config_dir, f"{log_id}.json")
+        with open(path, "w") as f:
+            json.dump(config, f, indent=2)
+        paths.append((log_id, path))
+    return paths
+
+
+def run_cold(configs):
+    """One `python main.py` process per log, as the old benchmark scripts did."""
+    for log_id, path in configs:
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(REPO_DIR, "main.py"), "--config", path],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        yield log_id, time.perf_counter() - t0, None
+
+
+def run_warm(configs, client):
+    """One request per log to a running `ocelgen.server`."""
+    for log_id, path in configs:
+        with open(path, "r") as f:
+            config = json.load(f)
+        t0 = time.perf_counter()
+        result = client.generate(config)
+        yield log_id, time.perf_counter() - t0, result["runtime_sec"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-log latency of one process per log vs. a warm server.")
+    parser.add_argument("--logs", type=int, default=num_logs, help="Logs per trace count and mode")
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    print("[INFO] Starting the OCEL-Gen server...")
+    t0 = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "ocelgen.server", "--socket", SOCKET_PATH, "--jobs", "1"],
+        cwd=REPO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    rows = []
+    try:
+        client = OcelgenClient(socket_path=SOCKET_PATH)
+        client.wait()
+        print(f"[INFO] Server ready after {time.perf_counter() - t0:.2f}s (paid once)")
+        for num_traces in trace_counts:
+            configs = write_configs(args.logs, num_traces)
+            for mode, results in (("cold", run_cold(configs)), ("warm", run_warm(configs, client))):
+                latencies = []
+                for log_id, latency, generation in results:
+                    rows.append([log_id, num_traces, mode, round(latency, 4),
+                                 "" if generation is None else round(generation, 4)])
+                    latencies.append(latency)
+                print(f"[DONE] {num_traces} traces, {mode}: median {statistics.median(latencies):.3f}s per log "
+                      f"(min {min(latencies):.3f}s, max {max(latencies):.3f}s)")
+    finally:
+        server.terminate()
+        server.wait()
+
+    # === Save CSV ===
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(csv_header)
+        writer.writerows(rows)
+    print(f"\n[DONE] Serving latency results saved to: {RESULTS_FILE}")
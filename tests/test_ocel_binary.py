@@ -0,0 +1,27 @@
+import json
+
+from ocelgen.ocel_binary import convert_jsonocel_to_binary, open_ocel_binary
+
+
+def test_non_ascii_ids_round_trip(tmp_path):
+    log = {
+        "ocel:global-log": {},
+        "ocel:events": {
+            "é1": {"ocel:activity": "Prüfen", "ocel:timestamp": "2024-01-01T00:00:00",
+                   "ocel:omap": ["Bestellung-ä", "订单-1"], "ocel:vmap": {}},
+            "e2": {"ocel:activity": "Versand", "ocel:timestamp": "2024-01-01T01:00:00",
+                   "ocel:omap": ["订单-1"], "ocel:vmap": {}},
+        },
+        "ocel:objects": {
+            "Bestellung-ä": {"ocel:type": "order", "ocel:ovmap": {}},
+            "订单-1": {"ocel:type": "order", "ocel:ovmap": {}},
+        },
+    }
+    json_path = tmp_path / "log.jsonocel"
+    json_path.write_text(json.dumps(log), encoding="utf-8")
+
+    binary = open_ocel_binary(convert_jsonocel_to_binary(str(json_path)))
+
+    assert [binary.event_name(i) for i in range(binary.num_events)] == ["é1", "e2"]
+    assert [binary.object_name(i) for i in range(binary.num_objects)] == ["Bestellung-ä", "订单-1"]
+    assert [binary.object_name(i) for i in binary.event_objects(0)] == ["Bestellung-ä", "订单-1"]
@@ -0,0 +1,68 @@
+import contextlib
+import io
+import json
+import os
+
+import pytest
+
+from ocelgen.pipeline import run_pipeline
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def config():
+    with open(os.path.join(REPO_DIR, "config.json"), encoding="utf-8") as f:
+        config = json.load(f)
+    config["process_tree_params"].update(num_traces=40, playout_engine="native")
+    config["tree_cache_size"] = 0
+    return config
+
+
+def _generate(config, path, **overrides):
+    """Run the pipeline quietly and return the bytes of the OCEL log."""
+    config = dict(config, output_ocel_path=str(path), **overrides)
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_pipeline(config)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_jsonl_to_stdout_keeps_progress_lines_off_stdout(config, capfd):
+    config["process_tree_params"]["num_traces"] = 10
+    config.update(output_ocel_path="-", ocel_output_format="jsonl")
+
+    run_pipeline(config)
+
+    out, err = capfd.readouterr()
+    records = [json.loads(line) for line in out.splitlines()]
+    assert records[-1]["type"] == "global-log"
+    assert "[STATS]" in err
+
+
+def test_sharded_conversion_is_the_same_for_every_job_count(config, tmp_path):
+    logs = [_generate(config, tmp_path / f"jobs{jobs}.jsonocel", jobs=jobs) for jobs in (1, 2, 3)]
+    assert logs[0] == logs[1] == logs[2]
+
+
+@pytest.mark.parametrize("overrides", [{}, {"jobs": 2}, {"rng_mode": "counter"}], ids=["sequential", "jobs", "counter"])
+def test_lazy_attributes_write_the_hashed_log(config, tmp_path, overrides):
+    logs = []
+    for mode in ("hashed", "lazy"):
+        params = dict(config["ocel_generation_parameters"], attribute_values=mode)
+        path = tmp_path / f"{mode}.jsonocel"
+        logs.append(_generate(dict(config, ocel_generation_parameters=params), path, **overrides))
+    assert logs[0] == logs[1]
+
+
+def test_event_target_log_equals_the_fixed_size_log_of_its_trace_count(config, tmp_path):
+    target_path = tmp_path / "target.jsonocel"
+    with contextlib.redirect_stdout(io.StringIO()):
+        reports = run_pipeline(dict(config, output_ocel_path=str(target_path), target_size=300))
+    with open(target_path, "rb") as f:
+        target_log = f.read()
+    traces = reports["ocel"]["counters"]["traces"]
+    assert traces > 1
+
+    tree = dict(config["process_tree_params"], num_traces=traces)
+    assert _generate(dict(config, process_tree_params=tree), tmp_path / "fixed.jsonocel") == target_log
@@ -0,0 +1,121 @@
+import contextlib
+import io
+import json
+import os
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from ocelgen.attributes import AttributeEngine, HashSampler
+from ocelgen.sampling import (
+    NumpySampler,
+    ScalarSampler,
+    legacy_triangular_int_quantile,
+    make_sampler,
+    triangular_int_quantile,
+)
+from ocelgen.pipeline import run_pipeline
+from ocelgen.xes_to_ocel_converter import generate_ocel_trace
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SAMPLERS = [ScalarSampler, NumpySampler, HashSampler]
+TRIANGLES = [(1, 2, 4), (0, 2, 8), (1, 1, 2), (1, 4, 4), (2, 2, 2), (7, 13, 18)]
+
+
+@pytest.mark.parametrize("sampler_class", SAMPLERS)
+def test_triangular_int_covers_min_to_max(sampler_class):
+    sampler = sampler_class(7, quantile=triangular_int_quantile)
+    counts = Counter(sampler.triangular_int(1, 2, 4) for _ in range(20000))
+    assert set(counts) == {1, 2, 3}
+    # P(value < 2) = 1/3 for triangular(1, 2, 4)
+    assert counts[1] / 20000 == pytest.approx(1 / 3, abs=0.02)
+
+
+@pytest.mark.parametrize("sampler_class", SAMPLERS)
+def test_triangular_int_clips_the_mode_to_a_narrowed_range(sampler_class):
+    sampler = sampler_class(7, quantile=triangular_int_quantile)
+    assert {sampler.triangular_int(1, 3, 2) for _ in range(1000)} == {1}
+    assert {sampler.triangular_int(2, 2, 1) for _ in range(10)} == {2}
+
+
+@pytest.mark.parametrize("triangle", TRIANGLES)
+def test_default_scalar_sampler_draws_like_the_original_generator(triangle):
+    sampler = make_sampler({}, 82)
+    rng = random.Random(82)
+    assert [sampler.triangular_int(*triangle) for _ in range(5000)] == [
+        int(rng.triangular(*triangle)) for _ in range(5000)
+    ]
+
+
+@pytest.mark.parametrize("triangle", TRIANGLES)
+def test_legacy_quantile_is_the_same_on_arrays(triangle):
+    u = np.random.default_rng(3).random(5000)
+    assert legacy_triangular_int_quantile(u, *triangle).tolist() == [
+        legacy_triangular_int_quantile(x, *triangle) for x in u.tolist()
+    ]
+
+
+@pytest.mark.parametrize("sampler_class", SAMPLERS)
+def test_every_sampler_defaults_to_the_legacy_distribution(sampler_class):
+    sampler = sampler_class(7)
+    counts = Counter(sampler.triangular_int(1, 2, 4) for _ in range(20000))
+    # int(random.triangular(1, 2, 4)) is 1 for u < 1/3 and 2 otherwise
+    assert set(counts) == {1, 2}
+    assert counts[1] / 20000 == pytest.approx(1 / 3, abs=0.02)
+
+
+def test_unknown_triangular_parameterization_is_rejected():
+    with pytest.raises(ValueError, match="triangular_parameterization"):
+        make_sampler({"triangular_parameterization": "max_mode_min"}, 0)
+
+
+@pytest.fixture
+def counter_config():
+    with open(os.path.join(REPO_DIR, "config.json"), encoding="utf-8") as f:
+        config = json.load(f)
+    config["process_tree_params"].update(num_traces=40, playout_engine="native")
+    config.update(rng_mode="counter", tree_cache_size=0)
+    return config
+
+
+def _counter_log(config, path, jobs=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_pipeline(dict(config, output_ocel_path=str(path), jobs=jobs))
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("trace_index", [0, 17, 39])
+def test_regenerated_trace_equals_its_trace_in_the_full_log(counter_config, tmp_path, trace_index):
+    log = _counter_log(counter_config, tmp_path / "log.jsonocel")
+    with contextlib.redirect_stdout(io.StringIO()):
+        trace = generate_ocel_trace(counter_config, trace_index)
+    prefix = f"{trace.trace_id}/"
+
+    events = {eid: event for eid, event in log["ocel:events"].items() if eid.startswith(prefix)}
+    objects = {oid: obj for oid, obj in log["ocel:objects"].items()
+               if oid == trace.trace_id or oid.startswith(prefix)}  # the case object is named after the trace
+    assert events and objects
+    assert json.loads(json.dumps(dict(trace.events))) == events
+    assert json.loads(json.dumps(dict(trace.objects))) == objects
+
+
+def test_counter_mode_log_is_the_same_with_and_without_jobs(counter_config, tmp_path):
+    sequential = _counter_log(counter_config, tmp_path / "sequential.jsonocel")
+    assert _counter_log(counter_config, tmp_path / "jobs2.jsonocel", jobs=2) == sequential
+
+
+@pytest.mark.parametrize("parameterization", ["legacy", "min_mode_max"])
+def test_hashed_attribute_counts_follow_the_sampled_distribution(parameterization):
+    params = {"object_attributes_min": 1, "object_attributes_mode": 3, "object_attributes_max": 6,
+              "triangular_parameterization": parameterization}
+    engine = AttributeEngine("object", params)
+    sampler = make_sampler(params, 7)
+    sampled = Counter(len(engine.draw(sampler)) for _ in range(20000))
+    hashed = Counter(len(engine.draw(HashSampler(key * 0x9E3779B1, engine.quantile))) for key in range(20000))
+    assert set(hashed) == set(sampled)
+    for n, count in sampled.items():
+        assert hashed[n] / 20000 == pytest.approx(count / 20000, abs=0.02)
@@ -0,0 +1,12 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ocelgen.timestamps import format_timestamps
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def test_format_timestamps_matches_isoformat():
+    times = np.array([0, 1, 999_999, 1_000_000, 1_735_689_600_000_000, 1_735_689_600_123_456, -1], dtype=np.int64)
+    assert format_timestamps(times) == [(EPOCH + timedelta(microseconds=int(t))).isoformat() for t in times]
@@ -0,0 +1,51 @@
+import contextlib
+import copy
+import io
+import json
+import os
+
+import pytest
+
+from ocelgen import tree_cache
+from ocelgen.plan import compile_plan
+from ocelgen.xes_generator import generate_xes_log
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def config():
+    with open(os.path.join(REPO_DIR, "config.json"), encoding="utf-8") as f:
+        config = json.load(f)
+    config["process_tree_params"]["num_traces"] = 20
+    config["process_tree_params"]["playout_engine"] = "pm4py"
+    tree_cache._caches.clear()
+    yield config
+    tree_cache._caches.clear()
+
+
+def _activities(config):
+    with contextlib.redirect_stdout(io.StringIO()):
+        log, _ = generate_xes_log(config)
+    return [[event["concept:name"] for event in trace] for trace in log]
+
+
+def test_plan_then_generate_matches_fresh_run(config):
+    expected = _activities(dict(config, tree_cache_size=0))
+    with contextlib.redirect_stdout(io.StringIO()):
+        compile_plan(copy.deepcopy(config), pilot_traces=0)
+    assert _activities(config) == expected
+
+
+def test_cached_sequential_run_matches_fresh_run(config):
+    expected = _activities(dict(config, tree_cache_size=0))
+    assert _activities(config) == expected  # miss
+    assert _activities(config) == expected  # hit
+
+
+def test_plan_config_is_read_only_and_detached(config):
+    with contextlib.redirect_stdout(io.StringIO()):
+        plan = compile_plan(config, pilot_traces=0)
+    with pytest.raises(TypeError):
+        plan.config["process_tree_params"]["num_traces"] = 1
+    assert plan.config["process_tree_params"]["num_traces"] == config["process_tree_params"]["num_traces"] == 20